@@ -0,0 +1,78 @@
+"""Compare the throughput of `validate_many` against a per-row validator loop.
+
+Each is run a few times and the best run is reported. Run with `python benchmarks/batch.py`.
+"""
+
+import time
+from typing import Callable, Dict, List
+
+from outcome.peewee_validates.peewee_validates import (
+    BooleanField,
+    DecimalField,
+    FloatField,
+    IntegerField,
+    StringField,
+    Validator,
+    validate_email,
+)
+
+row_count = 100000
+repeat = 5
+
+
+class RowValidator(Validator):
+    name = StringField[None](required=True, max_length=40)
+    email = StringField[None](required=True, validators=[validate_email()])
+    age = IntegerField[None](low=0, high=150)
+    score = FloatField[None]()
+    balance = DecimalField[None]()
+    active = BooleanField[None]()
+
+
+def make_rows(count: int) -> List[Dict[str, object]]:
+    return [
+        {
+            'name': f'user {i}',
+            'email': f'user{i}@example.com',
+            'age': str(i % 200),
+            'score': '1.5',
+            'balance': '10.25',
+            'active': 'true',
+        }
+        for i in range(count)
+    ]
+
+
+def per_row(rows: List[Dict[str, object]]) -> int:
+    valid = 0
+    for row in rows:
+        validator = RowValidator()
+        if validator.validate(row):
+            valid += 1
+    return valid
+
+
+def many(rows: List[Dict[str, object]]) -> int:
+    return sum(1 for ok, _, _ in RowValidator().validate_many(rows) if ok)
+
+
+def measure(label: str, fn: Callable[[List[Dict[str, object]]], int], rows: List[Dict[str, object]]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - start)
+    elapsed = min(timings)
+    print(f'{label:>15}: {len(rows) / elapsed:>10.0f} rows/sec')  # noqa: WPS421
+    return elapsed
+
+
+def main():
+    rows = make_rows(row_count)
+    loop = measure('per-row loop', per_row, rows)
+    batch = measure('validate_many', many, rows)
+    print(f'speedup: {loop / batch:.2f}x')  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
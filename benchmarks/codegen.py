@@ -0,0 +1,65 @@
+"""Compare the interpreted and the generated validation of a wide validator.
+
+Run with `python benchmarks/codegen.py`.
+"""
+
+import time
+from typing import Dict, List
+
+from outcome.peewee_validates.peewee_validates import (
+    BooleanField,
+    FloatField,
+    IntegerField,
+    StringField,
+    Validator,
+    validate_one_of,
+)
+
+field_groups = 10
+row_count = 20000
+
+
+def make_validator(compiled: bool) -> type:
+    namespace: Dict[str, object] = {}
+    for i in range(field_groups):
+        namespace[f'name_{i}'] = StringField[None](required=True, max_length=20)
+        namespace[f'code_{i}'] = StringField[None](validators=[validate_one_of(('a', 'b', 'c'))])
+        namespace[f'count_{i}'] = IntegerField[None](low=0, high=1000)
+        namespace[f'ratio_{i}'] = FloatField[None](high=1)
+        namespace[f'flag_{i}'] = BooleanField[None]()
+
+    class Meta(Validator.Meta):
+        compile_fields = compiled
+
+    namespace['Meta'] = Meta
+    return type('WideValidator', (Validator,), namespace)
+
+
+def make_rows() -> List[Dict[str, object]]:
+    row: Dict[str, object] = {}
+    for i in range(field_groups):
+        row.update({f'name_{i}': 'name', f'code_{i}': 'b', f'count_{i}': '12', f'ratio_{i}': '0.5', f'flag_{i}': 'true'})
+    return [row] * row_count
+
+
+def measure(label: str, validator: Validator, rows: List[Dict[str, object]]) -> float:
+    start = time.perf_counter()
+    for _ in validator.validate_many(rows):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f'{label:>12}: {row_count / elapsed:>8.0f} rows/sec')  # noqa: WPS421
+    return elapsed
+
+
+def main():
+    rows = make_rows()
+    fields = len(make_validator(False).get_options().fields)
+    print(f'{fields} fields, {row_count} rows')  # noqa: WPS421
+
+    interpreted = measure('interpreted', make_validator(False)(), rows)
+    compiled = measure('compiled', make_validator(True)(), rows)
+    print(f'speedup: {interpreted / compiled:.1f}x')  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare the row by row and the columnar validation of numeric, length and choice constraints.
+
+Run with `python benchmarks/columnar.py`.
+"""
+
+import time
+
+import numpy as np
+
+from outcome.peewee_validates.columnar import validate_columns
+from outcome.peewee_validates.peewee_validates import FloatField, IntegerField, StringField, Validator, validate_one_of
+
+row_count = 200000
+
+
+class ImportValidator(Validator):
+    name = StringField[None](required=True, max_length=20)
+    code = StringField[None](validators=[validate_one_of(('a', 'b', 'c'))])
+    count = IntegerField[None](low=0, high=1000)
+    ratio = FloatField[None](high=1)
+
+
+def make_columns():
+    rng = np.random.default_rng(0)
+    return {
+        'name': np.array([f'name-{i}' for i in range(row_count)]),
+        'code': rng.choice(np.array(['a', 'b', 'c', 'd']), row_count),
+        'count': rng.integers(-10, 1100, row_count),
+        'ratio': rng.random(row_count) * 1.1,
+    }
+
+
+def run_rows(columns) -> int:
+    lists = {name: column.tolist() for name, column in columns.items()}
+    invalid = 0
+    for row in range(row_count):
+        validator = ImportValidator()
+        if not validator.validate({name: column[row] for name, column in lists.items()}):
+            invalid += 1
+    return invalid
+
+
+def run_columns(columns) -> int:
+    return int(validate_columns(ImportValidator(), columns).invalid.sum())
+
+
+def main():
+    columns = make_columns()
+    for label, fn in (('rows', run_rows), ('columns', run_columns)):
+        start = time.perf_counter()
+        invalid = fn(columns)
+        elapsed = time.perf_counter() - start
+        print(f'{label:>8}: {elapsed:.3f}s ({row_count / elapsed:,.0f} rows/s), {invalid} invalid rows')
+
+
+if __name__ == '__main__':
+    main()
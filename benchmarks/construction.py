@@ -0,0 +1,50 @@
+"""Measure the cost of constructing validators.
+
+Covers declarative validators with a growing number of class attributes, and
+model validators for a wide model.
+
+Run with `python benchmarks/construction.py`.
+"""
+
+import timeit
+from typing import Dict
+
+import peewee
+
+from outcome.peewee_validates.peewee_validates import ModelValidator, StringField, Validator
+
+attribute_counts = (10, 100, 1000)
+iterations = 10000
+model_columns = 40
+
+
+def make_validator(attributes: int) -> type:
+    namespace: Dict[str, object] = {}
+    for i in range(attributes):
+        namespace[f'attr_{i}'] = i
+    for i in range(10):
+        namespace[f'field_{i}'] = StringField[None](required=True)
+    return type(f'Validator{attributes}', (Validator,), namespace)
+
+
+def make_model(columns: int) -> type:
+    namespace: Dict[str, object] = {}
+    for i in range(columns):
+        namespace[f'column_{i}'] = peewee.CharField(max_length=20, null=bool(i % 2), unique=i == 0)
+    return type(f'Model{columns}', (peewee.Model,), namespace)
+
+
+def main():
+    print(f'{"attributes":>10} {"usec/construction":>18}')  # noqa: WPS421
+    for attributes in attribute_counts:
+        validator_class = make_validator(attributes)
+        elapsed = timeit.timeit(validator_class, number=iterations)
+        print(f'{attributes:>10} {elapsed / iterations * 1e6:>18.2f}')  # noqa: WPS421
+
+    model = make_model(model_columns)
+    elapsed = timeit.timeit(lambda: ModelValidator(model()), number=iterations)
+    print(f'ModelValidator, {model_columns} columns: {elapsed / iterations * 1e6:.2f} usec/construction')  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
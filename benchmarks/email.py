@@ -0,0 +1,92 @@
+"""Compare the email validator with the previous implementation.
+
+The previous implementation compiled its patterns for each validator and matched the domain
+of every value. Run with `python benchmarks/email.py`.
+"""
+
+import random
+import re
+import time
+from typing import Callable, List
+
+from outcome.peewee_validates.peewee_validates import StringField, ValidationError, is_valid_email_domain, validate_email
+
+value_count = 200000
+domain_count = 3000
+
+
+def legacy_validate_email() -> Callable[..., None]:  # noqa: WPS231
+    user_regex = re.compile(
+        r"(^[-!#$%&'*+/=?^`{}|~\w]+(\.[-!#$%&'*+/=?^`{}|~\w]+)*$"  # noqa: P103
+        + r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]'  # noqa: P103
+        + r'|\\[\001-\011\013\014\016-\177])*"$)',  # noqa: WPS326
+        re.IGNORECASE | re.UNICODE,
+    )
+    domain_regex = re.compile(
+        r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
+        '(?:[A-Z]{2,6}|[A-Z0-9-]{2,})$'  # noqa: WPS326
+        r'|^\[(25[0-5]|2[0-4]\d|[0-1]?\d?\d)'  # noqa: WPS326
+        r'(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$',  # noqa: WPS326
+        re.IGNORECASE | re.UNICODE,
+    )
+
+    def email_validator(field, data, ctx=None):
+        value = str(field.value)
+        if '@' not in value:
+            raise ValidationError('email')
+        user_part, domain_part = value.rsplit('@', 1)
+        if not user_regex.match(user_part):
+            raise ValidationError('email')
+        if domain_part != 'localhost' and not domain_regex.match(domain_part):
+            raise ValidationError('email')
+
+    return email_validator
+
+
+def make_corpus() -> List[str]:
+    rng = random.Random(0)
+    domains = [f'mail{i}.{rng.choice(("com", "org", "co.uk", "example.net"))}' for i in range(domain_count)]
+    # A few domains get most of the traffic
+    weights = [1 / (rank + 1) for rank in range(domain_count)]
+    users = ['john.doe', 'jane', 'info', 'first.last+tag', 'sales-team']
+    corpus = [f'{rng.choice(users)}{i % 97}@{domain}' for i, domain in enumerate(rng.choices(domains, weights, k=value_count))]
+    return [value if i % 40 else value.replace('@', '@-') for i, value in enumerate(corpus)]
+
+
+def run(factory: Callable[[], Callable[..., None]], corpus: List[str]) -> int:
+    validator = factory()
+    field = StringField[None]()
+    invalid = 0
+    for value in corpus:
+        field.value = value
+        try:
+            validator(field, {})
+        except ValidationError:
+            invalid += 1
+    return invalid
+
+
+def time_factory(factory: Callable[[], Callable[..., None]]) -> float:
+    start = time.perf_counter()
+    for _ in range(1000):
+        re.purge()
+        factory()
+    return (time.perf_counter() - start) / 1000
+
+
+def main():
+    corpus = make_corpus()
+    for label, factory in (('before', legacy_validate_email), ('after', validate_email)):
+        is_valid_email_domain.cache_clear()
+        start = time.perf_counter()
+        invalid = run(factory, corpus)
+        elapsed = time.perf_counter() - start
+        print(
+            f'{label:>6}: {elapsed / value_count * 1e9:.0f} ns/value, '
+            f'{time_factory(factory) * 1e6:.1f} us/validator, {invalid} invalid values',
+        )
+    print(is_valid_email_domain.cache_info())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Compare COUNT(*) and EXISTS probes for the uniqueness checks on a large SQLite database.
+
+Run with `python benchmarks/exists.py [row_count]`, the database is created in a temporary directory.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import peewee
+
+from outcome.peewee_validates.peewee_validates import ModelValidator
+
+default_row_count = 1000000
+batch_size = 10000
+iterations = 20
+
+database = peewee.SqliteDatabase(None)
+
+
+class Record(peewee.Model):
+    code = peewee.CharField(unique=True)
+    category = peewee.CharField()
+    region = peewee.CharField()
+
+    class Meta:
+        database = database  # noqa: WPS434
+
+
+def populate(row_count: int):
+    database.create_tables([Record])
+    with database.atomic():
+        for start in range(0, row_count, batch_size):
+            rows = [(f'code-{i}', f'category-{i % 10}', 'region') for i in range(start, min(start + batch_size, row_count))]
+            Record.insert_many(rows, fields=[Record.code, Record.category, Record.region]).execute()
+
+
+def measure(label: str, fn: Callable[[], object]):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f'{label:>40}: {elapsed / iterations * 1e3:>8.3f} ms')  # noqa: WPS421
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else default_row_count
+
+    with tempfile.TemporaryDirectory() as directory:
+        database.init(os.path.join(directory, 'exists.db'))
+        populate(row_count)
+
+        unique_query = Record.select().where(Record.code == 'code-1')
+        # Not covered by an index, so COUNT(*) has to scan every row while EXISTS stops at the first match
+        scan_query = Record.select().where(Record.category == 'category-1')
+
+        measure('unique field, COUNT(*)', unique_query.count)
+        measure('unique field, EXISTS', unique_query.exists)
+        measure('non-indexed column, COUNT(*)', scan_query.count)
+        measure('non-indexed column, EXISTS', scan_query.exists)
+
+        validator = ModelValidator(Record())
+        data = {'code': 'code-1', 'category': 'category-1', 'region': 'region'}
+        measure('ModelValidator.validate', lambda: validator.validate(data))
+
+        database.close()
+
+
+if __name__ == '__main__':
+    main()
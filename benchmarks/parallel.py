@@ -0,0 +1,66 @@
+"""Measure how the process pool validation scales with the number of workers.
+
+Run with `python benchmarks/parallel.py`.
+"""
+
+import os
+import time
+from typing import Dict, List
+
+from outcome.peewee_validates.peewee_validates import (
+    DateTimeField,
+    DecimalField,
+    StringField,
+    Validator,
+    validate_email,
+    validate_regexp,
+)
+
+row_count = 20000
+chunk_size = 1000
+
+
+class FeedValidator(Validator):
+    created = DateTimeField[None](required=True)
+    updated = DateTimeField[None]()
+    price = DecimalField[None](low=0, high=10000)
+    tax = DecimalField[None](low=0)
+    email = StringField[None](validators=[validate_email()])
+    reference = StringField[None](validators=[validate_regexp(r'^[A-Z]{3}-\d{4,}$')])
+
+
+def make_rows() -> List[Dict[str, object]]:
+    return [
+        {
+            'created': f'March {i % 28 + 1}, 2021 10:{i % 60:02d} PM',
+            'updated': f'2021/04/{i % 28 + 1:02d} 08:15',
+            'price': f'{i % 12000}.25',
+            'tax': f'{i % 100}.5',
+            'email': f'user{i}@example{i % 10}.com' if i % 50 else 'invalid',
+            'reference': f'ABC-{i:04d}',
+        }
+        for i in range(row_count)
+    ]
+
+
+def main():
+    rows = make_rows()
+
+    start = time.perf_counter()
+    baseline = sum(1 for ok, _, _ in FeedValidator().validate_many(rows, chunk_size=chunk_size) if not ok)
+    reference = time.perf_counter() - start
+    print(f'validate_many: {reference:.2f}s ({row_count / reference:,.0f} rows/s), {baseline} invalid rows')
+
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        results = FeedValidator().validate_parallel(rows, workers=workers, chunk_size=chunk_size)
+        invalid = sum(1 for ok, _, _ in results if not ok)
+        elapsed = time.perf_counter() - start
+        print(
+            f'{workers} workers: {elapsed:.2f}s ({row_count / elapsed:,.0f} rows/s), '
+            f'x{reference / elapsed:.2f}, {invalid} invalid rows (on {os.cpu_count()} CPUs)',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Compare `save_many` against saving each model validator, with many-to-many values.
+
+Both run in a single transaction on a SQLite file, so the difference is the number of statements.
+
+Run with `python benchmarks/save_many.py [row_count]`, the database is created in a temporary directory.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, List
+
+import peewee
+
+from outcome.peewee_validates.peewee_validates import ModelValidator, save_many
+
+default_row_count = 5000
+tag_count = 20
+
+database = peewee.SqliteDatabase(None)
+
+
+class BaseModel(peewee.Model):
+    class Meta:
+        database = database  # noqa: WPS434
+
+
+class Tag(BaseModel):
+    name = peewee.CharField()
+
+
+class Article(BaseModel):
+    title = peewee.CharField(max_length=40)
+    body = peewee.TextField()
+    views = peewee.IntegerField(default=0)
+    tags = peewee.ManyToManyField(Tag)
+
+
+ArticleTags: Any = Article.tags.get_through_model()
+
+
+def make_validators(count: int, articles: List[Any]) -> List[ModelValidator[Any]]:
+    validators = []
+    for i in range(count):
+        validator = ModelValidator(articles[i] if articles else Article())
+        row = {'title': f'article {i}', 'body': 'body', 'views': i, 'tags': [i % tag_count + 1, (i + 1) % tag_count + 1]}
+        assert validator.validate(row)
+        validators.append(validator)
+    return validators
+
+
+def per_instance(validators: List[ModelValidator[Any]]):
+    with database.atomic():
+        for validator in validators:
+            validator.save()
+
+
+def bulk(validators: List[ModelValidator[Any]]):
+    save_many(validators)
+
+
+def measure(label: str, fn: Callable[[List[ModelValidator[Any]]], None], count: int, update: bool):
+    # The rows are inserted a first time when measuring the updates.
+    articles = list(Article.select()) if update else []
+    validators = make_validators(count, articles)
+
+    start = time.perf_counter()
+    fn(validators)
+    elapsed = time.perf_counter() - start
+    print(f'{label:>25}: {count / elapsed:>10.0f} rows/sec')  # noqa: WPS421
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else default_row_count
+
+    with tempfile.TemporaryDirectory() as directory:
+        database.init(os.path.join(directory, 'save_many.db'))
+        database.create_tables([Tag, Article, ArticleTags])
+        Tag.insert_many([(f'tag-{i}',) for i in range(tag_count)], fields=[Tag.name]).execute()
+
+        for label, fn in (('per-instance save', per_instance), ('save_many', bulk)):
+            Article.delete().execute()
+            ArticleTags.delete().execute()
+            measure(f'{label}, insert', fn, count, update=False)
+            measure(f'{label}, update', fn, count, update=True)
+
+        database.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Check that the memory used to validate a JSON Lines feed doesn't grow with its size.
+
+Run with `python benchmarks/streaming.py`.
+"""
+
+import time
+import tracemalloc
+from typing import Iterator
+
+from outcome.peewee_validates.peewee_validates import FloatField, IntegerField, StringField, Validator
+from outcome.peewee_validates.streaming import validate_jsonl
+
+
+class FeedValidator(Validator):
+    name = StringField[None](required=True, max_length=20)
+    count = IntegerField[None](low=0, high=1000)
+    ratio = FloatField[None](high=1)
+
+
+def lines(row_count: int) -> Iterator[str]:
+    for i in range(row_count):
+        yield f'{{"name": "name-{i}", "count": {i % 1100}, "ratio": 0.5}}\n'
+
+
+def main():
+    for row_count in (10000, 50000, 200000):
+        tracemalloc.start()
+        start = time.perf_counter()
+        invalid = sum(1 for _, ok, _ in validate_jsonl(FeedValidator(), lines(row_count)) if not ok)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{row_count:>8} rows: {elapsed:.2f}s, peak {peak / 1024:.0f} KiB, {invalid} invalid rows')
+
+
+if __name__ == '__main__':
+    main()
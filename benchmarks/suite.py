@@ -0,0 +1,367 @@
+"""Run the benchmark suite and write the results as JSON.
+
+Measures the construction, the validation and the save of flat validators, of a wide model
+validator, of the related object lookups (`ModelChoiceField` and `ManyModelChoiceField`) and
+of the unique field and unique index checks, against a SQLite file holding `size` rows.
+
+Run with `python benchmarks/suite.py [--sizes 1000,100000,1000000] [--output results.json]`,
+the databases are created in a temporary directory unless `--directory` is given, in which case
+they are kept and reused by the next runs. Compare two runs with `--compare previous.json`.
+
+The other scripts of this directory each focus on a single optimization, this one is the
+reference for comparing releases.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import peewee
+
+from outcome.peewee_validates.peewee_validates import (
+    BooleanField,
+    DecimalField,
+    IntegerField,
+    ManyModelChoiceField,
+    ModelChoiceField,
+    ModelValidator,
+    StringField,
+    Validator,
+    save_many,
+    validate_email,
+)
+
+default_sizes = (1000, 100000)
+default_rows = 1000
+default_repeat = 5
+# SQLite limits the number of variables of a statement, a member row has 43 of them.
+batch_size = 500
+wide_columns = 40
+organization_count = 1000
+tag_count = 100
+
+database = peewee.SqliteDatabase(None)
+
+
+class BaseModel(peewee.Model):
+    class Meta:
+        database = database  # noqa: WPS434
+
+
+class Organization(BaseModel):
+    name = peewee.CharField(unique=True)
+
+
+class Tag(BaseModel):
+    name = peewee.CharField(unique=True)
+
+
+def make_member_model() -> type:
+    namespace: Dict[str, object] = {
+        '__module__': __name__,
+        'code': peewee.CharField(unique=True),
+        'handle': peewee.CharField(max_length=40),
+        'organization': peewee.ForeignKeyField(Organization),
+        'tags': peewee.ManyToManyField(Tag),
+        'Meta': type('Meta', (), {'indexes': ((('organization', 'handle'), True),)}),
+    }
+    for i in range(wide_columns):
+        namespace[f'column_{i}'] = peewee.CharField(max_length=20, null=bool(i % 2))
+    return type('Member', (BaseModel,), namespace)
+
+
+Member: Any = make_member_model()
+MemberTags: Any = Member.tags.get_through_model()
+
+
+class FlatValidator(Validator):
+    name = StringField[None](required=True, max_length=40)
+    email = StringField[None](required=True, validators=[validate_email()])
+    age = IntegerField[None](low=0, high=150)
+    balance = DecimalField[None]()
+    active = BooleanField[None]()
+
+
+class OrganizationValidator(Validator):
+    organization = ModelChoiceField[None](Organization.select(), Organization.name, required=True)
+
+
+class WideValidator(ModelValidator[Any]):
+    class Meta:
+        only = [f'column_{i}' for i in range(wide_columns)]
+
+
+class UniqueValidator(ModelValidator[Any]):
+    class Meta:
+        only = ['code', 'handle', 'organization']
+
+
+class IncrementalValidator(ModelValidator[Any]):
+    class Meta:
+        incremental = True
+
+
+class RelatedValidator(Validator):
+    organization = ModelChoiceField[None](Organization.select(), Organization.name, required=True)
+    tags = ManyModelChoiceField[None](Tag.select(), Tag.name)
+
+
+# A validated case: its name, the number of operations of a run, and the run.
+Case = Tuple[str, int, Callable[[], object]]
+
+
+def populate(size: int):
+    database.create_tables([Organization, Tag, Member, MemberTags])
+    if Member.select().exists():
+        return
+
+    columns = [Member.code, Member.handle, Member.organization] + [getattr(Member, f'column_{i}') for i in range(wide_columns)]
+    with database.atomic():
+        Organization.insert_many([(f'org-{i}',) for i in range(organization_count)], fields=[Organization.name]).execute()
+        Tag.insert_many([(f'tag-{i}',) for i in range(tag_count)], fields=[Tag.name]).execute()
+        for start in range(0, size, batch_size):
+            rows = [
+                (f'code-{i}', f'handle-{i}', i % organization_count + 1) + tuple(f'value-{i}' for _ in range(wide_columns))
+                for i in range(start, min(start + batch_size, size))
+            ]
+            Member.insert_many(rows, fields=columns).execute()
+
+
+def flat_rows(count: int) -> List[Dict[str, object]]:
+    return [
+        {'name': f'user {i}', 'email': f'user{i}@example.com', 'age': str(i % 200), 'balance': '10.25', 'active': 'true'}
+        for i in range(count)
+    ]
+
+
+def related_rows(count: int) -> List[Dict[str, object]]:
+    return [
+        {'organization': f'org-{i % organization_count}', 'tags': [f'tag-{i % tag_count}', f'tag-{(i + 1) % tag_count}']}
+        for i in range(count)
+    ]
+
+
+def member_rows(count: int, size: int) -> List[Dict[str, object]]:
+    rows = []
+    for i in range(count):
+        # Half of the rows collide with an existing member, through the unique field or the unique index.
+        existing = (i * 7919) % size
+        code = f'code-{existing}' if i % 4 == 0 else f'new-{i}'
+        handle = f'handle-{existing}' if i % 4 == 1 else f'new-{i}'
+        row: Dict[str, object] = {
+            'code': code,
+            'handle': handle,
+            'organization': existing % organization_count + 1,
+            'tags': [i % tag_count + 1],
+        }
+        row.update({f'column_{c}': f'value-{i}' for c in range(wide_columns)})
+        rows.append(row)
+    return rows
+
+
+def validate_each(make_validator: Callable[[], Any], rows: Sequence[Dict[str, object]]) -> Callable[[], object]:
+    def run() -> int:
+        return sum(1 for row in rows if make_validator().validate(row))
+
+    return run
+
+
+def validate_reused(validator: Any, rows: Sequence[Dict[str, object]]) -> Callable[[], object]:
+    def run() -> int:
+        return sum(1 for row in rows if validator.validate(row))
+
+    return run
+
+
+def validate_many(validator: Any, rows: Sequence[Dict[str, object]], **kwargs: object) -> Callable[[], object]:
+    def run() -> int:
+        return sum(1 for ok, _, _ in validator.validate_many(rows, **kwargs) if ok)
+
+    return run
+
+
+def save_each(rows: Sequence[Dict[str, object]]) -> Callable[[], object]:
+    def run() -> int:
+        saved = 0
+        with database.atomic() as transaction:
+            for row in rows:
+                validator = ModelValidator(Member())
+                if validator.validate(row):
+                    saved += validator.save()
+            transaction.rollback()
+        return saved
+
+    return run
+
+
+def save_bulk(rows: Sequence[Dict[str, object]]) -> Callable[[], object]:
+    def run() -> int:
+        validators = []
+        for row in rows:
+            validator = ModelValidator(Member())
+            if validator.validate(row):
+                validators.append(validator)
+        with database.atomic() as transaction:
+            saved = save_many(validators)
+            transaction.rollback()
+        return saved
+
+    return run
+
+
+def revalidate(rows: Sequence[Dict[str, object]]) -> Callable[[], object]:
+    # An edit form, where a single field outside of the unique indexes changes between two validations.
+    base = next(row for row in rows if str(row['code']).startswith('new-') and str(row['handle']).startswith('new-'))
+
+    def run() -> int:
+        validator = IncrementalValidator(Member())
+        valid = 0
+        for row in rows:
+            valid += validator.validate({**base, 'column_0': row['column_0']})
+        return valid
+
+    return run
+
+
+def cases(size: int, count: int) -> Iterator[Case]:
+    flat, related, members = flat_rows(count), related_rows(count), member_rows(count, size)
+    wide = [{key: value for key, value in row.items() if key.startswith('column_')} for row in members]
+    wide_only = [f'column_{i}' for i in range(wide_columns)]
+    unique_only = ['code', 'handle', 'organization']
+    valid_members = [row for row in members if str(row['code']).startswith('new-') and str(row['handle']).startswith('new-')]
+
+    yield 'construction.flat', count, lambda: [FlatValidator() for _ in range(count)]
+    yield 'construction.wide_model', count, lambda: [ModelValidator(Member()) for _ in range(count)]
+
+    yield 'validate.flat', count, validate_each(FlatValidator, flat)
+    yield 'validate.flat_reused', count, validate_reused(FlatValidator(), flat)
+    yield 'validate_many.flat', count, validate_many(FlatValidator(), flat)
+
+    yield 'validate.wide_model', count, validate_each(lambda: WideValidator(Member()), wide)
+    yield 'validate_many.wide_model', count, validate_many(ModelValidator(Member()), wide, only=wide_only)
+
+    yield 'validate.foreign_key', count, validate_each(OrganizationValidator, related)
+    yield 'validate_many.foreign_key', count, validate_many(OrganizationValidator(), related)
+    yield 'validate.many_to_many', count, validate_each(RelatedValidator, related)
+    yield 'validate_many.many_to_many', count, validate_many(RelatedValidator(), related)
+
+    yield 'validate.unique', count, validate_each(lambda: UniqueValidator(Member()), members)
+    yield 'validate_many.unique', count, validate_many(ModelValidator(Member()), members, only=unique_only)
+    yield 'revalidate.wide_model', count, revalidate(members)
+
+    yield 'save.wide_model', len(valid_members), save_each(valid_members)
+    yield 'save_many.wide_model', len(valid_members), save_bulk(valid_members)
+
+
+def measure(fn: Callable[[], object], operations: int, repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) / max(operations, 1))
+    return {
+        'best_usec': min(timings) * 1e6,
+        'median_usec': statistics.median(timings) * 1e6,
+        'ops_per_sec': 1 / min(timings) if min(timings) else 0,
+    }
+
+
+def run_size(size: int, directory: str, count: int, repeat: int, selected: Optional[Sequence[str]]) -> List[Dict[str, object]]:
+    database.init(os.path.join(directory, f'suite-{size}.db'))
+    start = time.perf_counter()
+    populate(size)
+    print(f'size {size}: database ready in {time.perf_counter() - start:.1f} s')  # noqa: WPS421
+
+    results: List[Dict[str, object]] = []
+    try:
+        for name, operations, fn in cases(size, count):
+            if selected and not any(name.startswith(prefix) for prefix in selected):
+                continue
+            result: Dict[str, object] = {'case': name, 'size': size, 'operations': operations}
+            result.update(measure(fn, operations, repeat))
+            results.append(result)
+            print(f'{name:>30} {size:>9}: {result["best_usec"]:>10.2f} usec/op')  # noqa: WPS421
+    finally:
+        database.close()
+    return results
+
+
+def environment() -> Dict[str, object]:
+    try:
+        from importlib.metadata import version  # noqa: WPS433
+
+        package_version: Optional[str] = version('outcome-peewee-validates')
+    except Exception:  # noqa: B902
+        package_version = None
+
+    return {
+        'package': package_version,
+        'python': platform.python_version(),
+        'peewee': peewee.__version__,
+        'sqlite': peewee.sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def load_results(path: str) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    with open(path) as previous:
+        return {(result['case'], result['size']): result for result in json.load(previous)['results']}
+
+
+def compare(results: List[Dict[str, Any]], previous: Dict[Tuple[str, int], Dict[str, Any]]):
+    print(f'\n{"case":>30} {"size":>9} {"before":>10} {"after":>10} {"ratio":>7}')  # noqa: WPS421
+    for result in results:
+        before = previous.get((result['case'], result['size']))
+        if before is None:
+            continue
+        ratio = before['best_usec'] / result['best_usec'] if result['best_usec'] else 0
+        print(  # noqa: WPS421
+            f'{result["case"]:>30} {result["size"]:>9} {before["best_usec"]:>10.2f} {result["best_usec"]:>10.2f} {ratio:>6.2f}x',
+        )
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, default_sizes)), help='comma separated row counts of the database')
+    parser.add_argument('--rows', type=int, default=default_rows, help='rows validated per run')
+    parser.add_argument('--repeat', type=int, default=default_repeat, help='runs per case, the best is reported')
+    parser.add_argument('--cases', default='', help='comma separated prefixes of the cases to run')
+    parser.add_argument('--directory', help='keep the databases in this directory')
+    parser.add_argument('--output', default='benchmark-results.json', help='where the JSON results are written')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    selected = [prefix for prefix in args.cases.split(',') if prefix]
+    # Read before running, the output can replace the previous results.
+    previous = load_results(args.compare) if args.compare else None
+
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = args.directory or temporary
+        os.makedirs(directory, exist_ok=True)
+        for size in sizes:
+            results.extend(run_size(size, directory, args.rows, args.repeat, selected))
+
+    with open(args.output, 'w') as output:
+        json.dump({'environment': environment(), 'rows': args.rows, 'repeat': args.repeat, 'results': results}, output, indent=2)
+    print(f'results written to {args.output}')  # noqa: WPS421
+
+    if previous is not None:
+        compare(results, previous)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Measure the throughput of a multi-threaded WSGI application validating JSON payloads.
+
+The application is called directly from a thread pool, without a server, so only the
+request handling is measured. The shared validator class is compared with the previous
+workaround of building a new validator class for each request.
+
+Run with `python benchmarks/threads.py`.
+"""
+
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+from wsgiref.util import setup_testing_defaults
+
+from outcome.peewee_validates.peewee_validates import DateField, IntegerField, StringField, Validator, validate_email
+
+request_count = 20000
+thread_counts = (1, 2, 4, 8)
+
+StartResponse = Callable[[str, List[Any]], object]
+
+
+def make_validator_class() -> type:
+    class PayloadValidator(Validator):
+        name = StringField[None](required=True, max_length=40)
+        email = StringField[None](required=True, validators=[validate_email()])
+        age = IntegerField[None](low=1, high=150)
+        birthday = DateField[None]()
+
+    return PayloadValidator
+
+
+SharedValidator = make_validator_class()
+
+
+def make_app(validator_factory: Callable[[], Validator]):
+    def app(environ: Dict[str, Any], start_response: StartResponse) -> Iterable[bytes]:
+        payload = json.loads(environ['wsgi.input'].read())
+        validator = validator_factory()
+        if validator.validate(payload):
+            start_response('204 No Content', [])
+            return []
+        start_response('400 Bad Request', [('Content-Type', 'application/json')])
+        return [json.dumps(validator.errors).encode()]
+
+    return app
+
+
+def make_environ(i: int) -> Dict[str, Any]:
+    body = json.dumps({'name': f'user {i}', 'email': f'user{i}@example.com', 'age': i % 200, 'birthday': '2000-01-01'}).encode()
+    environ: Dict[str, Any] = {'REQUEST_METHOD': 'POST', 'CONTENT_LENGTH': str(len(body)), 'wsgi.input': io.BytesIO(body)}
+    setup_testing_defaults(environ)
+    return environ
+
+
+def measure(label: str, app: Callable[..., Iterable[bytes]], threads: int):
+    environs = [make_environ(i) for i in range(request_count)]
+
+    def handle(environ: Dict[str, Any]):
+        return b''.join(app(environ, lambda status, headers: None))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(handle, environs, chunksize=100):
+            pass
+    elapsed = time.perf_counter() - start
+    print(f'{label:>28}, {threads} threads: {request_count / elapsed:>8.0f} requests/sec')  # noqa: WPS421
+
+
+def main():
+    shared_app = make_app(SharedValidator)
+    rebuilt_app = make_app(lambda: make_validator_class()())
+
+    for threads in thread_counts:
+        measure('shared validator class', shared_app, threads)
+        measure('class rebuilt per request', rebuilt_app, threads)
+
+
+if __name__ == '__main__':
+    main()
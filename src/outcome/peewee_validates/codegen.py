@@ -0,0 +1,304 @@
+"""Generate a specialized function validating the fields of a validator.
+
+The generated function does the same work as calling `Field.validate` for each field,
+with the coercions and the built-in validators inlined. Anything it doesn't know how
+to inline (custom fields, custom validators, database checks) is called as usual, so
+the data and the errors are always the same as the interpreted path.
+"""
+from __future__ import annotations
+
+import linecache
+from decimal import Decimal, InvalidOperation
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Sized, Tuple, cast
+
+from outcome.peewee_validates.peewee_validates import (
+    BooleanField,
+    BoundField,
+    Choices,
+    DecimalField,
+    Field,
+    FieldList,
+    FloatField,
+    IntegerField,
+    StringField,
+    ValidationError,
+)
+
+AddError = Callable[[str, ValidationError], None]
+CompiledFields = Callable[[Dict[str, object], AddError, Any, Any], None]
+
+_counter = count()
+
+_indent = '    '
+
+
+def validator_factory(fn: object) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Find the built-in factory that created a validator, and its arguments.
+
+    Args:
+        fn (object): The validator.
+
+    Returns:
+        Optional[Tuple[str, Dict[str, Any]]]: The name of the factory and the variables of the closure,
+            or None if `fn` wasn't created by a factory of the validators module.
+    """
+    code = getattr(fn, '__code__', None)
+    if code is None or getattr(fn, '__module__', None) != Field.__module__:
+        return None
+    cells = getattr(fn, '__closure__', None) or ()
+    variables = {name: cell.cell_contents for name, cell in zip(code.co_freevars, cells)}
+    return getattr(fn, '__qualname__', '').split('.')[0], variables
+
+
+class FieldsCompiler:
+    def __init__(self):
+        self.lines: List[str] = []
+        # The type of `v` in the code being generated, if it's known.
+        self.value_type: Optional[type] = None
+        self.namespace: Dict[str, object] = {
+            'ValidationError': ValidationError,
+            'BoundField': BoundField,
+            'Decimal': Decimal,
+            'InvalidOperation': InvalidOperation,
+            'Sized': Sized,
+        }
+
+    def const(self, value: object) -> str:
+        name = f'_c{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def emit(self, depth: int, line: str):
+        self.lines.append(f'{_indent * depth}{line}')
+
+    def compile(self, fields: FieldList[Any]) -> CompiledFields:  # noqa: WPS125
+        self.emit(0, 'def validate_fields(result, add_error, data, ctx):')
+        for name, field in fields:
+            self.emit_field(name, field)
+        self.emit(1, 'return None')
+
+        source = '\n'.join(self.lines)
+        filename = f'<peewee_validates.codegen-{next(_counter)}>'
+        # Register the source so the tracebacks show the generated code
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+        exec(compile(source, filename, 'exec'), self.namespace)  # noqa: S102, WPS421
+        fn = self.namespace['validate_fields']
+        fn.__source__ = source  # type: ignore
+        return fn  # type: ignore
+
+    def emit_field(self, name: str, field: Field[Any]):
+        field_type = type(field)
+        key = repr(name)
+
+        self.emit(1, f'# {name}')
+        self.emit(1, 'try:')
+
+        if field_type.validate is not Field.validate or field_type.get_value is not Field.get_value:
+            self.emit(2, f'result[{key}] = {self.const(field)}.validate({key}, data, ctx)')
+        else:
+            self.emit_value(name, field)
+            self.emit_coerce(field)
+            self.emit_validators(name, field)
+            self.emit(2, f'result[{key}] = v')
+
+        self.emit(1, 'except ValidationError as err:')
+        self.emit(2, f'add_error({key}, err)')
+
+    def emit_value(self, name: str, field: Field[Any]):
+        default = field.default
+        if not default:
+            default_expr = 'None'
+        elif callable(default):
+            default_expr = f'{self.const(default)}()'
+        else:
+            default_expr = self.const(default)
+
+        key = repr(name)
+        self.emit(2, f'v = data.get({key}) if {key} in data else {default_expr}')
+
+    def emit_coerce(self, field: Field[Any]):
+        coerce = type(field).coerce
+        self.value_type = None
+        if coerce is Field.coerce:
+            return
+
+        self.emit(2, 'if v is not None:')
+
+        if coerce is StringField.coerce:
+            self.emit(3, 'v = str(v)')
+            self.value_type = str
+        elif coerce is IntegerField.coerce:
+            self.emit_guarded_coerce('v = int(v)', '(TypeError, ValueError)', 'coerce_int')
+        elif coerce is FloatField.coerce:
+            self.emit_guarded_coerce('v = float(v) if v else None', '(TypeError, ValueError)', 'coerce_float')
+        elif coerce is DecimalField.coerce:
+            exceptions = '(TypeError, ValueError, InvalidOperation)'
+            self.emit_guarded_coerce('v = Decimal(v) if v else None', exceptions, 'coerce_decimal')
+        elif coerce is BooleanField.coerce:
+            self.emit(3, f'v = str(v).lower() not in {self.const(cast(BooleanField[Any], field).false_values)}')
+        else:
+            self.emit(3, f'v = {self.const(field.coerce)}(v)')
+
+    def emit_guarded_coerce(self, statement: str, exceptions: str, key: str):
+        self.emit(3, 'try:')
+        self.emit(4, statement)
+        self.emit(3, f'except {exceptions}:')
+        self.emit(4, f'raise ValidationError({key!r})')
+
+    def emit_validators(self, name: str, field: Field[Any]):
+        bound = False
+
+        for validator in field.validators:
+            factory = validator_factory(validator)
+            emitter = inliners.get(factory[0]) if factory is not None else None
+
+            if factory is not None and emitter is not None and emitter(self, factory[1]):
+                continue
+
+            # Call the validator, with the value bound to the field like `Field.validate` does.
+            if bound:
+                self.emit(2, 'b.value = v')
+            else:
+                self.emit(2, f'b = BoundField({self.const(field)}, {name!r}, v)')
+                bound = True
+            self.emit(2, f'{self.const(validator)}(b, data, ctx)')
+            self.emit(2, 'v = b.value')
+            self.value_type = None
+
+    # Each inliner returns False if the validator can't be inlined.
+
+    def inline_required(self, variables: Dict[str, Any]) -> bool:
+        self.emit(2, 'if v is None:')
+        self.emit(3, "raise ValidationError('required')")
+        return True
+
+    def inline_not_empty(self, variables: Dict[str, Any]) -> bool:
+        self.emit(2, 'if isinstance(v, str) and not v.strip():')
+        self.emit(3, "raise ValidationError('empty')")
+        return True
+
+    def inline_length(self, variables: Dict[str, Any]) -> bool:
+        low, high, equal = variables['low'], variables['high'], variables['equal']
+        low_c, high_c = self.const(low), self.const(high)
+
+        checks: List[Tuple[int, str]] = []
+        if self.value_type is not str:
+            checks += [(3, 'if not isinstance(v, Sized):'), (4, "raise ValidationError('invalid')")]
+        if equal is not None:
+            equal_c = self.const(equal)
+            checks += [(3, f'if len(v) != {equal_c}:'), (4, f"raise ValidationError('length_equal', equal={equal_c})")]
+        if low is not None:
+            key = 'length_low' if high is None else 'length_between'
+            checks += [(3, f'if len(v) < {low_c}:'), (4, f'raise ValidationError({key!r}, low={low_c}, high={high_c})')]
+        if high is not None:
+            key = 'length_high' if low is None else 'length_between'
+            checks += [(3, f'if len(v) > {high_c}:'), (4, f'raise ValidationError({key!r}, low={low_c}, high={high_c})')]
+
+        if checks:
+            self.emit(2, 'if v is not None:')
+            for depth, line in checks:
+                self.emit(depth, line)
+        return True
+
+    def inline_range(self, variables: Dict[str, Any]) -> bool:
+        low, high = variables['low'], variables['high']
+        low_c, high_c = self.const(low), self.const(high)
+
+        # Every object is a runtime `NumericComparable`/`TemporalComparable`, so that check is skipped.
+        if low is not None:
+            key = 'range_low' if high is None else 'range_between'
+            self.emit(2, f'if v is not None and v < {low_c}:')
+            self.emit(3, f'raise ValidationError({key!r}, low={low_c}, high={high_c})')
+        if high is not None:
+            # The interpreted validator always reports `range_between` here.
+            self.emit(2, f'if v is not None and v > {high_c}:')
+            self.emit(3, f"raise ValidationError('range_between', low={low_c}, high={high_c})")
+        return True
+
+    def choices_const(self, choices: Choices) -> str:
+        options = choices.get()
+        # A string can always be tested against the frozen set directly.
+        if self.value_type is str and options.members is not None:
+            return self.const(options.members)
+        return self.const(options)
+
+    def inline_one_of(self, variables: Dict[str, Any]) -> bool:
+        choices: Choices = variables['choices']
+        if not choices.static:
+            return False
+        options_c, rendered_c = self.choices_const(choices), self.const(choices.get().render())
+        self.emit(2, f'if v is not None and v not in {options_c}:')
+        self.emit(3, f"raise ValidationError('one_of', choices={rendered_c})")
+        return True
+
+    def inline_none_of(self, variables: Dict[str, Any]) -> bool:
+        choices: Choices = variables['choices']
+        if not choices.static:
+            return False
+        options_c, rendered_c = self.choices_const(choices), self.const(choices.get().render())
+        self.emit(2, f'if v in {options_c}:')
+        self.emit(3, f"raise ValidationError('none_of', choices={rendered_c})")
+        return True
+
+    def inline_equal(self, variables: Dict[str, Any]) -> bool:
+        value_c = self.const(variables['value'])
+        self.emit(2, f'if v is not None and v != {value_c}:')
+        self.emit(3, f"raise ValidationError('equal', other={value_c})")
+        return True
+
+    def inline_matches(self, variables: Dict[str, Any]) -> bool:
+        other_c = self.const(variables['other'])
+        self.emit(2, f'if v is not None and v != data.get({other_c}):')
+        self.emit(3, f"raise ValidationError('matches', other={other_c})")
+        return True
+
+    def inline_regexp(self, variables: Dict[str, Any]) -> bool:
+        regex_c, pattern_c = self.const(variables['regex']), self.const(variables['pattern'])
+        self.emit(2, f'if v is not None and {regex_c}.match(str(v)) is None:')
+        self.emit(3, f"raise ValidationError('regexp', pattern={pattern_c})")
+        return True
+
+    def inline_function(self, variables: Dict[str, Any]) -> bool:
+        method, kwargs = variables['method'], variables['kwargs']
+        method_c, kwargs_c = self.const(method), self.const(kwargs)
+        self.emit(2, f'if v is not None and not {method_c}(v, **{kwargs_c}):')
+        self.emit(3, f"raise ValidationError('function', function={method_c}.__name__)")
+        return True
+
+
+Inliner = Callable[[FieldsCompiler, Dict[str, Any]], bool]
+
+# The inliners, keyed by the name of the factory of the validator closure.
+inliners: Dict[str, Inliner] = {
+    'validate_required': FieldsCompiler.inline_required,
+    'validate_not_empty': FieldsCompiler.inline_not_empty,
+    'validate_length': FieldsCompiler.inline_length,
+    'validate_numeric_range': FieldsCompiler.inline_range,
+    'validate_temporal_range': FieldsCompiler.inline_range,
+    'validate_one_of': FieldsCompiler.inline_one_of,
+    'validate_none_of': FieldsCompiler.inline_none_of,
+    'validate_equal': FieldsCompiler.inline_equal,
+    'validate_matches': FieldsCompiler.inline_matches,
+    'validate_regexp': FieldsCompiler.inline_regexp,
+    'validate_function': FieldsCompiler.inline_function,
+}
+
+
+def compile_fields(fields: FieldList[Any]) -> CompiledFields:
+    """Generate a function validating `fields`.
+
+    The function is called with `(result, add_error, data, ctx)`, it stores the valid values
+    in `result` and reports the errors through `add_error`, like `BaseValidator.check_row`.
+
+    The validators of the fields are read once, changing them afterwards has no effect
+    on the generated function.
+
+    Args:
+        fields (FieldList[Any]): The fields to validate, with their name.
+
+    Returns:
+        CompiledFields: The generated function, its source code is available as `__source__`.
+    """
+    return FieldsCompiler().compile(fields)
@@ -0,0 +1,415 @@
+"""Validate data stored as columns with NumPy.
+
+The bounds of the numeric fields, the length of the string fields and the static choices are
+evaluated as vectorized masks over whole columns. The other fields and validators are validated
+one row at a time with `Field.validate`, so the errors are always the same as `BaseValidator.validate`.
+
+The `clean_<field>` and `clean` methods of the validator are not called, since they work on a single row.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Collection, Container, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError('The columnar validation requires numpy, install the `columnar` extra') from exc
+
+from outcome.peewee_validates.codegen import validator_factory
+from outcome.peewee_validates.peewee_validates import (
+    BaseValidator,
+    Choices,
+    DecimalField,
+    Field,
+    FloatField,
+    IntegerField,
+    StringField,
+    ValidationError,
+)
+
+Columns = Mapping[str, Sequence[Any]]
+ErrorMasks = List[Tuple[ValidationError, np.ndarray]]
+
+
+class Column:
+    """The coerced values of a column.
+
+    Attributes:
+        values (np.ndarray): The coerced values, the missing values hold a placeholder.
+        missing (np.ndarray): The mask of the rows whose value is None after coercion.
+        kind (str): `str`, `number` or `object`, the vectorized checks that can be applied to the values.
+    """
+
+    __slots__ = ('values', 'missing', 'kind')
+
+    def __init__(self, values: np.ndarray, missing: np.ndarray, kind: str):
+        self.values = values
+        self.missing = missing
+        self.kind = kind
+
+
+class ColumnarResult:
+    """The errors of a columnar validation.
+
+    A row has at most one error per field, like with `BaseValidator.validate`. The errors of a vectorized
+    field are stored with the mask of the rows that failed, the others are stored per row.
+    """
+
+    def __init__(self, validator: BaseValidator[Any], row_count: int):
+        self.validator = validator
+        self.row_count = row_count
+        self.fields: List[str] = []
+        self.masks: Dict[str, ErrorMasks] = {}
+        self.row_errors: Dict[str, Dict[int, ValidationError]] = {}
+
+    def field_mask(self, name: str) -> np.ndarray:
+        """The mask of the rows with an error on the field `name`.
+
+        Args:
+            name (str): The name of the field.
+
+        Returns:
+            np.ndarray: A boolean array, with one item per row.
+        """
+        mask = np.zeros(self.row_count, dtype=bool)
+        for _, error_mask in self.masks.get(name, ()):
+            mask |= error_mask
+        for row in self.row_errors.get(name, {}):
+            mask[row] = True
+        return mask
+
+    @property
+    def invalid(self) -> np.ndarray:
+        mask = np.zeros(self.row_count, dtype=bool)
+        for name in self.fields:
+            mask |= self.field_mask(name)
+        return mask
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~self.invalid
+
+    def errors(self) -> List[Dict[str, str]]:
+        """Expand the errors into one dict per row, with the messages `add_error` produces.
+
+        Each distinct error of a vectorized field is formatted once.
+
+        Returns:
+            List[Dict[str, str]]: The errors of each row, keyed by field name.
+        """
+        rows: List[Dict[str, str]] = [{} for _ in range(self.row_count)]
+        format_error = self.validator.format_error
+
+        for name in self.fields:
+            for error, mask in self.masks.get(name, ()):
+                message = format_error(name, error)
+                for row in np.flatnonzero(mask).tolist():
+                    rows[row][name] = message
+            for row, row_error in self.row_errors.get(name, {}).items():
+                rows[row][name] = format_error(name, row_error)
+
+        return rows
+
+
+def is_none(values: np.ndarray) -> np.ndarray:
+    if values.dtype != object:
+        return np.zeros(len(values), dtype=bool)
+    return np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+
+
+def is_number(value: object) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+
+def to_array(column: Sequence[Any]) -> np.ndarray:
+    if isinstance(column, np.ndarray):
+        return column
+    # Keep the Python objects, `np.asarray` would silently turn mixed values into strings
+    array = np.empty(len(column), dtype=object)
+    array[:] = list(column)
+    return array
+
+
+def numeric_values(array: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Get the numbers of a column, and the mask of its None values.
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: The numbers, with 0 in place of None, or None if the column
+            holds values that aren't numbers.
+    """
+    if array.dtype.kind in 'biuf':
+        return array.astype(float) if array.dtype.kind == 'b' else array, np.zeros(len(array), dtype=bool)
+    if array.dtype != object:
+        return None
+    missing = is_none(array)
+    if not all(is_number(value) for value in array[~missing]):
+        return None
+    values = np.where(missing, 0, array)
+    # Keep the integers exact when there are no floats
+    dtype = float if any(isinstance(value, (float, np.floating)) for value in values) else np.int64
+    try:
+        return values.astype(dtype), missing
+    except OverflowError:
+        return None
+
+
+def coerce_string(array: np.ndarray) -> Column:
+    if array.dtype.kind == 'U':
+        return Column(array, np.zeros(len(array), dtype=bool), 'str')
+    missing = is_none(array)
+    values = np.array(['' if value is None else str(value) for value in array.tolist()], dtype=str)
+    return Column(values, missing, 'str')
+
+
+def coerce_integer(array: np.ndarray) -> Optional[Tuple[Column, ErrorMasks]]:
+    numbers = numeric_values(array)
+    if numbers is None:
+        return None
+    values, missing = numbers
+    if values.dtype.kind != 'f':
+        return Column(values, missing, 'number'), []
+    if np.isinf(values).any():
+        # `int` raises an OverflowError, let the row validation raise it
+        return None
+    invalid = np.isnan(values)
+    return Column(np.trunc(np.where(invalid, 0, values)), missing, 'number'), [(ValidationError('coerce_int'), invalid)]
+
+
+def coerce_float(array: np.ndarray) -> Optional[Tuple[Column, ErrorMasks]]:
+    numbers = numeric_values(array)
+    if numbers is None:
+        return None
+    values, missing = numbers
+    # Falsy values are coerced to None
+    return Column(values, missing | (values == 0), 'number'), []
+
+
+def coerce_decimal(array: np.ndarray) -> Optional[Tuple[Column, ErrorMasks]]:
+    numbers = numeric_values(array)
+    if numbers is None or (numbers[0].dtype.kind == 'f' and np.isnan(numbers[0]).any()):
+        # A NaN Decimal can't be compared
+        return None
+    values, missing = numbers
+    return Column(values, missing | (values == 0), 'number'), []
+
+
+Coercer = Callable[[np.ndarray], Optional[Tuple[Column, ErrorMasks]]]
+
+coercers: Dict[object, Coercer] = {
+    Field.coerce: lambda array: (Column(array, is_none(array), 'object'), []),
+    StringField.coerce: lambda array: (coerce_string(array), []),
+    IntegerField.coerce: coerce_integer,
+    FloatField.coerce: coerce_float,
+    DecimalField.coerce: coerce_decimal,
+}
+
+
+def contains(values: np.ndarray, options: Container[object]) -> np.ndarray:
+    """Test the membership of each value, with the semantics of the `in` operator.
+
+    Each distinct value is only tested once.
+
+    Args:
+        values (np.ndarray): The values.
+        options (Container[object]): The options, e.g. a `ChoiceSet`.
+
+    Returns:
+        np.ndarray: The mask of the values found in the options.
+    """
+    if not len(values):
+        return np.zeros(0, dtype=bool)
+    try:
+        distinct, inverse = np.unique(values, return_inverse=True)
+    except TypeError:
+        # The values can't be sorted
+        return np.fromiter((value in options for value in values.tolist()), dtype=bool, count=len(values))
+    found = np.fromiter((value in options for value in distinct.tolist()), dtype=bool, count=len(distinct))
+    return found[inverse.reshape(-1)]
+
+
+# Each check returns the errors of a validator in the order it raises them, or None if it can't be vectorized.
+Check = Callable[[Column, Dict[str, Any]], Optional[ErrorMasks]]
+
+
+def check_required(column: Column, variables: Dict[str, Any]) -> Optional[ErrorMasks]:
+    return [(ValidationError('required'), column.missing)]
+
+
+def check_not_empty(column: Column, variables: Dict[str, Any]) -> Optional[ErrorMasks]:
+    if column.kind != 'str':
+        return None
+    return [(ValidationError('empty'), ~column.missing & (np.char.str_len(np.char.strip(column.values)) == 0))]
+
+
+def check_length(column: Column, variables: Dict[str, Any]) -> Optional[ErrorMasks]:
+    if column.kind != 'str':
+        return None
+
+    low, high, equal = variables['low'], variables['high'], variables['equal']
+    present = ~column.missing
+    lengths = np.char.str_len(column.values)
+    errors: ErrorMasks = []
+
+    if equal is not None:
+        errors.append((ValidationError('length_equal', equal=equal), present & (lengths != equal)))
+    if low is not None:
+        key = 'length_low' if high is None else 'length_between'
+        errors.append((ValidationError(key, low=low, high=high), present & (lengths < low)))
+    if high is not None:
+        key = 'length_high' if low is None else 'length_between'
+        errors.append((ValidationError(key, low=low, high=high), present & (lengths > high)))
+    return errors
+
+
+def check_numeric_range(column: Column, variables: Dict[str, Any]) -> Optional[ErrorMasks]:
+    low, high = variables['low'], variables['high']
+    if column.kind != 'number' or not all(bound is None or is_number(bound) for bound in (low, high)):
+        return None
+
+    present = ~column.missing
+    errors: ErrorMasks = []
+
+    if low is not None:
+        key = 'range_low' if high is None else 'range_between'
+        errors.append((ValidationError(key, low=low, high=high), present & (column.values < low)))
+    if high is not None:
+        # Like `validate_numeric_range`, always reported as `range_between`
+        errors.append((ValidationError('range_between', low=low, high=high), present & (column.values > high)))
+    return errors
+
+
+def check_one_of(column: Column, variables: Dict[str, Any]) -> Optional[ErrorMasks]:
+    choices: Choices = variables['choices']
+    if not choices.static:
+        return None
+    options = choices.get()
+    mask = ~column.missing
+    mask[mask] = ~contains(column.values[mask], options)
+    return [(ValidationError('one_of', choices=options.render()), mask)]
+
+
+def check_none_of(column: Column, variables: Dict[str, Any]) -> Optional[ErrorMasks]:
+    choices: Choices = variables['choices']
+    if not choices.static:
+        return None
+    options = choices.get()
+    present = ~column.missing
+    mask = np.full(len(present), None in options, dtype=bool)
+    mask[present] = contains(column.values[present], options)
+    return [(ValidationError('none_of', choices=options.render()), mask)]
+
+
+checks: Dict[str, Check] = {
+    'validate_required': check_required,
+    'validate_not_empty': check_not_empty,
+    'validate_length': check_length,
+    'validate_numeric_range': check_numeric_range,
+    'validate_one_of': check_one_of,
+    'validate_none_of': check_none_of,
+}
+
+
+def get_column(name: str, field: Field[Any], columns: Columns, row_count: int) -> Optional[np.ndarray]:
+    if name in columns:
+        return to_array(columns[name])
+    default = field.default
+    if callable(default):
+        return None
+    return to_array([default or None] * row_count)
+
+
+def vectorize_field(field: Field[Any], array: np.ndarray) -> Optional[ErrorMasks]:
+    """Validate a column with vectorized checks.
+
+    Args:
+        field (Field[Any]): The field.
+        array (np.ndarray): The raw values of the column.
+
+    Returns:
+        Optional[ErrorMasks]: The errors with the rows that failed, or None if the field can't be vectorized.
+    """
+    if type(field).validate is not Field.validate or type(field).get_value is not Field.get_value:
+        return None
+
+    coercer = coercers.get(type(field).coerce)
+    factories = [factory for factory in map(validator_factory, field.validators) if factory is not None]
+    if coercer is None or len(factories) != len(field.validators) or any(name not in checks for name, _ in factories):
+        return None
+
+    coerced = coercer(array)
+    if coerced is None:
+        return None
+    column, errors = coerced
+    failed = np.zeros(len(array), dtype=bool)
+    for _, mask in errors:
+        failed |= mask
+
+    for factory_name, variables in factories:
+        field_errors = checks[factory_name](column, variables)
+        if field_errors is None:
+            return None
+        for error, mask in field_errors:
+            # Only the first error of a row is reported
+            mask = mask & ~failed  # noqa: WPS440
+            errors.append((error, mask))
+            failed |= mask
+
+    return [(error, mask) for error, mask in errors if mask.any()]
+
+
+def validate_columns(
+    validator: BaseValidator[Any],
+    columns: Columns,
+    ctx: Optional[Any] = None,
+    only: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+) -> ColumnarResult:
+    """Validate data stored as columns.
+
+    Args:
+        validator (BaseValidator[Any]): The validator providing the fields and the messages.
+        columns (Columns): The columns, keyed by field name. All the columns must have the same length.
+        ctx (Optional[Any]): The validation context, used by the fields validated row by row.
+        only (Optional[Collection[str]]): Validate only these fields.
+        exclude (Optional[Collection[str]]): Don't validate these fields.
+
+    Raises:
+        ValueError: If the columns have different lengths.
+
+    Returns:
+        ColumnarResult: The errors of the rows.
+    """
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError('All the columns must have the same length')
+    row_count = lengths.pop() if lengths else 0
+
+    result = ColumnarResult(validator, row_count)
+    row_fields: List[Tuple[str, Field[Any]]] = []
+
+    for name, field in validator.select_fields(only, exclude):
+        result.fields.append(name)
+        array = get_column(name, field, columns, row_count)
+        errors = vectorize_field(field, array) if array is not None else None
+        if errors is None:
+            row_fields.append((name, field))
+        elif errors:
+            result.masks[name] = errors
+
+    if row_fields:
+        validate_rows(result, row_fields, columns, ctx)
+
+    return result
+
+
+def validate_rows(result: ColumnarResult, fields: List[Tuple[str, Field[Any]]], columns: Columns, ctx: Optional[Any]):
+    # Convert the arrays once, so the fields get Python values
+    values = {name: column.tolist() if isinstance(column, np.ndarray) else list(column) for name, column in columns.items()}
+
+    for row in range(result.row_count):
+        data = {name: column[row] for name, column in values.items()}
+        for name, field in fields:
+            try:
+                field.validate(name, data, ctx)
+            except ValidationError as err:
+                result.row_errors.setdefault(name, {})[row] = err
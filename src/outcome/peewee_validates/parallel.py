@@ -0,0 +1,160 @@
+"""Validate rows with a pool of processes.
+
+Each process gets the class of the validator (and the model instance of a `ModelValidator`) once,
+and builds its own validator, so each process compiles the fields of the class once. The database
+connections inherited from the calling process are dropped before the first query.
+
+The processes only validate the fields that don't query the database. The related objects, the
+unique fields and the unique indexes are then checked by the calling process, with the lookups
+batched per chunk like `validate_many`, along with the `clean_<field>` and `clean` methods.
+Custom validators that query the database are run by the processes, so they must open their
+own connection.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, cast
+
+import peewee
+from playhouse.pool import PooledDatabase
+
+from outcome.peewee_validates.peewee_validates import (
+    DEFAULT_CHUNK_SIZE,
+    BaseValidator,
+    Data,
+    FieldList,
+    FieldResults,
+    ModelValidator,
+    ValidationResult,
+    batch_lookups,
+    queries_database,
+)
+
+# The class of the validator built by the processes, and the model instance of a `ModelValidator`.
+ValidatorSpec = Tuple[Type[BaseValidator[Any]], Any]
+
+# The state of a worker process, set once by `initialize_worker`.
+_worker: Optional[Tuple[BaseValidator[Any], Any, FieldList[Any]]] = None
+
+
+def get_validator_spec(validator: BaseValidator[Any]) -> ValidatorSpec:
+    return (type(validator), validator.ctx if isinstance(validator, ModelValidator) else None)
+
+
+def build_validator(spec: ValidatorSpec) -> BaseValidator[Any]:
+    validator_class, instance = spec
+    if issubclass(validator_class, ModelValidator):
+        return validator_class(instance)
+    return validator_class()
+
+
+def drop_inherited_connections(databases: Iterable[peewee.Database]):
+    """Forget the connections a forked process inherited, so it opens its own on the first query.
+
+    The connections are shared with the parent process, closing them would also end the sessions
+    of the parent on a database server.
+    """
+    for database in databases:
+        # The connection state and the pool are private to peewee.
+        inherited = cast(Any, database)
+        inherited._state.reset()  # noqa: WPS437
+        if isinstance(database, PooledDatabase):
+            inherited._connections = []  # noqa: WPS437
+            inherited._in_use = {}  # noqa: WPS437
+
+
+def initialize_worker(spec: ValidatorSpec, ctx: Any, names: Sequence[str]):
+    global _worker  # noqa: WPS420
+    validator = build_validator(spec)
+    drop_inherited_connections(validator.get_databases())
+    _worker = (validator, ctx, validator.select_fields(only=names))  # noqa: WPS442
+
+
+def check_chunk(rows: Sequence[Data]) -> List[FieldResults]:
+    assert _worker is not None
+    validator, ctx, fields = _worker
+
+    results: List[FieldResults] = []
+    for row in rows:
+        validator.data = {}
+        validator.errors = {}
+        validator.check_fields(fields, row, ctx)
+        results.append((validator.data, validator.error_records))
+    return results
+
+
+def validate_parallel(
+    validator: BaseValidator[Any],
+    rows: Iterable[Data],
+    workers: Optional[int] = None,
+    ctx: Optional[Any] = None,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ValidationResult]:
+    """Validate each row of `rows` with a pool of processes.
+
+    The chunks are sent to the processes as they are read, with at most two chunks per process
+    waiting, and the results are yielded in the order of the rows. The results are the same as
+    with `validate_many`.
+
+    Args:
+        validator (BaseValidator[Any]): The validator, its class must be importable by the processes and
+            built without arguments, or with the model instance for a `ModelValidator`.
+        rows (Iterable[Data]): The rows to validate.
+        workers (Optional[int]): The number of processes, defaults to the number of CPUs.
+        ctx (Optional[Any]): The context passed to the field validators.
+        only (Optional[Iterable[str]]): Only validate these fields.
+        exclude (Optional[Iterable[str]]): Don't validate these fields.
+        chunk_size (int): The number of rows sent to a process at once.
+
+    Yields:
+        ValidationResult: The result for each row, in order.
+    """
+    fields = validator.select_fields(only, exclude)
+    local_names = [name for name, field in fields if not queries_database(field)]
+    database_fields = [(name, field) for name, field in fields if queries_database(field)]
+
+    if not local_names:
+        yield from validator.validate_many(rows, ctx=ctx, only=only, exclude=exclude, chunk_size=chunk_size)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(rows)
+    initargs = (get_validator_spec(validator), ctx, local_names)
+    with ProcessPoolExecutor(workers, initializer=initialize_worker, initargs=initargs) as pool:
+        pending: Deque[Tuple[List[Data], Future[List[FieldResults]]]] = deque()
+        max_pending = workers * 2
+
+        while True:  # noqa: WPS457
+            chunk = [validator.prepare_row(fields, row, ctx) for row in islice(iterator, chunk_size)]
+            if chunk:
+                pending.append((chunk, pool.submit(check_chunk, chunk)))
+            if not pending:
+                return
+            if chunk and len(pending) < max_pending:
+                continue
+
+            done, future = pending.popleft()
+            yield from finish_chunk(validator, fields, database_fields, done, future.result(), ctx)
+
+
+def finish_chunk(
+    validator: BaseValidator[Any],
+    fields: FieldList[Any],
+    database_fields: FieldList[Any],
+    chunk: List[Data],
+    results: List[FieldResults],
+    ctx: Optional[Any],
+) -> List[ValidationResult]:
+    token = batch_lookups.set(validator.prefetch(database_fields, chunk))
+    try:
+        return [
+            (validator.check_row(fields, row, ctx, validated=validated), validator.data, validator.error_messages())
+            for row, validated in zip(chunk, results)
+        ]
+    finally:
+        batch_lookups.reset(token)
@@ -1,24 +1,39 @@
 """peewee-validates is a validator module designed to work with the Peewee ORM."""
 from __future__ import annotations
 
+import asyncio
+import copy
 import datetime
+import logging
 import re
+import threading
+import time
 import types
+from collections import OrderedDict
+from contextlib import ExitStack
+from contextvars import ContextVar, Token, copy_context
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache, partial
 from inspect import isgenerator, isgeneratorfunction
+from itertools import islice
 from typing import (
     Any,
+    Awaitable,
     Callable,
+    ClassVar,
     Collection,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     Pattern,
     Protocol,
     Sequence,
+    Set,
     Sized,
     Tuple,
     TypeVar,
@@ -31,6 +46,13 @@ import peewee
 from dateutil.parser import parse as dateutil_parse
 from playhouse.postgres_ext import ArrayField
 
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover
+    sqlite_version_info: Tuple[int, ...] = (0, 0, 0)
+else:
+    sqlite_version_info = sqlite3.sqlite_version_info
+
 __version__ = '1.0.10'
 
 __all__ = [
@@ -48,8 +70,14 @@ __all__ = [
     'BooleanField',
     'ModelChoiceField',
     'ManyModelChoiceField',
+    'LookupCache',
+    'ValidationObserver',
+    'QueryLog',
+    'save_many',
 ]
 
+logger = logging.getLogger(__name__)
+
 if peewee.__version__ < '3.0.0':  # noqa: WPS609
     assert AssertionError('Requires Peewee3')  # pragma: no cover # noqa: S101
 
@@ -89,6 +117,7 @@ DEFAULT_MESSAGES = types.MappingProxyType(
         'list': 'Must be a list of values',
         'unique': 'Must be a unique value.',
         'index': 'Fields must be unique together.',
+        'invalid_row': 'Unable to read the row: {error}.',
     },
 )
 
@@ -98,8 +127,19 @@ F = TypeVar('F', contravariant=True)
 M = TypeVar('M', bound=peewee.Model)
 
 
+class BoundValue(Protocol):  # pragma: no cover
+    # Read-only, so both a `Field` and a `BoundField` (whose name is always set) match.
+    @property
+    def name(self) -> Optional[str]:
+        ...
+
+    @property
+    def value(self) -> Optional[object]:
+        ...
+
+
 class ValidatorFn(Protocol[F]):  # pragma: no cover
-    def __call__(self, field: Field[F], data: Data, ctx: Optional[F] = ...) -> None:
+    def __call__(self, field: BoundValue, data: Data, ctx: Optional[F] = ...) -> None:
         ...
 
 
@@ -145,7 +185,7 @@ class ValidationError(Exception):
 
 
 def validate_required() -> ValidatorFn[Any]:
-    def required_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def required_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:  # noqa: WPS204
             raise ValidationError(required_const)
 
@@ -153,7 +193,7 @@ def validate_required() -> ValidatorFn[Any]:
 
 
 def validate_not_empty() -> ValidatorFn[Any]:
-    def empty_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def empty_validator(field: BoundValue, data: Data, ctx: Any = None):
         if isinstance(field.value, str) and not field.value.strip():
             raise ValidationError('empty')
 
@@ -165,7 +205,7 @@ def validate_length(  # noqa: WPS231,WPS238
     high: Optional[Numeric] = None,
     equal: Optional[Numeric] = None,
 ) -> ValidatorFn[Any]:
-    def length_validator(field: Field[Any], data: Data, ctx: Any = None):  # noqa: WPS231,WPS238
+    def length_validator(field: BoundValue, data: Data, ctx: Any = None):  # noqa: WPS231,WPS238
         if field.value is None:
             return
 
@@ -190,26 +230,111 @@ Values = Collection[object]
 ValuesFn = Callable[[], Values]
 
 
-def validate_one_of(values: Union[Values, ValuesFn]) -> ValidatorFn[Any]:
-    def one_of_validator(field: Field[Any], data: Data, ctx: Any = None):
+class ChoiceSet:
+    """A snapshot of the options of a choice validator.
+
+    The membership is tested against a frozen set, falling back to the options for the values
+    that can't be hashed. The choices are rendered for the error messages once.
+    """
+
+    __slots__ = ('options', 'members', 'rendered')
+
+    def __init__(self, options: Values):
+        self.options = options
+        self.members: Optional[FrozenSet[object]] = None
+        self.rendered: Optional[str] = None
+
+        # A string tests substrings, not members.
+        if not isinstance(options, str):
+            try:
+                self.members = frozenset(options)
+            except TypeError:
+                self.members = None
+
+    def __contains__(self, value: object) -> bool:
+        if self.members is not None:
+            try:
+                return value in self.members
+            except TypeError:
+                pass
+        return value in self.options
+
+    def render(self) -> str:
+        if self.rendered is None:
+            self.rendered = ', '.join(map(str, self.options))
+        return self.rendered
+
+
+class Choices:
+    """The options of `validate_one_of` and `validate_none_of`, and how they are memoized.
+
+    Static options are frozen once. By default, a callable provider is called on every
+    validation, with a `ttl` its options are kept for `ttl` seconds, or until `refresh`.
+
+    Args:
+        values (Union[Values, ValuesFn]): The options, or a function returning them.
+        ttl (Optional[float]): The number of seconds the options of a provider are kept.
+        clock (Callable[[], float]): The source of the time used for the TTL.
+    """
+
+    __slots__ = ('provider', 'ttl', 'clock', 'current', 'expires')
+
+    def __init__(self, values: Union[Values, ValuesFn], ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.provider: Optional[ValuesFn] = values if callable(values) else None
+        self.ttl = ttl
+        self.clock = clock
+        self.expires = float('-inf')
+        self.current: Optional[ChoiceSet] = None if self.provider else ChoiceSet(cast(Values, values))
+
+    @property
+    def static(self) -> bool:
+        return self.provider is None
+
+    def get(self) -> ChoiceSet:
+        current = self.current
+        if self.provider is None:
+            return cast(ChoiceSet, current)
+        if current is not None and self.ttl is not None and self.clock() < self.expires:
+            return current
+
+        current = ChoiceSet(self.provider())
+        if self.ttl is not None:
+            self.current = current
+            self.expires = self.clock() + self.ttl
+        return current
+
+    def refresh(self):
+        """Drop the memoized options of the provider, they are fetched again by the next validation."""
+        if self.provider is not None:
+            self.current = None
+
+
+def as_choices(values: Union[Values, ValuesFn, Choices], ttl: Optional[float]) -> Choices:
+    if isinstance(values, Choices):
+        return values
+    return Choices(values, ttl=ttl)
+
+
+def validate_one_of(values: Union[Values, ValuesFn, Choices], ttl: Optional[float] = None) -> ValidatorFn[Any]:
+    choices = as_choices(values, ttl)
+
+    def one_of_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:
             return
-        options = values
-        if callable(options):
-            options = options()
+        options = choices.get()
         if field.value not in options:
-            raise ValidationError('one_of', choices=', '.join(map(str, options)))
+            raise ValidationError('one_of', choices=options.render())
 
     return one_of_validator
 
 
-def validate_none_of(values: Union[Values, ValuesFn]) -> ValidatorFn[Any]:
-    def none_of_validator(field: Field[Any], data: Data, ctx: Any = None):
-        options = values
-        if callable(options):
-            options = options()
+def validate_none_of(values: Union[Values, ValuesFn, Choices], ttl: Optional[float] = None) -> ValidatorFn[Any]:
+    choices = as_choices(values, ttl)
+
+    def none_of_validator(field: BoundValue, data: Data, ctx: Any = None):
+        options = choices.get()
         if field.value in options:
-            raise ValidationError('none_of', choices=', '.join(map(str, options)))
+            raise ValidationError('none_of', choices=options.render())
 
     return none_of_validator
 
@@ -218,14 +343,12 @@ def validate_numeric_range(  # noqa: WPS231
     low: Optional[NumericComparable] = None,
     high: Optional[NumericComparable] = None,
 ) -> ValidatorFn[Any]:
-    def numeric_range_validator(field: Field[Any], data: Data, ctx: Any = None):  # noqa: WPS231
+    def numeric_range_validator(field: BoundValue, data: Data, ctx: Any = None):  # noqa: WPS231
         if field.value is None:
             return
 
-        value = field.value
-
-        if not isinstance(value, NumericComparable):  # pragma: no cover
-            raise ValidationError('invalid comparable')
+        # Every object is a runtime `NumericComparable`, so the check is skipped as it's slow and can't fail.
+        value = cast(NumericComparable, field.value)
 
         if low is not None and value < low:
             key = 'range_low' if high is None else 'range_between'
@@ -241,14 +364,12 @@ def validate_temporal_range(  # noqa: WPS231
     low: Optional[TemporalComparable] = None,
     high: Optional[TemporalComparable] = None,
 ) -> ValidatorFn[Any]:
-    def temporal_range_validator(field: Field[Any], data: Data, ctx: Any = None):  # noqa: WPS231
+    def temporal_range_validator(field: BoundValue, data: Data, ctx: Any = None):  # noqa: WPS231
         if field.value is None:
             return
 
-        value = field.value
-
-        if not isinstance(value, TemporalComparable):  # pragma: no cover
-            raise ValidationError('invalid comparable')
+        # See `validate_numeric_range`.
+        value = cast(TemporalComparable, field.value)
 
         if low is not None and value < low:
             key = 'range_low' if high is None else 'range_between'
@@ -261,7 +382,7 @@ def validate_temporal_range(  # noqa: WPS231
 
 
 def validate_equal(value: object) -> ValidatorFn[Any]:
-    def equal_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def equal_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:
             return
         if field.value != value:
@@ -271,7 +392,7 @@ def validate_equal(value: object) -> ValidatorFn[Any]:
 
 
 def validate_matches(other: str) -> ValidatorFn[Any]:
-    def matches_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def matches_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:
             return
         if field.value != data.get(other):
@@ -283,7 +404,7 @@ def validate_matches(other: str) -> ValidatorFn[Any]:
 def validate_regexp(pattern: Union[str, Pattern[str]], flags: int = 0) -> ValidatorFn[Any]:
     regex = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
 
-    def regexp_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def regexp_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:
             return
         if regex.match(str(field.value)) is None:
@@ -330,7 +451,7 @@ CustomValidatorFn = Union[
 
 
 def validate_function(method: CustomValidatorFn, **kwargs: object) -> ValidatorFn[Any]:
-    def function_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def function_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:
             return
         if not method(field.value, **kwargs):
@@ -339,25 +460,34 @@ def validate_function(method: CustomValidatorFn, **kwargs: object) -> ValidatorF
     return function_validator
 
 
+EMAIL_USER_REGEX = re.compile(
+    r"(^[-!#$%&'*+/=?^`{}|~\w]+(\.[-!#$%&'*+/=?^`{}|~\w]+)*$"  # noqa: P103
+    + r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]'  # noqa: P103
+    + r'|\\[\001-\011\013\014\016-\177])*"$)',  # noqa: WPS326
+    re.IGNORECASE | re.UNICODE,
+)
+
+EMAIL_DOMAIN_REGEX = re.compile(
+    r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
+    '(?:[A-Z]{2,6}|[A-Z0-9-]{2,})$'  # noqa: WPS326
+    r'|^\[(25[0-5]|2[0-4]\d|[0-1]?\d?\d)'  # noqa: WPS326
+    r'(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$',  # noqa: WPS326
+    re.IGNORECASE | re.UNICODE,
+)
+
+EMAIL_DOMAIN_WHITELIST = frozenset(('localhost',))
+
+# The number of domains whose verdict is cached, the traffic usually hits a small set of domains.
+EMAIL_DOMAIN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EMAIL_DOMAIN_CACHE_SIZE)
+def is_valid_email_domain(domain: str) -> bool:
+    return domain in EMAIL_DOMAIN_WHITELIST or EMAIL_DOMAIN_REGEX.match(domain) is not None
+
+
 def validate_email() -> ValidatorFn[Any]:  # noqa: WPS231
-    user_regex = re.compile(
-        r"(^[-!#$%&'*+/=?^`{}|~\w]+(\.[-!#$%&'*+/=?^`{}|~\w]+)*$"  # noqa: P103
-        + r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]'  # noqa: P103
-        + r'|\\[\001-\011\013\014\016-\177])*"$)',  # noqa: WPS326
-        re.IGNORECASE | re.UNICODE,
-    )
-
-    domain_regex = re.compile(
-        r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
-        '(?:[A-Z]{2,6}|[A-Z0-9-]{2,})$'  # noqa: WPS326
-        r'|^\[(25[0-5]|2[0-4]\d|[0-1]?\d?\d)'  # noqa: WPS326
-        r'(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$',  # noqa: WPS326
-        re.IGNORECASE | re.UNICODE,
-    )
-
-    domain_whitelist = ('localhost',)
-
-    def email_validator(field: Field[Any], data: Data, ctx: Any = None):
+    def email_validator(field: BoundValue, data: Data, ctx: Any = None):
         if field.value is None:
             return
 
@@ -368,13 +498,10 @@ def validate_email() -> ValidatorFn[Any]:  # noqa: WPS231
 
         user_part, domain_part = value.rsplit('@', 1)
 
-        if not user_regex.match(user_part):
+        if not EMAIL_USER_REGEX.match(user_part):
             raise ValidationError(email_const)
 
-        if domain_part in domain_whitelist:
-            return
-
-        if not domain_regex.match(domain_part):
+        if not is_valid_email_domain(domain_part):
             raise ValidationError(email_const)
 
     return email_validator
@@ -391,6 +518,9 @@ class QueryLike(Protocol):  # pragma: no cover
     def count(self) -> int:
         ...
 
+    def exists(self) -> bool:
+        ...
+
     def get(self, *args: object) -> Optional[object]:
         ...
 
@@ -398,21 +528,134 @@ class QueryLike(Protocol):  # pragma: no cover
         ...
 
 
+# Values prefetched for the chunk of rows being validated by `ModelValidator.validate_many`, keyed by the
+# validator that consumes them. The database-backed validators use them instead of issuing one query per row.
+batch_lookups: ContextVar[Optional[Dict[object, Any]]] = ContextVar('batch_lookups', default=None)
+
+
+# Marks a check that is skipped while validating the fields, because it is run later.
+DEFERRED = object()
+
+
+def get_batch_lookup(key: object) -> Optional[Any]:
+    lookups = batch_lookups.get()
+    if lookups is None:
+        return None
+    return lookups.get(key)
+
+
+def collation_key(value: object) -> object:
+    """Get a key equal for the values a database collation may consider equal, e.g. "Tim" and "tim ".
+
+    Returns:
+        object: The key.
+    """
+    if isinstance(value, str):
+        return value.strip().casefold()
+    return value
+
+
+class ModelUniqueValidator:
+    __slots__ = ('lookup_field', 'queryset', 'pk_field', 'pk_value')
+
+    def __init__(
+        self,
+        lookup_field: LookupField,
+        queryset: QueryLike,
+        pk_field: Optional[peewee.Field] = None,
+        pk_value: Optional[object] = None,
+    ):
+        self.lookup_field = lookup_field
+        self.queryset = queryset
+        self.pk_field = pk_field
+        self.pk_value = pk_value
+
+    def get_pk(self, ctx: object) -> Optional[object]:
+        if self.pk_field and self.pk_value is None and isinstance(ctx, peewee.Model):
+            return cast(object, ctx.get_id())
+        return self.pk_value
+
+    def __call__(self, field: BoundValue, data: Data, ctx: Any = None):
+        prefetched = get_batch_lookup(self)
+        if prefetched is DEFERRED:
+            return
+
+        existing = self.get_prefetched(prefetched, field.value)
+
+        if existing is not None:
+            # If we have a PK, ignore it because it represents the current record.
+            pk = self.get_pk(ctx)
+            conflict = any(not (self.pk_field and pk) or other != pk for other in existing)
+        else:
+            conflict = self.get_query(field.value, ctx).exists()
+
+        if conflict:
+            raise ValidationError('unique')
+
+    def get_query(self, value: object, ctx: object) -> QueryLike:
+        query = self.queryset.where(self.lookup_field == value)
+        # If we have a PK, ignore it because it represents the current record.
+        pk = self.get_pk(ctx)
+        if self.pk_field and pk:
+            query = query.where(cast(object, ~(self.pk_field == pk)))
+        return query
+
+    def get_prefetched(self, prefetched: Optional[Mapping[object, Any]], value: object) -> Optional[Collection[object]]:
+        if prefetched is None:
+            return None
+        try:
+            return prefetched.get(value)
+        except TypeError:
+            return None
+
+    def prefetch(self, values: Iterable[object]) -> Dict[object, List[object]]:
+        """Fetch the records matching any of `values` with a single query.
+
+        Args:
+            values (Iterable[object]): The candidate values.
+
+        Returns:
+            Dict[object, List[object]]: The primary keys of the records holding each value. The values
+                without a record are left out if the database may have matched them with a different
+                value (e.g. with a case-insensitive collation), they are checked with a query per row.
+        """
+        existing: Dict[object, List[object]] = {v: [] for v in values}
+        if not existing:
+            return existing
+
+        lookup_field = cast(peewee.Field, self.lookup_field)
+        columns = [lookup_field, self.pk_field] if self.pk_field else [lookup_field]
+        query = cast(peewee.Select, self.queryset).select(*columns).where(lookup_field.in_(list(existing)))
+
+        unmatched = False
+        returned: Set[object] = set()
+        for row in cast(Iterable[Tuple[object, ...]], query.tuples()):
+            pks = existing.get(row[0])
+            if pks is None:
+                unmatched = True
+            else:
+                pks.append(row[-1])
+            returned.add(collation_key(row[0]))
+
+        # A record that doesn't map back to a candidate may have matched any of them, only the conflicts are reliable.
+        return {value: pks for value, pks in existing.items() if pks or not (unmatched or collation_key(value) in returned)}
+
+
 def validate_model_unique(
     lookup_field: LookupField,
     queryset: QueryLike,
     pk_field: Optional[peewee.Field] = None,
     pk_value: Optional[object] = None,
 ) -> ValidatorFn[Any]:
-    def unique_validator(field: Field[Any], data: Data, ctx: Any = None):
-        # If we have a PK, ignore it because it represents the current record.
-        query = queryset.where(lookup_field == field.value)
-        if pk_field and pk_value:
-            query = query.where(~(pk_field == pk_value))
-        if query.count():
-            raise ValidationError('unique')
+    """Validate that no other record has the same value for `lookup_field`.
+
+    If `pk_field` is provided without a `pk_value`, the primary key is read from the
+    model instance passed as `ctx` when validating, so the validator can be shared between instances.
 
-    return unique_validator
+    Returns:
+        ValidatorFn[Any]: The validator.
+    """
+    return ModelUniqueValidator(lookup_field, queryset, pk_field, pk_value)
 
 
 def coerce_single_instance(lookup_field: LookupField, value: object) -> Any:
@@ -429,6 +672,359 @@ def isiterable_notstring(value: object):
     return isinstance(value, Iterable) or isgeneratorfunction(value) or isgenerator(value)
 
 
+# The number of values sent in a single `IN` query, well below the parameter limits of SQLite and Postgres.
+MAX_IN_VALUES = 500
+
+
+def normalize_lookup_value(lookup_field: LookupField, value: object) -> Optional[object]:
+    """Convert `value` to the python value the database would return for `lookup_field`.
+
+    This allows matching input values (e.g. "1") with the attributes of the fetched objects (e.g. 1).
+
+    Returns:
+        Optional[object]: The normalized value, or None if it can't be normalized.
+    """
+    try:
+        field = cast(peewee.Field, lookup_field)
+        normalized = cast(object, field.python_value(cast(object, field.db_value(value))))
+        hash(normalized)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return normalized
+
+
+# The context variables set by the context managers entered in the current context, innermost last.
+entered_contexts: ContextVar[Tuple[Tuple[object, Token[Any]], ...]] = ContextVar('entered_contexts', default=())
+
+
+def enter_context(owner: object, var: ContextVar[Any], value: object):
+    """Set `var` for the `with` block of `owner`.
+
+    The token resetting `var` is kept in the current context rather than on `owner`, so the same
+    context manager can be entered by several threads or tasks at once.
+
+    Args:
+        owner (object): The context manager.
+        var (ContextVar[Any]): The variable.
+        value (object): Its value inside the block.
+    """
+    entered_contexts.set((*entered_contexts.get(), (owner, var.set(value))))
+
+
+def exit_context(owner: object, var: ContextVar[Any]):
+    """Reset `var` at the end of the innermost `with` block of `owner` in the current context.
+
+    Args:
+        owner (object): The context manager.
+        var (ContextVar[Any]): The variable set by `enter_context`.
+    """
+    entered = entered_contexts.get()
+    index = max(i for i, (entered_owner, _) in enumerate(entered) if entered_owner is owner)
+    var.reset(entered[index][1])
+    entered_contexts.set(entered[:index] + entered[index + 1 :])  # noqa: E203
+
+
+# The model of a query, with its SQL and its parameters.
+QueryKey = Tuple[object, str, object]
+
+
+class LookupCache:
+    """An identity map of the related objects fetched by `ModelChoiceField` and `ManyModelChoiceField`.
+
+    The cache is used by the validations run inside its `with` block, the objects are keyed by
+    the SQL of the query, lookup field and value. Only the objects that exist are cached.
+
+    Args:
+        max_size (int): The number of objects kept, the least recently used are evicted first.
+        ttl (Optional[float]): The number of seconds an object is kept, forever if None.
+        clock (Callable[[], float]): The source of the time used for the TTL.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict[Tuple[QueryKey, str, object], Tuple[float, object]] = OrderedDict()
+        # The key of each query, by `id`. The query is kept alongside, so its `id` can't be reused.
+        self.query_keys: Dict[int, Tuple[QueryLike, QueryKey]] = {}
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> LookupCache:
+        enter_context(self, lookup_cache, self)
+        return self
+
+    def __exit__(self, *exc_info: object):
+        exit_context(self, lookup_cache)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_many(self, query: QueryLike, lookup_field: LookupField, keys: Iterable[object]) -> Dict[object, object]:
+        """Get the cached objects for the normalized `keys`, and count the hits and misses.
+
+        Returns:
+            Dict[object, object]: The cached objects, keyed by normalized value.
+        """
+        found: Dict[object, object] = {}
+        now = self.clock()
+        with self.lock:
+            query_key = self.get_query_key(query)
+            for key in keys:
+                entry_key = (query_key, lookup_field.name, key)
+                entry = self.entries.get(entry_key)
+                if entry is not None and entry[0] < now:
+                    del self.entries[entry_key]  # noqa: WPS420
+                    entry = None
+                if entry is None:
+                    self.misses += 1
+                    continue
+                self.hits += 1
+                self.entries.move_to_end(entry_key)
+                found[key] = entry[1]
+        return found
+
+    def set_many(self, query: QueryLike, lookup_field: LookupField, objects: Mapping[object, object]):
+        expires = self.clock() + self.ttl if self.ttl is not None else float('inf')
+        with self.lock:
+            query_key = self.get_query_key(query)
+            for key, obj in objects.items():
+                entry_key = (query_key, lookup_field.name, key)
+                self.entries[entry_key] = (expires, obj)
+                self.entries.move_to_end(entry_key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def get_query_key(self, query: QueryLike) -> QueryKey:
+        """Get a key identifying the rows of `query`, its model with its SQL and parameters.
+
+        The peewee queries can't be used as keys: they compare by identity, and a query narrowed
+        with `where` keeps the hash of the query it was cloned from.
+
+        Returns:
+            QueryKey: The key.
+        """
+        entry = self.query_keys.get(id(query))
+        if entry is None:
+            model = getattr(query, 'model', query)
+            sql, params = cast(Tuple[str, List[object]], cast(peewee.Select, query.select()).sql())
+            query_key: QueryKey = (model, sql, tuple(params))
+            try:
+                hash(query_key)
+            except TypeError:
+                query_key = (model, sql, repr(params))
+            if len(self.query_keys) >= self.max_size:
+                self.query_keys.clear()
+            entry = (query, query_key)
+            self.query_keys[id(query)] = entry
+        return entry[1]
+
+    def invalidate(self, model: Optional[object] = None, value: Optional[object] = None):
+        """Drop cached objects, e.g. after they have been modified.
+
+        Args:
+            model (Optional[object]): Only drop the objects of this model.
+            value (Optional[object]): Only drop the objects with this normalized lookup value.
+        """
+        with self.lock:
+            for entry_key in list(self.entries):
+                (query_model, _, _), _, key = entry_key
+                if model is not None and query_model is not model:
+                    continue
+                if value is not None and key != value:
+                    continue
+                del self.entries[entry_key]  # noqa: WPS420
+
+
+# The lookup cache of the current validation session, see `LookupCache`.
+lookup_cache: ContextVar[Optional[LookupCache]] = ContextVar('lookup_cache', default=None)
+
+
+def fetch_related(query: QueryLike, lookup_field: LookupField, values: Iterable[object]) -> Dict[object, Optional[object]]:
+    """Fetch the objects of `query` whose `lookup_field` is one of `values`.
+
+    The values are sent in chunks of `MAX_IN_VALUES`, using one `IN` query per chunk. The objects
+    found in the current `LookupCache` aren't fetched again.
+
+    Returns:
+        Dict[object, Optional[object]]: The object for each normalized value, or None if it doesn't exist.
+    """
+    related: Dict[object, Optional[object]] = {}
+    for value in values:
+        key = normalize_lookup_value(lookup_field, value)
+        if key is not None:
+            related[key] = None
+
+    cache = lookup_cache.get()
+    if cache is not None:
+        related.update(cache.get_many(query, lookup_field, related))
+
+    field = cast(peewee.Field, lookup_field)
+    keys = [key for key, obj in related.items() if obj is None]
+    for start in range(0, len(keys), MAX_IN_VALUES):
+        # query could be a query like "User.select()" or a model like "User"
+        # so ".select().where()" handles both cases.
+        chunk = query.select().where(field.in_(keys[start : start + MAX_IN_VALUES]))  # noqa: E203
+        fetched = {obj.__data__.get(lookup_field.name): obj for obj in cast(Iterable[ModelLike], chunk)}  # noqa: WPS609
+        related.update(fetched)
+        if cache is not None:
+            cache.set_many(query, lookup_field, fetched)
+
+    return related
+
+
+class ValidationObserver:
+    """Receives the duration of each step of the validations run inside its `with` block.
+
+    The steps are the coercion of a field, each of its validators, the `clean_<field>` methods,
+    `clean`, and the unique index checks of a model validator. Without an observer, the
+    validations only pay for a context variable lookup per row.
+
+    Subclasses implement `record`, see `outcome.peewee_validates.timing.TimingObserver`.
+    """
+
+    def __enter__(self) -> ValidationObserver:
+        enter_context(self, validation_observer, self)
+        return self
+
+    def __exit__(self, *exc_info: object):
+        exit_context(self, validation_observer)
+
+    def record(self, name: str, step: str, duration: float, error: Optional[str]):
+        """Called after each step of a validation.
+
+        Args:
+            name (str): The name of the field, or `__base__` for `clean` and the index checks.
+            step (str): `coerce`, the name of a validator, `clean_<field>`, `clean`, `index_validation`
+                or `unique_validation`. A field overriding `Field.validate` is reported as a single `validate` step.
+            duration (float): The duration of the step, in seconds.
+            error (Optional[str]): The key of the error raised by the step, or the name of the exception, None if it passed.
+        """
+
+
+# The observer of the current validations, see `ValidationObserver`.
+validation_observer: ContextVar[Optional[ValidationObserver]] = ContextVar('validation_observer', default=None)
+
+
+def call_observed(observer: ValidationObserver, name: str, step: str, fn: Callable[..., V], *args: object) -> V:
+    error: Optional[str] = None
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    except ValidationError as err:
+        error = err.key
+        raise
+    except Exception as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        observer.record(name, step, time.perf_counter() - start, error)
+
+
+class QueryLog:
+    """Records the SQL statements run by the validations inside its `with` block.
+
+    The statements are the ones peewee logs from `Database.execute_sql`, see `QueryRecorder`, so
+    databases overriding the method are seen too. A log nested in another one also records into
+    its parent.
+    """
+
+    def __init__(self):
+        self.queries: List[Tuple[str, object]] = []
+
+    def __enter__(self) -> QueryLog:
+        query_recorder.acquire()
+        logs = query_log.get()
+        enter_context(self, query_log, logs if self in logs else (*logs, self))
+        return self
+
+    def __exit__(self, *exc_info: object):
+        exit_context(self, query_log)
+        query_recorder.release()
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def record(self, sql: str, params: object):
+        self.queries.append((sql, params))
+
+
+# The query logs of the current validation, innermost last, see `QueryLog`.
+query_log: ContextVar[Tuple[QueryLog, ...]] = ContextVar('query_log', default=())
+
+
+class QueryRecorder(logging.Filter):
+    """Records the statements logged by peewee into the current `QueryLog`.
+
+    The filter is added to the `peewee` logger while any log is in use, and the logger is lowered to
+    DEBUG meanwhile. The records under the level the logger had before are dropped by the filter, so
+    the handlers see the same records as without it.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self.logger = logger
+        self.users = 0
+        self.level = logging.NOTSET
+        self.effective_level = logging.NOTSET
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: A003
+        message: object = record.msg
+        if isinstance(message, tuple):
+            sql, params = cast(Tuple[str, object], message)
+            for log in query_log.get():
+                log.record(sql, params)
+        return record.levelno >= self.effective_level
+
+    def acquire(self):
+        with self.lock:
+            if not self.users:
+                self.level = self.logger.level
+                self.effective_level = self.logger.getEffectiveLevel()
+                self.logger.addFilter(self)
+                self.logger.setLevel(logging.DEBUG)
+            self.users += 1
+
+    def release(self):
+        with self.lock:
+            self.users -= 1
+            if not self.users:
+                self.logger.setLevel(self.level)
+                self.logger.removeFilter(self)
+
+
+query_recorder = QueryRecorder(logging.getLogger('peewee'))
+
+
+class QueryBudgetExceeded(Exception):  # noqa: N818
+    """A validation ran more queries than the `max_queries` of its validator."""
+
+    def __init__(self, max_queries: int, queries: Sequence[Tuple[str, object]]):
+        statements = ''.join(f'\n  {sql}' for sql, _ in queries)
+        super().__init__(f'{len(queries)} queries run, the budget is {max_queries}:{statements}')
+        self.max_queries = max_queries
+        self.queries = queries
+
+
+def describe_validator(fn: object) -> str:
+    """Name a validator for the observers, e.g. `length_validator` or `function_validator(is_even)`.
+
+    Args:
+        fn (object): The validator.
+
+    Returns:
+        str: The name.
+    """
+    name = getattr(fn, '__name__', None) or type(fn).__name__
+    code = getattr(fn, '__code__', None)
+    if code is not None and 'method' in code.co_freevars:
+        method = getattr(fn, '__closure__')[code.co_freevars.index('method')].cell_contents  # noqa: B009
+        name = f'{name}({getattr(method, "__name__", method)})'
+    return name
+
+
 V = TypeVar('V')
 
 DefaultFactory = Callable[[], object]
@@ -442,7 +1038,69 @@ def combine_validators(default_validators: Validators[T], additional_validators:
     return [*default_validators, *(additional_validators or [])]
 
 
+# The ISO 8601 forms parsed by `parse_iso_datetime`, `parse_iso_date` and `parse_iso_time`. The grammar of
+# `fromisoformat` grew in Python 3.11 (basic and week dates, any number of fraction digits...), the strings
+# are matched first so every version accepts the forms of Python 3.8, plus the `Z` suffix.
+ISO_TIME_PATTERN = r'[0-9]{2}(?::[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?)?'
+ISO_OFFSET_PATTERN = r'(?:[Zz]|[+-][0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{6})?)?)?'
+ISO_DATETIME_REGEX = re.compile(rf'[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}(?:[Tt ]{ISO_TIME_PATTERN}{ISO_OFFSET_PATTERN})?')
+ISO_TIME_REGEX = re.compile(f'{ISO_TIME_PATTERN}{ISO_OFFSET_PATTERN}')
+
+
+def parse_iso_datetime(value: object) -> Optional[datetime.datetime]:
+    """Parse an ISO 8601 datetime, including the `Z` suffix and UTC offsets.
+
+    The accepted forms are `YYYY-MM-DD[THH[:MM[:SS[.fff[fff]]]][+HH:MM[:SS[.ffffff]]]]`, with a `T` or a space
+    between the date and the time, and `Z` for a UTC offset of zero.
+
+    Returns:
+        Optional[datetime.datetime]: The datetime, or None if `value` isn't an ISO 8601 string.
+    """
+    if not isinstance(value, str) or not ISO_DATETIME_REGEX.fullmatch(value):
+        return None
+    if value[-1:] in {'Z', 'z'}:
+        value = f'{value[:-1]}+00:00'
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def parse_iso_date(value: object) -> Optional[datetime.date]:
+    parsed = parse_iso_datetime(value)
+    return parsed.date() if parsed else None
+
+
+def parse_iso_time(value: object) -> Optional[datetime.time]:
+    if isinstance(value, str) and ISO_TIME_REGEX.fullmatch(value):
+        time_value = f'{value[:-1]}+00:00' if value[-1:] in {'Z', 'z'} else value
+        try:
+            # Like the times parsed by dateutil, the result is naive.
+            return datetime.time.fromisoformat(time_value).replace(tzinfo=None)
+        except ValueError:
+            return None
+    parsed = parse_iso_datetime(value)
+    return parsed.time() if parsed else None
+
+
+class BoundField(Generic[T]):
+    """The state of a field during a single validation, passed to the validators as `field`.
+
+    The fields are shared by every validation of a validator class, so they
+    never hold the value being validated themselves.
+    """
+
+    __slots__ = ('field', 'name', value_const)
+
+    def __init__(self, field: Field[T], name: str, value: Optional[object]):
+        self.field = field
+        self.name = name
+        self.value = value
+
+
 class Field(Generic[T]):
+    # `value` and `name` are only kept so a field can be passed directly to a validator function,
+    # they are not set when validating.
     __slots__ = (value_const, 'name', required_const, default_const, validators_const)
 
     name: Optional[str]
@@ -482,13 +1140,43 @@ class Field(Generic[T]):
             return default
         return None
 
-    def validate(self, name: str, data: Data, ctx: Optional[T]):
-        self.value = self.get_value(name, data)
-        self.name = name
-        if self.value is not None:
-            self.value = self.coerce(self.value)
+    def validate(self, name: str, data: Data, ctx: Optional[T]) -> Optional[object]:
+        """Validate the value of the field in `data`.
+
+        The field isn't modified, so it can be used by concurrent validations. In particular `self.value`
+        and `self.name` are not set: a subclass overriding `validate` must use the value returned by
+        `super().validate()` and return its own result, which is the value stored in the validated data.
+
+        Args:
+            name (str): The name of the field.
+            data (Data): The data being validated.
+            ctx (Optional[T]): The validation context.
+
+        Returns:
+            Optional[object]: The validated value.
+        """
+        value = self.get_value(name, data)
+        if value is not None:
+            value = self.coerce(value)
+        if not self.validators:
+            return value
+
+        bound = BoundField(self, name, value)
+        for method in self.validators:
+            method(bound, data, ctx)
+        return bound.value
+
+    def validate_observed(self, name: str, data: Data, ctx: Optional[T], observer: ValidationObserver) -> Optional[object]:
+        """Validate the value of the field in `data`, reporting the duration of each step to `observer`."""
+        if type(self).validate is not Field.validate:
+            return call_observed(observer, name, 'validate', self.validate, name, data, ctx)
+
+        bound = BoundField(self, name, self.get_value(name, data))
+        if bound.value is not None:
+            bound.value = call_observed(observer, name, 'coerce', self.coerce, bound.value)
         for method in self.validators:
-            method(self, data, ctx)
+            call_observed(observer, name, describe_validator(method), method, bound, data, ctx)
+        return bound.value
 
 
 class StringField(Field[T]):
@@ -597,7 +1285,7 @@ class DecimalField(Field[T]):
 
 
 class DateField(Field[T]):
-    __slots__ = (value_const, required_const, default_const, validators_const)
+    __slots__ = (value_const, required_const, default_const, validators_const, 'iso_only')
 
     def __init__(
         self,
@@ -606,6 +1294,7 @@ class DateField(Field[T]):
         high: Optional[datetime.date] = None,
         default: Optional[Default] = None,
         validators: Optional[Validators[T]] = None,
+        iso_only: bool = False,
     ):
         default_validators: Validators[T]
 
@@ -614,11 +1303,21 @@ class DateField(Field[T]):
         else:
             default_validators = []
 
+        # Reject the strings that are not in an ISO 8601 format instead of trying to parse them with dateutil
+        self.iso_only = iso_only
+
         super().__init__(required=required, default=default, validators=combine_validators(default_validators, validators))
 
     def coerce(self, value: Optional[object]) -> Optional[datetime.date]:  # type: ignore
         if not value or isinstance(value, datetime.date):
             return value
+
+        parsed = parse_iso_date(value)
+        if parsed is not None:
+            return parsed
+        if self.iso_only:
+            raise ValidationError('coerce_date')
+
         try:
             return dateutil_parse(value).date()  # type: ignore
         except (TypeError, ValueError):
@@ -626,7 +1325,7 @@ class DateField(Field[T]):
 
 
 class TimeField(Field[T]):
-    __slots__ = (value_const, required_const, default_const, validators_const)
+    __slots__ = (value_const, required_const, default_const, validators_const, 'iso_only')
 
     def __init__(
         self,
@@ -635,6 +1334,7 @@ class TimeField(Field[T]):
         high: Optional[datetime.time] = None,
         default: Optional[Default] = None,
         validators: Optional[Validators[T]] = None,
+        iso_only: bool = False,
     ):
         default_validators: Validators[T]
 
@@ -643,11 +1343,21 @@ class TimeField(Field[T]):
         else:
             default_validators = []
 
+        # Reject the strings that are not in an ISO 8601 format instead of trying to parse them with dateutil
+        self.iso_only = iso_only
+
         super().__init__(required=required, default=default, validators=combine_validators(default_validators, validators))
 
     def coerce(self, value: Optional[object]) -> Optional[datetime.time]:  # type: ignore
         if not value or isinstance(value, datetime.time):
             return value
+
+        parsed = parse_iso_time(value)
+        if parsed is not None:
+            return parsed
+        if self.iso_only:
+            raise ValidationError('coerce_time')
+
         try:
             return dateutil_parse(value).time()  # type: ignore
         except (TypeError, ValueError):
@@ -655,7 +1365,7 @@ class TimeField(Field[T]):
 
 
 class DateTimeField(Field[T]):
-    __slots__ = (value_const, required_const, default_const, validators_const)
+    __slots__ = (value_const, required_const, default_const, validators_const, 'iso_only')
 
     def __init__(
         self,
@@ -664,6 +1374,7 @@ class DateTimeField(Field[T]):
         high: Optional[datetime.datetime] = None,
         default: Optional[Default] = None,
         validators: Optional[Validators[T]] = None,
+        iso_only: bool = False,
     ):
         default_validators: Validators[T]
 
@@ -672,11 +1383,21 @@ class DateTimeField(Field[T]):
         else:
             default_validators = []
 
+        # Reject the strings that are not in an ISO 8601 format instead of trying to parse them with dateutil
+        self.iso_only = iso_only
+
         super().__init__(required=required, default=default, validators=combine_validators(default_validators, validators))
 
     def coerce(self, value: Optional[object]) -> Optional[datetime.datetime]:  # type: ignore
         if not value or isinstance(value, datetime.datetime):
             return value
+
+        parsed = parse_iso_datetime(value)
+        if parsed is not None:
+            return parsed
+        if self.iso_only:
+            raise ValidationError('coerce_datetime')
+
         try:
             return dateutil_parse(value)  # type: ignore
         except (TypeError, ValueError):
@@ -721,13 +1442,42 @@ class ModelChoiceField(Field[M]):
     def coerce(self, value: object) -> Any:  # type: ignore
         return coerce_single_instance(self.lookup_field, value)
 
-    def validate(self, name: str, data: Data, ctx: Optional[M] = None):
-        super().validate(name, data, ctx)
-        if self.value is not None:
-            try:
-                self.value = self.query.get(self.lookup_field == self.value)
-            except (AttributeError, ValueError, peewee.DoesNotExist):
-                raise ValidationError('related', field=self.lookup_field.name, values=self.value)
+    def prefetch(self, values: Iterable[object]) -> Dict[object, Optional[object]]:
+        """Fetch the related objects for all the `values` with a single query per chunk of values.
+
+        Args:
+            values (Iterable[object]): The lookup values.
+
+        Returns:
+            Dict[object, Optional[object]]: The related object for each normalized value, or `None` if it doesn't exist.
+        """
+        return fetch_related(self.query, self.lookup_field, values)
+
+    def validate(self, name: str, data: Data, ctx: Optional[M] = None) -> Optional[object]:
+        value = super().validate(name, data, ctx)
+        if value is None:
+            return None
+
+        # During a batch validation, the related objects have already been fetched.
+        prefetched = get_batch_lookup(self)
+        if prefetched is not None:
+            key = normalize_lookup_value(self.lookup_field, value)
+            if key is not None and key in prefetched:
+                related = prefetched[key]
+                if related is None:
+                    raise ValidationError('related', field=self.lookup_field.name, values=value)
+                return related
+
+        if lookup_cache.get() is not None:
+            related = fetch_related(self.query, self.lookup_field, [value]).get(normalize_lookup_value(self.lookup_field, value))
+            if related is None:
+                raise ValidationError('related', field=self.lookup_field.name, values=value)
+            return related
+
+        try:
+            return self.query.get(self.lookup_field == value)
+        except (AttributeError, ValueError, peewee.DoesNotExist):
+            raise ValidationError('related', field=self.lookup_field.name, values=value)
 
 
 class ManyModelChoiceField(Field[M]):
@@ -747,16 +1497,58 @@ class ManyModelChoiceField(Field[M]):
             value = cast(Sequence[object], value)
         return [coerce_single_instance(self.lookup_field, v) for v in value]
 
-    def validate(self, name: str, data: Data, ctx: Optional[M] = None):
-        super().validate(name, data, ctx)
-        if self.value is not None and isinstance(self.value, Sequence):
-            value = cast(Sequence[object], self.value)
-            try:
-                # self.query could be a query like "User.select()" or a model like "User"
-                # so ".select().where()" handles both cases.
-                self.value = [self.query.select().where(self.lookup_field == v).get() for v in value if v]
-            except (AttributeError, ValueError, peewee.DoesNotExist):
-                raise ValidationError('related', field=self.lookup_field.name, values=value)
+    def prefetch(self, values: Iterable[object]) -> Dict[object, Optional[object]]:
+        """Fetch the related objects for all the `values`, see `ModelChoiceField.prefetch`."""
+        return fetch_related(self.query, self.lookup_field, values)
+
+    def validate(self, name: str, data: Data, ctx: Optional[M] = None) -> Optional[object]:
+        value = super().validate(name, data, ctx)
+        if value is not None and isinstance(value, Sequence):
+            values = [v for v in cast(Sequence[object], value) if v]
+
+            # Only fetch the values that haven't been prefetched.
+            related: Dict[object, Optional[object]] = get_batch_lookup(self) or {}
+            unresolved = [v for v in values if normalize_lookup_value(self.lookup_field, v) not in related]
+            if unresolved:
+                related = {**related, **fetch_related(self.query, self.lookup_field, unresolved)}
+
+            # Keep the order and the duplicates of the input values.
+            resolved: List[object] = []
+            missing: List[object] = []
+            for v in values:
+                key = normalize_lookup_value(self.lookup_field, v)
+                obj = related.get(key) if key is not None else None
+                if obj is None:
+                    missing.append(v)
+                else:
+                    resolved.append(obj)
+
+            if missing:
+                raise ValidationError('related', field=self.lookup_field.name, values=missing)
+            return resolved
+
+        return value
+
+
+def database_cost(field: Field[Any]) -> int:
+    """Rank the fields by the queries needed to validate them.
+
+    Returns:
+        int: 2 if the field always queries the database, 1 if it only does after its other validators
+            passed, 0 if it never does.
+    """
+    if isinstance(field, (ModelChoiceField, ManyModelChoiceField)):
+        return 2
+    return int(any(isinstance(validator, ModelUniqueValidator) for validator in field.validators))
+
+
+def queries_database(field: Field[Any]) -> bool:
+    """Whether validating `field` can query the database."""
+    return database_cost(field) > 0
+
+
+class ErrorLimitReached(Exception):  # noqa: N818
+    """Stops the validation of a row once it has as many errors as allowed."""
 
 
 class ValidatorOptions(Generic[T]):
@@ -764,96 +1556,655 @@ class ValidatorOptions(Generic[T]):
     fields: Dict[str, Field[T]]
     only: Iterable[str]
     exclude: Iterable[str]
+    combine_unique_checks: bool
+    compile_fields: bool
+    compiled: Dict[Tuple[str, ...], Callable[..., None]]
 
     def __init__(self, obj: object):
         self.fields = {}
         self.messages = {}
         self.only = []
         self.exclude = []
+        # Run the unique field and unique index checks of a model validator in a single query,
+        # after the fields have been cleaned.
+        self.combine_unique_checks = False
+        # Validate the fields with a generated function, see `outcome.peewee_validates.codegen`.
+        self.compile_fields = False
+        self.compiled = {}
+        # `DEFAULT_MESSAGES` merged with `messages` by `BaseValidator.compile_options`, and the resolved messages.
+        self.message_table: Dict[str, str] = dict(DEFAULT_MESSAGES)
+        self.resolved_messages: Dict[Tuple[str, str], str] = {}
+        # Stop validating a row after its first error, or after `max_errors` errors. The fields that query
+        # the database are then validated last.
+        self.fail_fast = False
+        self.max_errors: Optional[int] = None
+        # Record the queries run by `validate` and `save` into the `queries` of the validator, and raise
+        # `QueryBudgetExceeded` (or log a warning, with 'log') when there are more than `max_queries`.
+        self.count_queries = False
+        self.max_queries: Optional[int] = None
+        self.query_budget_action = 'raise'
+        # Only validate again the fields of a model validator whose input changed since its last validation,
+        # see `ModelValidator.check_row_incremental`.
+        self.incremental = False
+        # The other fields read by the validators of each field, if any, filled by `ModelValidator.compile_model_options`.
+        self.dependencies: Dict[str, Set[str]] = {}
+
+    @property
+    def error_limit(self) -> Optional[int]:
+        return 1 if self.fail_fast else self.max_errors
+
+    def resolve_message(self, name: str, key: str) -> str:
+        """Get the message of an error, the messages of a field take precedence over the messages of a key.
+
+        Args:
+            name (str): The name of the field.
+            key (str): The key of the error.
+
+        Returns:
+            str: The message, before formatting.
+        """
+        message = self.resolved_messages.get((name, key))
+        if message is None:
+            table = self.message_table
+            message = table.get(f'{name}.{key}') or table.get(key) or 'Validation failed.'
+            self.resolved_messages[(name, key)] = message
+        return message
+
+    def copy(self) -> ValidatorOptions[T]:
+        options = ValidatorOptions[T](self)
+        options.__dict__.update(self.__dict__)  # noqa: WPS609
+        options.fields = dict(self.fields)
+        options.compiled = {}
+        options.dependencies = {}
+        return options
+
+
+FieldList = List[Tuple[str, Field[T]]]
+DEFAULT_CHUNK_SIZE = 500
+# The key and the arguments of an error, its message is rendered when it's read. A None key holds
+# an already rendered message.
+ErrorRecord = Tuple[Optional[str], Mapping[str, object]]
+
+
+class ErrorMessages(Mapping[str, str]):
+    """The error messages of a validated row, keyed by field name, rendered when they are first read.
+
+    Args:
+        records (Dict[str, ErrorRecord]): The errors of the row.
+        render (Callable[[str, Optional[str], Mapping[str, object]], str]): Renders the message of an error.
+    """
+
+    __slots__ = ('records', 'render', 'rendered')
+
+    def __init__(self, records: Dict[str, ErrorRecord], render: Callable[[str, Optional[str], Mapping[str, object]], str]):
+        self.records = records
+        self.render = render
+        self.rendered: Dict[str, str] = {}
+
+    def __getitem__(self, name: str) -> str:
+        message = self.rendered.get(name)
+        if message is None:
+            key, kwargs = self.records[name]
+            message = self.render(name, key, kwargs)
+            self.rendered[name] = message
+        return message
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ErrorDict(Dict[str, str]):
+    """The rendered error messages of a validator, the messages written to it are added to its errors.
+
+    Args:
+        records (Dict[str, ErrorRecord]): The errors of the validator, updated on write.
+        messages (Dict[str, str]): The rendered messages of `records`.
+    """
+
+    __slots__ = ('records',)
+
+    def __init__(self, records: Dict[str, ErrorRecord], messages: Dict[str, str]):
+        super().__init__(messages)
+        self.records = records
+
+    def __setitem__(self, name: str, message: str):
+        super().__setitem__(name, message)
+        self.records[name] = (None, {'message': message})
+
+    def __delitem__(self, name: str):
+        super().__delitem__(name)
+        self.records.pop(name, None)
+
+    def __ior__(self, other: Any) -> 'ErrorDict':  # type: ignore
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: str):  # type: ignore
+        for name, message in dict(*args, **kwargs).items():
+            self[name] = message
+
+    def setdefault(self, name: str, default: str) -> str:  # type: ignore
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def pop(self, name: str, *default: Any) -> Any:  # type: ignore
+        self.records.pop(name, None)
+        return super().pop(name, *default)
+
+    def popitem(self) -> Tuple[str, str]:
+        name, message = super().popitem()
+        self.records.pop(name, None)
+        return name, message
+
+    def clear(self):
+        super().clear()
+        self.records.clear()
+
+
+ValidationResult = Tuple[bool, Dict[str, object], ErrorMessages]
+# The data and the errors of fields that have already been validated.
+FieldResults = Tuple[Dict[str, object], Dict[str, ErrorRecord]]
+# A batched database lookup, with the field or validator consuming its result.
+Lookup = Tuple[object, Callable[[], Any]]
+# Runs a blocking function without blocking the event loop, e.g. in a thread.
+AsyncRunner = Callable[[Callable[[], Any]], Awaitable[Any]]
+
+
+def run_connected(fn: Callable[[], Any], databases: Sequence[peewee.Database]) -> Any:
+    with ExitStack() as stack:
+        for database in databases:
+            stack.enter_context(database.connection_context())
+        return fn()
+
+
+async def run_in_thread(fn: Callable[[], Any], databases: Sequence[peewee.Database] = ()) -> Any:
+    """Run a blocking function in the default executor of the running loop.
+
+    The connections of peewee are per thread, so a connection to each of `databases` is opened
+    for the call and closed afterwards, instead of being left open in the executor thread.
+    An in-memory SQLite database is empty in the other threads, use a runner calling `fn` inline.
+
+    Args:
+        fn (Callable[[], Any]): The function.
+        databases (Sequence[peewee.Database]): The databases queried by the function.
+
+    Returns:
+        Any: The result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, copy_context().run, partial(run_connected, fn, databases))
+
+
+# Guards the per-model caches of the model validators, which can be filled from several threads.
+model_options_lock = threading.Lock()
 
 
 class BaseValidator(Generic[T]):
-    """A validator class. Can have many fields attached to it to perform validation on data."""
+    """A validator class. Can have many fields attached to it to perform validation on data.
+
+    The fields and options of a validator class are shared and can be used by concurrent
+    validations. An instance holds the result of its last validation, so each thread should
+    use its own instance, they are cheap to create.
+    """
 
     class Meta:
         pass
 
-    __slots__ = ('data', 'errors', '_meta', 'ctx')
+    __slots__ = ('data', 'error_records', 'rendered_errors', '_meta', 'ctx', 'queries')
 
     data: Dict[str, object]
-    errors: Dict[str, str]
+    error_records: Dict[str, ErrorRecord]
+    rendered_errors: Optional[ErrorDict]
     ctx: Optional[T]
+    # The queries run by the last `validate` or `save`, if the validator counts them.
+    queries: List[Tuple[str, object]]
 
     def __init__(self):
         self.errors = {}
         self.data = {}
+        self.queries = []
 
         # Sometimes a subclass has already set context
         if not hasattr(self, 'ctx'):  # noqa: WPS421
             self.ctx = None
 
-        self._meta = ValidatorOptions[T](self)
-        self._meta.__dict__.update(self.Meta.__dict__)  # noqa: WPS609
+        # The options are shared by every instance of the class, they must not be mutated.
+        self._meta = self.get_options()
 
         self.initialize_fields()
 
+    @classmethod
+    def get_options(cls) -> ValidatorOptions[T]:
+        """Return the options of the validator class, compiling them on first use.
+
+        The result is cached on the class itself, so each subclass compiles its own options
+        (including the fields it inherits) exactly once.
+
+        Returns:
+            ValidatorOptions[T]: The compiled options.
+        """
+        options = cls.__dict__.get('_compiled_options')
+        if options is None:
+            options = cls.compile_options()
+            cls._compiled_options = options  # noqa: WPS601
+        return cast(ValidatorOptions[T], options)
+
+    @classmethod
+    def compile_options(cls) -> ValidatorOptions[T]:
+        options = ValidatorOptions[T](cls)
+        options.__dict__.update(cls.Meta.__dict__)  # noqa: WPS609
+
+        for field in dir(cls):  # noqa: WPS421
+            obj = getattr(cls, field, None)
+            if isinstance(obj, Field):
+                options.fields[field] = obj
+
+        # An empty message falls back to the default one.
+        options.message_table = {**DEFAULT_MESSAGES, **{key: message for key, message in options.messages.items() if message}}
+        options.resolved_messages = {}
+
+        return options
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """The messages of the errors of the last validation, keyed by field name.
+
+        The messages are rendered when the errors are first read after a validation. A message
+        written to the dict is added to the errors, e.g. by `clean`, and fails the validation.
+        """
+        rendered = self.rendered_errors
+        if rendered is None:
+            records = self.error_records
+            rendered = ErrorDict(records, {name: self.render_error(name, key, kwargs) for name, (key, kwargs) in records.items()})
+            self.rendered_errors = rendered
+        return rendered
+
+    @errors.setter
+    def errors(self, errors: Mapping[str, str]):
+        self.error_records = {name: (None, {'message': message}) for name, message in errors.items()}
+        self.rendered_errors = None
+
+    def error_messages(self) -> ErrorMessages:
+        """The errors of the last validation, rendered only when they are read, unlike `errors`.
+
+        Returns:
+            ErrorMessages: The messages, keyed by field name.
+        """
+        return ErrorMessages(self.error_records, self.render_error)
+
     def add_error(self, name: str, error: ValidationError):
-        message = self._meta.messages.get(f'{name}.{error.key}')
-        if not message:
-            message = self._meta.messages.get(error.key)
-        if not message:
-            message = DEFAULT_MESSAGES.get(error.key, 'Validation failed.')
-        self.errors[name] = message.format(**error.kwargs)
+        self.error_records[name] = (error.key, error.kwargs)
+        self.rendered_errors = None
+
+    def format_error(self, name: str, error: ValidationError) -> str:
+        return self.render_error(name, error.key, error.kwargs)
+
+    def render_error(self, name: str, key: Optional[str], kwargs: Mapping[str, object]) -> str:
+        if key is None:
+            return str(kwargs['message'])
+        return self._meta.resolve_message(name, key).format(**kwargs)
 
     def initialize_fields(self):
-        for field in dir(self):  # noqa: WPS421
-            obj = getattr(self, field)
-            if isinstance(obj, Field):
-                self._meta.fields[field] = obj
+        """Bind instance-specific fields, the declared fields are compiled once per class by `get_options`."""
 
-    def validate(  # noqa: WPS231
+    def validate(
         self,
         data: Optional[Data] = None,
         ctx: Optional[T] = None,
         only: Optional[Iterable[str]] = None,
         exclude: Optional[Iterable[str]] = None,
     ):
+        return self.run_counted(partial(self.validate_row, self.select_fields(only, exclude), data or {}, ctx))
+
+    def run_counted(self, fn: Callable[[], V]) -> V:
+        """Run `validate` or `save`, recording its queries if the validator counts them.
+
+        Args:
+            fn (Callable[[], V]): The call.
+
+        Raises:
+            QueryBudgetExceeded: If the call ran more than `max_queries` queries.
+
+        Returns:
+            V: The result of the call.
+        """
+        meta = self._meta
+        if not meta.count_queries and meta.max_queries is None:
+            return fn()
+
+        log = QueryLog()
+        try:
+            with log:
+                result = fn()
+        finally:
+            self.queries = log.queries
+        self.check_query_budget()
+        return result
+
+    def check_query_budget(self):
+        max_queries = self._meta.max_queries
+        if max_queries is None or len(self.queries) <= max_queries:
+            return
+        if self._meta.query_budget_action == 'log':
+            logger.warning('%s ran %d queries, the budget is %d', type(self).__name__, len(self.queries), max_queries)
+        else:
+            raise QueryBudgetExceeded(max_queries, self.queries)
+
+    async def avalidate(
+        self,
+        data: Optional[Data] = None,
+        ctx: Optional[T] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        runner: Optional[AsyncRunner] = None,
+    ) -> bool:
+        """Validate `data` without blocking the event loop.
+
+        The database lookups are started together and awaited concurrently through `runner`,
+        the other validators run inline. The result is the same as with `validate`.
+
+        Args:
+            data (Optional[Data]): The data to validate.
+            ctx (Optional[T]): The context passed to the field validators.
+            only (Optional[Iterable[str]]): Only validate these fields.
+            exclude (Optional[Iterable[str]]): Don't validate these fields.
+            runner (Optional[AsyncRunner]): Runs a blocking lookup, defaults to `run_in_thread` with the
+                databases of the validator.
+
+        Returns:
+            bool: Whether the data is valid.
+        """
+        runner = runner or partial(run_in_thread, databases=self.get_databases())
+        return await self.avalidate_row(self.select_fields(only, exclude), data or {}, ctx, runner)
+
+    async def avalidate_row(self, fields: FieldList[T], data: Data, ctx: Optional[T], runner: AsyncRunner) -> bool:
+        row = self.prepare_row(fields, data, ctx)
+        lookups = await self.aprefetch(fields, [row], runner)
+
+        token = batch_lookups.set(lookups)
+        try:
+            return self.check_row(fields, row, ctx)
+        finally:
+            batch_lookups.reset(token)
+
+    async def aprefetch(self, fields: FieldList[T], rows: Sequence[Data], runner: AsyncRunner) -> Dict[object, Any]:
+        lookups = self.get_lookups(fields, rows)
+        results = await asyncio.gather(*(runner(lookup) for _, lookup in lookups))
+        return {consumer: result for (consumer, _), result in zip(lookups, results)}
+
+    def validate_many(
+        self,
+        rows: Iterable[Data],
+        ctx: Optional[T] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ValidationResult]:
+        """Validate each row of `rows`, reusing the validator and its fields.
+
+        The results are yielded lazily as `(ok, data, errors)` tuples. Each row gets its own
+        `data` dict and `errors` mapping, so they can be kept after the iteration moves on. The
+        error messages are only rendered when they are read, `dict(errors)` renders them all.
+
+        The rows are validated in chunks of `chunk_size`, and the database lookups of each
+        chunk are batched, e.g. the related objects of a `ModelChoiceField` are fetched
+        with a single `IN` query per chunk.
+
+        Args:
+            rows (Iterable[Data]): The rows to validate.
+            ctx (Optional[T]): The context passed to the field validators.
+            only (Optional[Iterable[str]]): Only validate these fields.
+            exclude (Optional[Iterable[str]]): Don't validate these fields.
+            chunk_size (int): The number of rows validated per chunk.
+
+        Yields:
+            ValidationResult: The result for each row, in order.
+        """
+        fields = self.select_fields(only, exclude)
+        iterator = iter(rows)
+
+        while True:  # noqa: WPS457
+            chunk = [self.prepare_row(fields, row, ctx) for row in islice(iterator, chunk_size)]
+            if not chunk:
+                return
+
+            token = batch_lookups.set(self.prefetch(fields, chunk))
+            try:
+                results = [(self.check_row(fields, row, ctx), self.data, self.error_messages()) for row in chunk]
+            finally:
+                batch_lookups.reset(token)
+
+            yield from results
+
+    def prefetch(self, fields: FieldList[T], rows: Sequence[Data]) -> Dict[object, Any]:
+        """Run the batched database lookups for a chunk of rows.
+
+        Args:
+            fields (FieldList[T]): The fields being validated.
+            rows (Sequence[Data]): The chunk of rows.
+
+        Returns:
+            Dict[object, Any]: The prefetched values, keyed by the field or validator that consumes them.
+        """
+        return {consumer: lookup() for consumer, lookup in self.get_lookups(fields, rows)}
+
+    def get_lookups(self, fields: FieldList[T], rows: Sequence[Data]) -> List[Lookup]:
+        """List the batched database lookups for a chunk of rows, without running them.
+
+        Args:
+            fields (FieldList[T]): The fields being validated.
+            rows (Sequence[Data]): The chunk of rows.
+
+        Returns:
+            List[Lookup]: The field or validator that consumes each lookup, with the function running it.
+        """
+        lookups: List[Lookup] = []
+        for name, field in fields:
+            if isinstance(field, (ModelChoiceField, ManyModelChoiceField)):
+                related = cast(Union[ModelChoiceField[Any], ManyModelChoiceField[Any]], field)
+                lookups.append((related, partial(related.prefetch, self.collect_values(name, related, rows))))
+        return lookups
+
+    def collect_values(self, name: str, field: Field[T], rows: Sequence[Data]) -> List[object]:
+        values: Dict[object, None] = {}
+        for row in rows:
+            value = row.get(name)
+            if value is None:
+                continue
+            try:
+                value = field.coerce(value)
+                # The values of a many-to-many field are looked up individually.
+                for item in cast(Iterable[object], value) if isinstance(field, ManyModelChoiceField) else (value,):
+                    values[item] = None
+            except (ValidationError, TypeError):
+                continue
+        return list(values)
+
+    def get_databases(self) -> List[peewee.Database]:
+        """List the databases queried by the related fields and the unique validators of the validator.
+
+        Returns:
+            List[peewee.Database]: The databases, without duplicates.
+        """
+        queries: List[object] = []
+        for field in self._meta.fields.values():
+            queries.extend(validator.queryset for validator in field.validators if isinstance(validator, ModelUniqueValidator))
+            if isinstance(field, (ModelChoiceField, ManyModelChoiceField)):
+                queries.append(field.query)
+
+        databases: List[peewee.Database] = []
+        for query in queries:
+            database = cast(peewee.Model, getattr(query, 'model', query))._meta.database  # noqa: WPS437
+            if database not in databases:
+                databases.append(database)
+        return databases
+
+    def select_fields(self, only: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> FieldList[T]:
         only = only or []
         exclude = exclude or []
-        data = data or {}
+        fields = [
+            (name, field)
+            for name, field in self._meta.fields.items()
+            if not (name in exclude or (only and name not in only))  # noqa: WPS337
+        ]
+        if self._meta.error_limit is not None:
+            # Run the cheap checks first, an invalid row may not need any query.
+            fields.sort(key=lambda item: database_cost(item[1]))
+        return fields
+
+    def validate_row(self, fields: FieldList[T], data: Data, ctx: Optional[T] = None) -> bool:
+        return self.check_row(fields, self.prepare_row(fields, data, ctx), ctx)
+
+    def prepare_row(self, fields: FieldList[T], data: Data, ctx: Optional[T] = None) -> Data:
+        return data
+
+    def validate_parallel(
+        self,
+        rows: Iterable[Data],
+        workers: Optional[int] = None,
+        ctx: Optional[T] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ValidationResult]:
+        """Validate each row of `rows` with a pool of processes.
+
+        Like `validate_many`, but the fields that don't query the database are validated by
+        `workers` processes. See `outcome.peewee_validates.parallel.validate_parallel`.
+
+        Args:
+            rows (Iterable[Data]): The rows to validate.
+            workers (Optional[int]): The number of processes, defaults to the number of CPUs.
+            ctx (Optional[T]): The context passed to the field validators.
+            only (Optional[Iterable[str]]): Only validate these fields.
+            exclude (Optional[Iterable[str]]): Don't validate these fields.
+            chunk_size (int): The number of rows sent to a process at once.
+
+        Returns:
+            Iterator[ValidationResult]: The result for each row, in order.
+        """
+        # Imported here as the parallel module depends on this one.
+        from outcome.peewee_validates.parallel import validate_parallel  # noqa: WPS433
+
+        return validate_parallel(self, rows, workers=workers, ctx=ctx, only=only, exclude=exclude, chunk_size=chunk_size)
+
+    def check_row(
+        self,
+        fields: FieldList[T],
+        data: Data,
+        ctx: Optional[T] = None,
+        validated: Optional[FieldResults] = None,
+    ) -> bool:
         self.errors = {}
         self.data = {}
 
-        # Validate individual fields.
-        for name, field in self._meta.fields.items():
-            if name in exclude or (only and name not in only):
-                continue
-            try:
-                field.validate(name, data, ctx)
-            except ValidationError as err:
-                self.add_error(name, err)
-                continue
-            self.data[name] = field.value
+        # Skip the fields that have already been validated, e.g. by another process.
+        if validated is not None:
+            self.data, self.error_records = dict(validated[0]), dict(validated[1])
+            fields = [(name, field) for name, field in fields if name not in self.data and name not in self.error_records]
+
+        self.check_fields(fields, data, ctx)
+        self.clean_row()
 
+        return not self.error_records
+
+    def clean_row(self):
+        """Clean the validated fields, then the whole data, if there's no error."""
         # Clean individual fields.
-        if not self.errors:
+        if not self.error_records:
             self.clean_fields(self.data)
 
         # Then finally clean the whole data dict.
-        if not self.errors:
+        if not self.error_records:
+            observer = validation_observer.get()
             try:
-                self.data = self.clean(self.data)
+                if observer is None:
+                    self.data = self.clean(self.data)
+                else:
+                    self.data = call_observed(observer, '__base__', 'clean', self.clean, self.data)
             except ValidationError as err:  # noqa: WPS440
                 self.add_error('__base__', err)
 
-        return not self.errors
+    def check_fields(self, fields: FieldList[T], data: Data, ctx: Optional[T] = None):
+        """Validate the individual fields of a row into `data` and `errors`, without cleaning it.
+
+        Args:
+            fields (FieldList[T]): The fields to validate.
+            data (Data): The row.
+            ctx (Optional[T]): The context passed to the field validators.
+        """
+        limit = self._meta.error_limit
+        if limit is not None and len(self.error_records) >= limit:
+            return
+
+        observer = validation_observer.get()
+        if observer is not None:
+            # The generated function can't report its steps, the fields are validated one by one instead.
+            for name, field in fields:
+                try:
+                    self.data[name] = field.validate_observed(name, data, ctx, observer)
+                except ValidationError as err:
+                    self.add_error(name, err)
+                    if limit is not None and len(self.error_records) >= limit:
+                        return
+        elif self._meta.compile_fields:
+            add_error = self.add_error
+            if limit is not None:
+                add_error = partial(self.add_limited_error, limit)
+            try:
+                self.get_compiled_fields(fields)(self.data, add_error, data, ctx)
+            except ErrorLimitReached:
+                return
+        else:
+            for name, field in fields:
+                try:
+                    self.data[name] = field.validate(name, data, ctx)
+                except ValidationError as err:
+                    self.add_error(name, err)
+                    if limit is not None and len(self.error_records) >= limit:
+                        return
+
+    def add_limited_error(self, limit: int, name: str, error: ValidationError):
+        self.add_error(name, error)
+        if len(self.error_records) >= limit:
+            raise ErrorLimitReached()
+
+    def error_limit_reached(self) -> bool:
+        limit = self._meta.error_limit
+        return limit is not None and len(self.error_records) >= limit
+
+    def get_compiled_fields(self, fields: FieldList[T]) -> Callable[..., None]:
+        key = tuple(name for name, _ in fields)
+        compiled = self._meta.compiled.get(key)
+        if compiled is None:
+            # Imported here as the codegen module depends on this one.
+            from outcome.peewee_validates.codegen import compile_fields  # noqa: WPS433
+
+            compiled = compile_fields(fields)
+            self._meta.compiled[key] = compiled
+        return compiled
 
     def clean_fields(self, data: Dict[str, object]):
+        observer = validation_observer.get()
         for name, value in data.items():
             try:
                 method = getattr(self, f'clean_{name}', None)
-                if method:
+                if method is None:
+                    continue
+                if observer is None:
                     self.data[name] = method(value)
+                else:
+                    self.data[name] = call_observed(observer, name, f'clean_{name}', method, value)
             except ValidationError as err:
                 self.add_error(name, err)
 
@@ -888,8 +2239,61 @@ class ModelLike(QueryLike):  # pragma: no cover
         ...
 
 
+# The input of a field that wasn't validated.
+UNSET = object()
+
+
+class IncrementalState:
+    """What a model validator remembers of its last validation, in incremental mode."""
+
+    __slots__ = ('pk', 'inputs', 'results', 'indexes')
+
+    def __init__(self, pk: object):
+        self.pk = pk
+        # The input of each field, and the data and errors of the fields before cleaning.
+        self.inputs: Dict[str, object] = {}
+        self.results: FieldResults = ({}, {})
+        # The values checked for each unique index, keyed by its columns, and whether they collided.
+        self.indexes: Dict[Tuple[str, ...], Tuple[Dict[str, object], bool]] = {}
+
+
+def copy_input(value: object) -> object:
+    # A container could be modified in place before the next validation.
+    if isinstance(value, (list, dict, set)):
+        return copy.copy(cast(object, value))
+    return value
+
+
+def same_input(previous: object, value: object) -> bool:
+    if previous is value:
+        return True
+    if type(previous) is not type(value):
+        return False
+    try:
+        return bool(previous == value)
+    except Exception:  # noqa: B902
+        return False
+
+
+def field_dependencies(field: Field[Any]) -> Set[str]:
+    """Get the other fields read by the validators of a field, as far as they're known.
+
+    Args:
+        field (Field[Any]): The field.
+
+    Returns:
+        Set[str]: The names of the fields, those of `validate_matches`.
+    """
+    names: Set[str] = set()
+    for fn in field.validators:
+        code = getattr(fn, '__code__', None)
+        if code is not None and getattr(fn, '__qualname__', '').startswith('validate_matches.'):
+            names.add(getattr(fn, '__closure__')[code.co_freevars.index('other')].cell_contents)  # noqa: B009
+    return names
+
+
 class ModelValidator(BaseValidator[M]):
-    __slots__ = ('data', 'errors', '_meta', 'pk_field', 'pk_value', 'meta')
+    __slots__ = ('data', '_meta', 'pk_field', 'pk_value', 'meta', 'last_validation')
 
     FIELD_MAP = {  # noqa: WPS115
         'smallint': IntegerField[M],
@@ -910,6 +2314,10 @@ class ModelValidator(BaseValidator[M]):
     meta: ModelMetaLike
     pk_value: object
     pk_field: peewee.Field
+    # The state of the last validation, in incremental mode.
+    last_validation: Optional[IncrementalState]
+    # The options compiled for each model class, per validator class.
+    _model_options: ClassVar[Dict[type, ValidatorOptions[Any]]]
 
     def __init__(self, instance: M):
         # We need to add the type var here
@@ -918,25 +2326,59 @@ class ModelValidator(BaseValidator[M]):
         self.meta = cast(ModelLike, self.ctx)._meta  # type: ignore
         self.pk_field = self.meta.primary_key
         self.pk_value = self.ctx.get_id()
+        self.last_validation = None
 
         # Important that the init comes after setting the above attributes
         super().__init__()
 
     def initialize_fields(self):
+        # The converted fields only depend on the model class, so they are compiled once per
+        # model class and shared, the instance-specific parts are read from the `ctx` when validating.
+        # The options reference the model class, so the cache keeps the model classes alive.
+        cls = type(self)
+        model: type = type(self.ctx)
+        cache: Optional[Dict[type, ValidatorOptions[M]]] = cls.__dict__.get('_model_options')
+        options = cache.get(model) if cache is not None else None
+
+        if options is None:
+            with model_options_lock:
+                cache = cls.__dict__.get('_model_options')
+                if cache is None:
+                    cache = {}
+                    cls._model_options = cache  # noqa: WPS601
+
+                options = cache.get(model)
+                if options is None:
+                    options = self.compile_model_options()
+                    cache[model] = options
+
+        self._meta = options
+
+    def compile_model_options(self) -> ValidatorOptions[M]:
+        fields: Dict[str, Field[M]] = {}
+
         # # Pull all the "normal" fields off the model instance meta.
         for name, field in self.meta.fields.items():
             if getattr(field, 'primary_key', False):
                 continue
-            self._meta.fields[name] = self.convert_field(name, field)
+            fields[name] = self.convert_field(name, field)
 
         # Many-to-many fields are not stored in the meta fields dict.
         # Pull them directly off the class.
         for mtm_name in dir(type(self.ctx)):  # noqa: WPS421
             mtm_field = getattr(type(self.ctx), mtm_name, None)
             if isinstance(mtm_field, peewee.ManyToManyField):
-                self._meta.fields[mtm_name] = self.convert_field(mtm_name, mtm_field)
-
-        super().initialize_fields()
+                fields[mtm_name] = self.convert_field(mtm_name, mtm_field)
+
+        # The fields declared on the validator class override the ones derived from the model.
+        options = self.get_options().copy()
+        fields.update(options.fields)
+        options.fields = fields
+        for name, field in fields.items():
+            dependencies = field_dependencies(field)
+            if dependencies:
+                options.dependencies[name] = dependencies
+        return options
 
     def convert_field(self, name: str, field: peewee.Field) -> Field[M]:
 
@@ -964,7 +2406,7 @@ class ModelValidator(BaseValidator[M]):
             validators.append(validate_length(high=max_length))
 
         if unique:
-            validators.append(validate_model_unique(field, cast(ModelLike, self.ctx).select(), self.pk_field, self.pk_value))
+            validators.append(validate_model_unique(field, cast(ModelLike, self.ctx).select(), self.pk_field))
 
         if isinstance(field, peewee.ForeignKeyField):
             rel_field = cast(peewee.Field, field.rel_field)
@@ -981,48 +2423,362 @@ class ModelValidator(BaseValidator[M]):
 
         return pwv_field(default=default, validators=validators)
 
-    def validate(self, data: Optional[Data] = None, only: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None):  # type: ignore  # noqa: WPS231,E501
-        data = dict(data or {})
+    def validate(self, data: Optional[Data] = None, only: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None):  # type: ignore  # noqa: E501
+        fields = self.select_fields(only or self._meta.only, exclude or self._meta.exclude)
+        return self.run_counted(partial(self.validate_row, fields, data or {}, self.ctx))
+
+    async def avalidate(  # type: ignore
+        self,
+        data: Optional[Data] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        runner: Optional[AsyncRunner] = None,
+    ) -> bool:
+        """Validate `data` against the model instance without blocking the event loop.
+
+        The related objects and the unique fields are looked up concurrently, then the unique
+        indexes are checked concurrently once the data is valid.
+
+        Args:
+            data (Optional[Data]): The data to validate.
+            only (Optional[Iterable[str]]): Only validate these fields.
+            exclude (Optional[Iterable[str]]): Don't validate these fields.
+            runner (Optional[AsyncRunner]): Runs a blocking query, defaults to `run_in_thread` with the
+                databases of the validator.
+
+        Returns:
+            bool: Whether the data is valid.
+        """
+        fields = self.select_fields(only or self._meta.only, exclude or self._meta.exclude)
+        runner = runner or partial(run_in_thread, databases=self.get_databases())
+        return await self.avalidate_row(fields, data or {}, self.ctx, runner)
+
+    async def avalidate_row(self, fields: FieldList[M], data: Data, ctx: Optional[M], runner: AsyncRunner) -> bool:
+        instance = ctx or self.ctx
+
+        # Reading a foreign key from the instance can query the database.
+        row = await runner(partial(self.prepare_row, fields, data, instance))
+        lookups = await self.aprefetch(fields, [row], runner)
+
+        token = batch_lookups.set(lookups)
+        try:
+            # Validate without the index checks, they are awaited below.
+            super().check_row(fields, row, instance)
+        finally:
+            batch_lookups.reset(token)
+
+        if not self.error_records:
+            observer = validation_observer.get()
+            start = time.perf_counter()
+            await self.aperform_index_validation(self.data, instance, runner)
+            if observer is not None:
+                error = 'index' if self.error_records else None
+                observer.record('__base__', 'index_validation', time.perf_counter() - start, error)
+
+        return not self.error_records
+
+    def validate_many(
+        self,
+        rows: Iterable[Data],
+        ctx: Optional[M] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ValidationResult]:
+        """Validate each row of `rows` against a model instance.
+
+        Missing values are taken from `ctx`, which defaults to the instance of the validator,
+        in the same way as `validate`. On top of the related objects, the unique fields of
+        each chunk are checked with a single `IN` query per field.
+
+        Args:
+            rows (Iterable[Data]): The rows to validate.
+            ctx (Optional[M]): The model instance the rows are validated against.
+            only (Optional[Iterable[str]]): Only validate these fields.
+            exclude (Optional[Iterable[str]]): Don't validate these fields.
+            chunk_size (int): The number of rows validated per chunk.
+
+        Returns:
+            Iterator[ValidationResult]: The result for each row, in order.
+        """
+        only = only or self._meta.only
+        exclude = exclude or self._meta.exclude
+        return super().validate_many(rows, ctx=ctx or self.ctx, only=only, exclude=exclude, chunk_size=chunk_size)
+
+    def validate_parallel(
+        self,
+        rows: Iterable[Data],
+        workers: Optional[int] = None,
+        ctx: Optional[M] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ValidationResult]:
         only = only or self._meta.only
         exclude = exclude or self._meta.exclude
+        ctx = ctx or self.ctx
+        return super().validate_parallel(rows, workers=workers, ctx=ctx, only=only, exclude=exclude, chunk_size=chunk_size)
+
+    def get_lookups(self, fields: FieldList[M], rows: Sequence[Data]) -> List[Lookup]:
+        lookups = super().get_lookups(fields, rows)
 
-        for name, _ in self.meta.fields.items():
-            if name in exclude or (only and name not in only):
+        for name, field in fields:
+            unique_validators = [v for v in field.validators if isinstance(v, ModelUniqueValidator)]
+            if not unique_validators:
+                continue
+
+            values = self.collect_values(name, field, rows)
+            for unique_validator in unique_validators:
+                lookups.append((unique_validator, partial(unique_validator.prefetch, values)))
+
+        return lookups
+
+    def get_databases(self) -> List[peewee.Database]:
+        databases = super().get_databases()
+        database = cast(peewee.Model, self.ctx)._meta.database  # noqa: WPS437
+        return databases if database in databases else [database, *databases]
+
+    def prepare_row(self, fields: FieldList[M], data: Data, ctx: Optional[M] = None) -> Data:
+        instance = ctx or self.ctx
+        data = dict(data)
+
+        for name, _ in fields:
+            if name not in self.meta.fields:
                 continue
             try:
-                data.setdefault(name, getattr(self.ctx, name, None))
+                data.setdefault(name, getattr(instance, name, None))
             except (peewee.DoesNotExist):
-                instance_data = cast(ModelLike, self.ctx).__data__  # noqa: WPS609
+                instance_data = cast(ModelLike, instance).__data__  # noqa: WPS609
                 data.setdefault(name, instance_data.get(name, None))
 
+        return data
+
+    def check_row(
+        self,
+        fields: FieldList[M],
+        data: Data,
+        ctx: Optional[M] = None,
+        validated: Optional[FieldResults] = None,
+    ) -> bool:
+        instance = ctx or self.ctx
+
+        if self._meta.incremental and validated is None:
+            return self.check_row_incremental(fields, data, instance)
+
+        if self._meta.combine_unique_checks:
+            return self.check_row_combined(fields, data, instance, validated)
+
         # This will set self.data which we should use from now on.
-        super().validate(data=data, only=only, exclude=exclude, ctx=self.ctx)
+        super().check_row(fields, data, instance, validated)
+
+        if not self.error_records:
+            self.observe_check('index_validation', partial(self.perform_index_validation, self.data, instance))
+
+        return not self.error_records
+
+    def check_row_incremental(self, fields: FieldList[M], data: Data, instance: M) -> bool:
+        """Validate a row, reusing the results of the last validation for the fields whose input didn't change.
+
+        A field is validated again if its input changed, or the input of the field it must match. The
+        other validators are expected to only depend on the value of their field and on the primary key
+        of the instance, the results are discarded when the primary key changes. The unique indexes are
+        only checked again if their values changed. The row is always cleaned.
+
+        The reused unique checks aren't run again, so they don't see the rows written since the check.
+
+        Args:
+            fields (FieldList[M]): The fields to validate.
+            data (Data): The row, populated from the instance.
+            instance (M): The model instance.
+
+        Returns:
+            bool: Whether the data is valid.
+        """
+        pk = cast(ModelLike, instance).get_id()
+        state = self.last_validation
+        if state is None or state.pk != pk:
+            state = IncrementalState(pk)
+
+        inputs = {name: copy_input(data.get(name)) for name, _ in fields}
+        changed = {name for name, value in inputs.items() if not same_input(state.inputs.get(name, UNSET), value)}
+        previous_data, previous_errors = state.results
+        dependencies = self._meta.dependencies
+        # A fail-fast validation can stop before some of the fields, those have no result to reuse.
+        reused = {
+            name
+            for name in inputs
+            if name not in changed and not changed.intersection(dependencies.get(name, ()))
+            and (name in previous_data or name in previous_errors)  # noqa: W503
+        }
+        checked = [(name, field) for name, field in fields if name not in reused]
 
-        if not self.errors:
-            self.perform_index_validation(self.data)
+        self.errors = {}
+        self.data = {name: value for name, value in previous_data.items() if name in reused}
+        self.error_records = {name: error for name, error in previous_errors.items() if name in reused}
+        self.check_fields(checked, data, instance)
+
+        state.inputs = inputs
+        state.results = (dict(self.data), dict(self.error_records))
+        self.last_validation = state
+
+        self.clean_row()
+        if not self.error_records:
+            self.observe_check('index_validation', partial(self.perform_incremental_index_validation, state, instance))
+
+        return not self.error_records
+
+    def perform_incremental_index_validation(self, state: IncrementalState, instance: M):
+        indexes: Dict[Tuple[str, ...], Tuple[Dict[str, object], bool]] = {}
+        for index in self.get_index_values(self.data):
+            key = tuple(index)
+            previous = state.indexes.get(key)
+            if previous is not None and same_input(previous[0], index):
+                collision = previous[1]
+            else:
+                collision = bool(self.get_index_query(index, instance).exists())
+            indexes[key] = (index, collision)
+            if collision:
+                self.add_index_error(index)
+        state.indexes = indexes
+
+    def check_row_combined(self, fields: FieldList[M], data: Data, instance: M, validated: Optional[FieldResults] = None) -> bool:
+        # Skip the unique validators that haven't been batched while validating the fields.
+        deferred: List[Tuple[str, ModelUniqueValidator]] = []
+        for name, field in fields:
+            for v in field.validators:
+                if isinstance(v, ModelUniqueValidator) and get_batch_lookup(v) is None:
+                    deferred.append((name, v))
+
+        lookups = dict(batch_lookups.get() or {})
+        lookups.update({v: DEFERRED for _, v in deferred})
+        token = batch_lookups.set(lookups)
+        try:
+            super().check_row(fields, data, instance, validated)
+        finally:
+            batch_lookups.reset(token)
+
+        if not self.error_limit_reached():
+            self.observe_check('unique_validation', partial(self.perform_unique_validation, deferred, self.data, instance))
+        return not self.error_records
+
+    def observe_check(self, step: str, check: Callable[[], None]):
+        """Run a check of the whole row, reporting its duration to the current observer, if any.
+
+        The checks add their errors rather than raising them, the reported error is the last one they added.
+        """
+        observer = validation_observer.get()
+        if observer is None:
+            check()
+            return
 
-        return not self.errors
+        count = len(self.error_records)
+        start = time.perf_counter()
+        try:
+            check()
+        finally:
+            error = list(self.error_records.values())[-1][0] if len(self.error_records) > count else None
+            observer.record('__base__', step, time.perf_counter() - start, error)
 
-    def perform_index_validation(self, data: Data):  # noqa: WPS231
-        # Build a list of dict containing query values for each unique index.
-        index_data: List[Dict[str, object]] = []
-        for columns, unique in self.meta.indexes:
-            if not unique:
-                continue
-            index_data.append({col: data.get(col, None) for col in columns})
-
-        # Then query for each unique index to see if the value is unique.
-        for index in index_data:
-            query = cast(ModelLike, self.ctx).filter(**index)
-            # If we have a primary key, need to exclude the current record from the check.
-            if self.pk_field and self.pk_value:
-                query = query.where(~(self.pk_field == self.pk_value))
-            if query.count():
-                err = ValidationError('index', fields=str.join(', ', index.keys()))
-                for col in index.keys():
-                    self.add_error(col, err)
+    def perform_unique_validation(  # noqa: WPS231
+        self,
+        unique_validators: Sequence[Tuple[str, ModelUniqueValidator]],
+        data: Data,
+        ctx: Optional[M] = None,
+    ):
+        """Run the unique field and unique index checks with a single query.
+
+        Each check becomes an `EXISTS` subquery, and the query returns one boolean column per check.
+        The index checks are only run if the data has no errors, in the same way as `check_row`.
+
+        Args:
+            unique_validators (Sequence[Tuple[str, ModelUniqueValidator]]): The unique validators, with the name of their field.
+            data (Data): The validated data.
+            ctx (Optional[M]): The model instance.
+        """
+        instance = ctx or self.ctx
+
+        unique_checks = [
+            (name, validator.get_query(data[name], instance))
+            for name, validator in unique_validators
+            if name in data and name not in self.error_records
+        ]
+        index_checks = [] if self.error_records else self.get_index_queries(data, instance)
+
+        queries = [query for _, query in unique_checks] + [query for _, query in index_checks]
+        if not queries:
+            return
+
+        columns = [peewee.fn.EXISTS(query).alias(f'check_{i}') for i, query in enumerate(queries)]
+        database = cast(peewee.Model, instance)._meta.database  # noqa: WPS437
+        row = cast(Tuple[object, ...], peewee.Select(columns=columns).bind(database).tuples().get())
+        collisions = [bool(c) for c in row]
+
+        unique_collisions = collisions[: len(unique_checks)]  # noqa: E203
+        for (name, _), collision in zip(unique_checks, unique_collisions):
+            if collision:
+                self.add_error(name, ValidationError('unique'))
+                self.data.pop(name, None)
+
+        if any(unique_collisions):
+            return
+
+        for (index, _), collision in zip(index_checks, collisions[len(unique_checks) :]):  # noqa: E203
+            if collision:
+                self.add_index_error(index)
+
+    def get_index_queries(self, data: Data, ctx: Optional[M] = None) -> List[Tuple[Dict[str, object], QueryLike]]:
+        # Build a query for each unique index to see if the value is unique.
+        return [(index, self.get_index_query(index, ctx)) for index in self.get_index_values(data)]
+
+    def get_index_values(self, data: Data) -> List[Dict[str, object]]:
+        return [{col: data.get(col, None) for col in columns} for columns, unique in self.meta.indexes if unique]
+
+    def get_index_query(self, index: Dict[str, object], ctx: Optional[M] = None) -> QueryLike:
+        instance = cast(ModelLike, ctx or self.ctx)
+        pk_value = instance.get_id()
+
+        query = instance.filter(**index)
+        # If we have a primary key, need to exclude the current record from the check.
+        if self.pk_field and pk_value:
+            query = query.where(cast(object, ~(self.pk_field == pk_value)))
+        return query
+
+    def perform_index_validation(self, data: Data, ctx: Optional[M] = None):
+        for index, query in self.get_index_queries(data, ctx):
+            if query.exists():
+                self.add_index_error(index)
+
+    async def aperform_index_validation(self, data: Data, ctx: Optional[M], runner: AsyncRunner):
+        index_queries = self.get_index_queries(data, ctx)
+        collisions = await asyncio.gather(*(runner(query.exists) for _, query in index_queries))
+        for (index, _), collision in zip(index_queries, collisions):
+            if collision:
+                self.add_index_error(index)
+
+    def add_index_error(self, index: Mapping[str, object]):
+        err = ValidationError('index', fields=str.join(', ', index.keys()))
+        for col in index.keys():
+            self.add_error(col, err)
 
     def save(self, force_insert: bool = False) -> int:
+        return self.run_counted(partial(self.save_instance, force_insert))
+
+    def save_instance(self, force_insert: bool) -> int:
+        delayed = self.assign_data()
+
+        rv = cast(ModelLike, self.ctx).save(force_insert=force_insert)
+
+        for delayed_field, delayed_value in delayed.items():
+            setattr(self.ctx, delayed_field, delayed_value)
+
+        return rv  # noqa: R504
+
+    def assign_data(self) -> Data:
+        """Set the validated data on the model instance, except the many-to-many values.
+
+        Returns:
+            Data: The many-to-many values, by field name.
+        """
         delayed: Data = {}
         for field, value in self.data.items():
             model_field = getattr(type(self.ctx), field, None)
@@ -1037,9 +2793,143 @@ class ModelValidator(BaseValidator[M]):
 
             setattr(self.ctx, field, value)
 
-        rv = cast(ModelLike, self.ctx).save(force_insert=force_insert)
-
-        for delayed_field, delayed_value in delayed.items():
-            setattr(self.ctx, delayed_field, delayed_value)
-
-        return rv  # noqa: R504
+        return delayed
+
+
+DEFAULT_SAVE_BATCH_SIZE = 100
+
+
+def save_many(
+    validators: Iterable[ModelValidator[Any]],
+    batch_size: int = DEFAULT_SAVE_BATCH_SIZE,
+    force_insert: bool = False,
+) -> int:
+    """Save the model instances of validated model validators in bulk, in a single transaction.
+
+    Per model, the new instances are inserted with `insert_many` and the others are updated with
+    `bulk_update`, `batch_size` rows per query. The many-to-many values of all the instances are
+    then replaced with one `DELETE` and bulk inserts into the through table, rather than a clear
+    and an insert per instance.
+
+    Like `Model.insert_many`, `Model.save` isn't called, so its overrides and signals don't run.
+    The new instances are inserted one by one if the database has no `RETURNING` clause, their
+    primary key couldn't be read back otherwise.
+
+    Args:
+        validators (Iterable[ModelValidator[Any]]): The validators, after a successful validation.
+        batch_size (int): The number of rows written per query.
+        force_insert (bool): Insert every instance, even the ones with a primary key.
+
+    Returns:
+        int: The number of rows inserted or updated.
+    """
+    groups: Dict[Any, List[ModelValidator[Any]]] = {}
+    for validator in validators:
+        groups.setdefault(cast(Any, type(validator.ctx)), []).append(validator)
+
+    saved = 0
+    with ExitStack() as stack:
+        databases: Dict[peewee.Database, None] = dict.fromkeys(model._meta.database for model in groups)  # noqa: WPS437
+        for database in databases:
+            stack.enter_context(database.atomic())
+        for model, group in groups.items():
+            saved += save_model_instances(model, group, batch_size, force_insert)
+    return saved
+
+
+def save_model_instances(model: Any, validators: List[ModelValidator[Any]], batch_size: int, force_insert: bool) -> int:
+    meta = model._meta  # noqa: WPS437
+    new: List[Any] = []
+    existing: List[Any] = []
+    updated: Dict[str, None] = {}
+    many_to_many: Dict[str, List[Tuple[Any, object]]] = {}
+
+    for validator in validators:
+        instance = validator.ctx
+        for name, value in validator.assign_data().items():
+            many_to_many.setdefault(name, []).append((instance, value))
+        updated.update(dict.fromkeys(name for name in validator.data if name in meta.fields))
+        (new if force_insert or instance.get_id() is None else existing).append(instance)
+
+    if isinstance(meta.primary_key, peewee.CompositeKey):
+        saved = sum(instance.save(force_insert=force_insert) for instance in new + existing)
+    else:
+        fields = [meta.fields[name] for name in updated if meta.fields[name] is not meta.primary_key]
+        saved = insert_instances(model, new, batch_size) + update_instances(model, existing, fields, batch_size)
+
+    existing_ids = {id(instance) for instance in existing}
+    for name, values in many_to_many.items():
+        field = meta.manytomany[name]
+        accessor = field.accessor_class(model, field, name)
+        replace_many_to_many(accessor, values, existing_ids, batch_size)
+
+    return saved
+
+
+def supports_returning(database: peewee.Database) -> bool:
+    if database.returning_clause:
+        return True
+    # Peewee only enables the clause for SQLite on request, it's available since SQLite 3.35. Peewee
+    # picks the newest of the SQLite drivers, so the version of `sqlite3` is a lower bound.
+    return isinstance(database, peewee.SqliteDatabase) and sqlite_version_info >= (3, 35)
+
+
+def insert_instances(model: Any, instances: List[Any], batch_size: int) -> int:
+    if not instances:
+        return 0
+
+    meta = model._meta  # noqa: WPS437
+    if not supports_returning(meta.database):
+        return sum(instance.save(force_insert=True) for instance in instances)
+
+    pk = meta.primary_key
+    # A multi-row insert needs the same columns for each row, as `Model.save` only inserts the fields that are set.
+    groups: Dict[Tuple[str, ...], List[Any]] = {}
+    for instance in instances:
+        data = instance.__data__  # noqa: WPS609
+        names = tuple(name for name, value in data.items() if not (name == pk.name and value is None))
+        groups.setdefault(names, []).append(instance)
+
+    for names, group in groups.items():
+        for start in range(0, len(group), batch_size):
+            batch = group[start : start + batch_size]  # noqa: E203
+            rows = [{name: instance.__data__[name] for name in names} for instance in batch]  # noqa: WPS609
+            # The primary keys are returned in the order of the rows.
+            keys = model.insert_many(rows).returning(pk).tuples().execute()
+            for instance, (key,) in zip(batch, keys):
+                setattr(instance, pk.name, key)
+                instance._dirty.clear()  # noqa: WPS437
+
+    return len(instances)
+
+
+def update_instances(model: Any, instances: List[Any], fields: List[peewee.Field], batch_size: int) -> int:
+    if not instances or not fields:
+        return 0
+    updated = model.bulk_update(instances, fields=fields, batch_size=batch_size)
+    for instance in instances:
+        instance._dirty.clear()  # noqa: WPS437
+    return updated
+
+
+def replace_many_to_many(accessor: Any, values: List[Tuple[Any, object]], existing_ids: Set[int], batch_size: int):
+    src_fk, dest_fk, through = accessor.src_fk, accessor.dest_fk, accessor.through_model
+    src_attr, dest_attr = src_fk.rel_field.name, dest_fk.rel_field.name
+
+    # The new instances have no rows in the through table yet.
+    cleared = [getattr(instance, src_attr) for instance, _ in values if id(instance) in existing_ids]
+    for start in range(0, len(cleared), MAX_IN_VALUES):
+        through.delete().where(src_fk.in_(cleared[start : start + MAX_IN_VALUES])).execute()  # noqa: E203
+
+    rows: List[Dict[str, object]] = []
+    for instance, value in values:
+        if isinstance(value, peewee.SelectQuery):
+            # Inserted from the query by peewee.
+            setattr(instance, accessor.name, value)
+            continue
+        src_id = getattr(instance, src_attr)
+        for obj in cast(Iterable[object], value):
+            rows.append({src_fk.name: src_id, dest_fk.name: getattr(obj, dest_attr) if isinstance(obj, peewee.Model) else obj})
+
+    for start in range(0, len(rows), batch_size):
+        through.insert_many(rows[start : start + batch_size]).execute()  # noqa: E203
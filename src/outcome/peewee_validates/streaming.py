@@ -0,0 +1,150 @@
+"""Validate the rows of CSV and JSON Lines files as they are read.
+
+The rows are read and validated in chunks with `BaseValidator.validate_many`, so the database
+lookups are batched per chunk and only one chunk is held in memory, whatever the size of the file.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from outcome.peewee_validates.peewee_validates import DEFAULT_CHUNK_SIZE, BaseValidator, Data, ValidationError
+
+# The number of the row in the source, and the row or the reason it couldn't be read.
+Record = Tuple[int, Union[Data, ValidationError]]
+
+# The number of the row, whether it's valid, and the validated data or the errors.
+RowResult = Tuple[int, bool, Mapping[str, Any]]
+
+
+def read_csv(file: Iterable[str], empty_as_missing: bool = True, **reader_kwargs: Any) -> Iterator[Record]:
+    """Read the rows of a CSV file with a header.
+
+    Args:
+        file (Iterable[str]): The file, opened in text mode with `newline=''`.
+        empty_as_missing (bool): Leave the empty cells out of the rows, so they are validated as missing values.
+        reader_kwargs (Any): Passed to `csv.DictReader`.
+
+    Yields:
+        Record: The line on which each row starts, with the row.
+    """
+    reader = csv.DictReader(file, **reader_kwargs)
+    # Read the header first, so the line numbers start after it
+    reader.fieldnames  # noqa: WPS428
+    line = reader.line_num
+
+    for row in reader:
+        if empty_as_missing:
+            row = {key: cell for key, cell in row.items() if cell != ''}  # noqa: WPS440
+        yield line + 1, row
+        line = reader.line_num
+
+
+def read_jsonl(file: Iterable[Union[str, bytes]]) -> Iterator[Record]:
+    """Read the rows of a JSON Lines file, each line holding an object.
+
+    The blank lines are skipped, the lines that aren't a JSON object are yielded as a `ValidationError`.
+
+    Args:
+        file (Iterable[Union[str, bytes]]): The file, opened in text or binary mode.
+
+    Yields:
+        Record: The number of each line, with its row.
+    """
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as err:
+            yield number, ValidationError('invalid_row', error=err)
+            continue
+        if isinstance(row, dict):
+            yield number, row
+        else:
+            yield number, ValidationError('invalid_row', error='not an object')
+
+
+def validate_records(
+    validator: BaseValidator[Any],
+    records: Iterable[Record],
+    ctx: Optional[Any] = None,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[RowResult]:
+    """Validate numbered rows lazily, one chunk at a time.
+
+    The rows that couldn't be read get their error under `__base__`.
+
+    Args:
+        validator (BaseValidator[Any]): The validator.
+        records (Iterable[Record]): The numbered rows, e.g. from `read_csv` or `read_jsonl`.
+        ctx (Optional[Any]): The context passed to `validate_many`.
+        only (Optional[Iterable[str]]): Only validate these fields.
+        exclude (Optional[Iterable[str]]): Don't validate these fields.
+        chunk_size (int): The number of rows read and validated at once.
+
+    Yields:
+        RowResult: The number of each row, whether it's valid, and the validated data or the errors.
+    """
+    iterator = iter(records)
+    only = list(only) if only is not None else None
+    exclude = list(exclude) if exclude is not None else None
+
+    while True:  # noqa: WPS457
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        rows = [row for _, row in chunk if not isinstance(row, ValidationError)]
+        results = validator.validate_many(rows, ctx=ctx, only=only, exclude=exclude, chunk_size=max(len(rows), 1))
+
+        for number, row in chunk:
+            if isinstance(row, ValidationError):
+                yield number, False, {'__base__': validator.format_error('__base__', row)}
+                continue
+            ok, data, errors = next(results)
+            yield number, ok, data if ok else errors
+
+
+def validate_csv(
+    validator: BaseValidator[Any],
+    file: IO[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[RowResult]:
+    """Validate the rows of a CSV file, see `read_csv` and `validate_records`.
+
+    Args:
+        validator (BaseValidator[Any]): The validator.
+        file (IO[str]): The file, opened in text mode with `newline=''`.
+        chunk_size (int): The number of rows read and validated at once.
+        kwargs (Any): Passed to `validate_records`.
+
+    Returns:
+        Iterator[RowResult]: The result of each row, in order.
+    """
+    return validate_records(validator, read_csv(file), chunk_size=chunk_size, **kwargs)
+
+
+def validate_jsonl(
+    validator: BaseValidator[Any],
+    file: IO[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[RowResult]:
+    """Validate the rows of a JSON Lines file, see `read_jsonl` and `validate_records`.
+
+    Args:
+        validator (BaseValidator[Any]): The validator.
+        file (IO[Any]): The file, opened in text or binary mode.
+        chunk_size (int): The number of rows read and validated at once.
+        kwargs (Any): Passed to `validate_records`.
+
+    Returns:
+        Iterator[RowResult]: The result of each row, in order.
+    """
+    return validate_records(validator, read_jsonl(file), chunk_size=chunk_size, **kwargs)
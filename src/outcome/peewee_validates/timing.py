@@ -0,0 +1,168 @@
+"""Aggregate the durations reported by the validations into a table of percentiles.
+
+    observer = TimingObserver()
+    with observer:
+        validator.validate(data)
+    print(observer.table())
+
+The durations are kept per field and step, the observer can be shared by several threads. The calls,
+errors, total and maximum are exact, the percentiles are computed from a uniform sample of the durations,
+so the memory used by a step is bounded however long the observer runs.
+"""
+from __future__ import annotations
+
+import math
+import random
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from outcome.peewee_validates.peewee_validates import ValidationObserver
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+DEFAULT_MAX_SAMPLES = 10000
+
+
+class StepTiming(NamedTuple):
+    name: str
+    step: str
+    calls: int
+    errors: int
+    total: float
+    maximum: float
+    # The durations at each of the percentiles of the observer, in seconds.
+    percentiles: Tuple[float, ...]
+
+
+def percentile(durations: Sequence[float], rank: float) -> float:
+    """Get a percentile of sorted durations, with the nearest-rank method.
+
+    Args:
+        durations (Sequence[float]): The durations, sorted.
+        rank (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The duration.
+    """
+    index = max(math.ceil(rank / 100 * len(durations)) - 1, 0)
+    return durations[index]
+
+
+def align(cell: str, width: int, left: bool) -> str:
+    return cell.ljust(width) if left else cell.rjust(width)
+
+
+class StepDurations:
+    """The durations of a step, with a reservoir sample of at most `max_samples` of them."""
+
+    __slots__ = ('calls', 'errors', 'total', 'maximum', 'samples')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.samples: List[float] = []
+
+    def add(self, duration: float, error: bool, max_samples: int, rng: random.Random):
+        self.calls += 1
+        self.errors += error
+        self.total += duration
+        self.maximum = max(self.maximum, duration)
+        if len(self.samples) < max_samples:
+            self.samples.append(duration)
+        else:
+            # Each of the durations seen so far has the same chance to be in the sample.
+            index = rng.randrange(self.calls)
+            if index < max_samples:
+                self.samples[index] = duration
+
+
+class TimingObserver(ValidationObserver):
+    """Collects the durations of each step of the validations, see `ValidationObserver`.
+
+    Args:
+        percentiles (Sequence[float]): The percentiles reported by `summary` and `table`.
+        max_samples (int): The number of durations kept per step to compute the percentiles.
+        seed (Optional[int]): The seed of the sampling, for reproducible percentiles.
+    """
+
+    def __init__(
+        self,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        seed: Optional[int] = None,
+    ):
+        super().__init__()
+        self.percentiles = tuple(percentiles)
+        self.max_samples = max_samples
+        self.rng = random.Random(seed)
+        self.durations: Dict[Tuple[str, str], StepDurations] = {}
+        self.lock = threading.Lock()
+
+    def record(self, name: str, step: str, duration: float, error: Optional[str]):
+        key = (name, step)
+        with self.lock:
+            durations = self.durations.get(key)
+            if durations is None:
+                durations = StepDurations()
+                self.durations[key] = durations
+            durations.add(duration, error is not None, self.max_samples, self.rng)
+
+    def reset(self):
+        with self.lock:
+            self.durations = {}
+
+    def summary(self) -> List[StepTiming]:
+        """Aggregate the durations of each step, the slowest steps first.
+
+        Returns:
+            List[StepTiming]: The timings, by total duration.
+        """
+        with self.lock:
+            steps = [
+                (name, step, durations.calls, durations.errors, durations.total, durations.maximum, sorted(durations.samples))
+                for (name, step), durations in self.durations.items()
+            ]
+
+        timings = [
+            StepTiming(
+                name=name,
+                step=step,
+                calls=calls,
+                errors=errors,
+                total=total,
+                maximum=maximum,
+                percentiles=tuple(percentile(samples, rank) for rank in self.percentiles),
+            )
+            for name, step, calls, errors, total, maximum, samples in steps
+        ]
+        timings.sort(key=lambda timing: timing.total, reverse=True)
+        return timings
+
+    def table(self) -> str:
+        """Render the summary as a text table, the durations are in microseconds.
+
+        Returns:
+            str: The table.
+        """
+        headers = ['field', 'step', 'calls', 'errors', *(f'p{rank:g}' for rank in self.percentiles), 'max', 'total']
+        rows = [
+            [
+                timing.name,
+                timing.step,
+                str(timing.calls),
+                str(timing.errors),
+                *(f'{value * 1e6:.1f}' for value in timing.percentiles),
+                f'{timing.maximum * 1e6:.1f}',
+                f'{timing.total * 1e6:.1f}',
+            ]
+            for timing in self.summary()
+        ]
+
+        widths = [max(len(row[column]) for row in [headers, *rows]) for column in range(len(headers))]
+        # The names are aligned to the left, the numbers to the right.
+        lines = [
+            '  '.join(align(cell, width, column < 2) for column, (cell, width) in enumerate(zip(row, widths)))
+            for row in [headers, *rows]
+        ]
+        return '\n'.join(line.rstrip() for line in lines)
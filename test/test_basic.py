@@ -1,5 +1,9 @@
-from datetime import date, datetime, time, timedelta
-from typing import Dict
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
 
 from outcome.peewee_validates.peewee_validates import (  # noqa: WPS235
     DEFAULT_MESSAGES,
@@ -443,6 +447,142 @@ def test_custom_messages():
     assert validator.errors['field3'] == 'pick a number'
 
 
+def test_lazy_error_messages(monkeypatch: pytest.MonkeyPatch):
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True)
+        field2 = IntegerField[None](low=1, high=3)
+
+        class Meta(Validator.Meta):
+            messages = {'required': '', 'field2.range_between': 'between {low} and {high}'}
+
+    rendered: List[str] = []
+    render_error = Validator.render_error
+
+    def counting_render_error(self: Validator, name: str, *args: Any):
+        rendered.append(name)
+        return render_error(self, name, *args)
+
+    monkeypatch.setattr(Validator, 'render_error', counting_render_error)
+
+    validator = TestValidator()
+    assert not validator.validate({'field2': 5})
+    assert validator.error_records == {'field1': ('required', {}), 'field2': ('range_between', {'low': 1, 'high': 3})}
+    assert not rendered
+
+    # An empty message falls back to the default one
+    assert validator.errors == {'field1': DEFAULT_MESSAGES['required'], 'field2': 'between 1 and 3'}
+    assert validator.errors is validator.errors
+    assert len(rendered) == 2
+    assert ('field2', 'range_between') in TestValidator.get_options().resolved_messages
+
+    validator.errors = {'field1': 'custom'}
+    assert validator.errors == {'field1': 'custom'}
+
+
+def test_clean_writes_errors():
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True)
+
+        def clean(self, data: Dict[str, object]) -> Dict[str, object]:
+            if data['field1'] == 'tim':
+                self.errors['field1'] = 'custom'
+            return data
+
+    validator = TestValidator()
+    assert not validator.validate({'field1': 'tim'})
+    assert validator.errors == {'field1': 'custom'}
+    assert validator.error_records == {'field1': (None, {'message': 'custom'})}
+    assert validator.validate({'field1': 'bob'})
+    assert validator.errors == {}
+
+    errors = validator.errors
+    errors.update(field1='one', field2='two')
+    assert errors.setdefault('field1', 'other') == 'one'
+    assert errors.setdefault('field3', 'three') == 'three'
+    del errors['field3']  # noqa: WPS420
+    assert errors.pop('field2') == 'two'
+    assert validator.error_records == {'field1': (None, {'message': 'one'})}
+    del errors['field1']  # noqa: WPS420
+    assert not validator.error_records
+    errors['field1'] = 'one'
+    assert errors.popitem() == ('field1', 'one')
+    errors |= {'field1': 'one'}
+    errors.clear()
+    assert not validator.error_records
+
+
+def test_add_error_writes_errors():
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True)
+
+        def add_error(self, name: str, error: ValidationError):
+            self.errors[name] = f'{name} is wrong'
+
+    validator = TestValidator()
+    assert not validator.validate({})
+    assert validator.errors == {'field1': 'field1 is wrong'}
+    assert validator.validate({'field1': 'tim'})
+
+
+def test_fail_fast():
+    checked: List[str] = []
+
+    def track(name: str):
+        def validator(field: Any, data: Any, ctx: Any = None):
+            checked.append(name)
+
+        return validator
+
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True, validators=[track('field1')])
+        field2 = IntegerField[None](required=True, validators=[track('field2')])
+        field3 = StringField[None](required=True, validators=[track('field3')])
+
+        class Meta(Validator.Meta):
+            fail_fast = True
+
+        def clean(self, data: Dict[str, object]) -> Dict[str, object]:
+            checked.append('clean')
+            return data
+
+    class MaxErrorsValidator(TestValidator):
+        class Meta(Validator.Meta):
+            max_errors = 2
+
+    class CompiledValidator(TestValidator):
+        class Meta(Validator.Meta):
+            fail_fast = True
+            compile_fields = True
+
+    for validator_class in (TestValidator, CompiledValidator):
+        validator = validator_class()
+        assert not validator.validate({'field2': 'x'})
+        assert validator.errors == {'field1': DEFAULT_MESSAGES['required']}
+        assert not checked
+
+        assert validator.validate({'field1': 'a', 'field2': '1', 'field3': 'b'})
+        assert checked == ['field1', 'field2', 'field3', 'clean']
+        checked.clear()
+
+    class CompiledMaxErrorsValidator(TestValidator):
+        class Meta(Validator.Meta):
+            max_errors = 2
+            compile_fields = True
+
+    for validator_class in (MaxErrorsValidator, CompiledMaxErrorsValidator):
+        validator = validator_class()
+        assert not validator.validate({'field3': 'b'})
+        assert set(validator.errors) == {'field1', 'field2'}
+        assert not checked
+
+    # The errors of the fields validated beforehand count towards the limit.
+    validator = TestValidator()
+    fields = validator.select_fields(None, None)
+    assert not validator.check_row(fields, {'field2': '1'}, validated=({}, {'field1': ('required', {})}))
+    assert validator.errors == {'field1': DEFAULT_MESSAGES['required']}
+    assert not checked
+
+
 def test_subclass():
     class ParentValidator(Validator):
         field1 = StringField[None](required=True)
@@ -457,3 +597,199 @@ def test_subclass():
     assert validator.errors['field1'] == DEFAULT_MESSAGES['required']
     assert validator.errors['field2'] == DEFAULT_MESSAGES['required']
     assert validator.errors['field3'] == DEFAULT_MESSAGES['required']
+
+
+def test_options_compiled_once_per_class():
+    class ParentValidator(Validator):
+        field1 = StringField[None](required=True)
+
+    class TestValidator(ParentValidator):
+        field2 = StringField[None](required=True)
+
+    first, second = TestValidator(), TestValidator()
+    assert first._meta is second._meta  # type: ignore
+    assert first._meta is TestValidator.get_options()  # type: ignore
+
+    assert set(TestValidator.get_options().fields) == {'field1', 'field2'}
+    assert set(ParentValidator.get_options().fields) == {'field1'}
+    assert ParentValidator().validate({'field1': 'tim'})
+
+
+def test_validate_many():
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True)
+        field2 = IntegerField[None]()
+
+    rows = [{'field1': 'tim', 'field2': '1'}, {'field2': 'a'}, {'field1': 'bob'}]
+    results = list(TestValidator().validate_many(rows))
+
+    assert [ok for ok, _, _ in results] == [True, False, True]
+    assert results[0][1] == {'field1': 'tim', 'field2': 1}
+    assert results[1][2] == {'field1': required_msg, 'field2': DEFAULT_MESSAGES['coerce_int']}
+    assert results[2][1] == {'field1': 'bob', 'field2': None}
+
+
+def test_validate_many_lazy_errors(monkeypatch: pytest.MonkeyPatch):
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True)
+        field2 = IntegerField[None]()
+
+    rendered: List[str] = []
+    render_error = Validator.render_error
+
+    def counting_render_error(self: Validator, name: str, *args: Any):
+        rendered.append(name)
+        return render_error(self, name, *args)
+
+    monkeypatch.setattr(Validator, 'render_error', counting_render_error)
+
+    results = list(TestValidator().validate_many([{'field2': 'a'}, {'field1': 'tim', 'field2': 'b'}]))
+    errors = results[0][2]
+    assert not rendered
+
+    assert 'field1' in errors
+    assert len(errors) == 2
+    assert 'field3' not in errors
+    assert not rendered
+
+    assert errors['field2'] == DEFAULT_MESSAGES['coerce_int']
+    assert errors['field2'] == DEFAULT_MESSAGES['coerce_int']
+    assert rendered == ['field2']
+    assert dict(results[1][2]) == {'field2': DEFAULT_MESSAGES['coerce_int']}
+    assert repr(results[1][2]) == repr({'field2': DEFAULT_MESSAGES['coerce_int']})
+
+
+def test_validate_many_only():
+    class TestValidator(Validator):
+        field1 = StringField[None](required=True)
+        field2 = StringField[None](required=True)
+
+    results = list(TestValidator().validate_many([{'field1': 'tim'}], only=['field1']))
+    assert results == [(True, {'field1': 'tim'}, {})]
+
+
+def test_concurrent_validation():
+    class TestValidator(Validator):
+        name = StringField[None](required=True, max_length=10)
+        age = IntegerField[None](high=100)
+
+    def run(worker: int):
+        validator = TestValidator()
+        for i in range(200):
+            age = (worker * i) % 150
+            data = {'name': f'n{worker}-{i}', 'age': str(age)}
+            assert validator.validate(data) == (age <= 100)
+            if age <= 100:
+                assert validator.data == {'name': data['name'], 'age': age}
+        return True
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(run, range(32)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert TestValidator.name.value is None
+
+
+def test_dates_iso():
+    class TestValidator(Validator):
+        date_field = DateField[None](required=True)
+        time_field = TimeField[None](required=True)
+        datetime_field = DateTimeField[None](required=True)
+        utc_field = DateTimeField[None](required=True)
+
+    data = {
+        'date_field': '2015-01-01',
+        'time_field': '15:20:00Z',
+        'datetime_field': '2015-01-01T15:20:00+01:00',
+        'utc_field': '2015-01-01T15:20:00Z',
+    }
+
+    validator = TestValidator()
+    assert validator.validate(data)
+
+    assert validator.data['date_field'] == date(2015, 1, 1)
+    assert validator.data['time_field'] == time(15, 20)
+    assert validator.data['datetime_field'] == datetime(2015, 1, 1, 15, 20, tzinfo=timezone(timedelta(hours=1)))
+    assert validator.data['utc_field'] == datetime(2015, 1, 1, 15, 20, tzinfo=timezone.utc)
+
+
+def test_dates_iso_only():
+    class TestValidator(Validator):
+        date_field = DateField[None](iso_only=True)
+        time_field = TimeField[None](iso_only=True)
+        datetime_field = DateTimeField[None](iso_only=True)
+
+    validator = TestValidator()
+    assert validator.validate({'date_field': '2015-01-01T15:20', 'time_field': '15:20', 'datetime_field': '2015-01-01'})
+    assert validator.data['date_field'] == date(2015, 1, 1)
+    assert validator.data['datetime_field'] == datetime(2015, 1, 1)
+
+    data = {'date_field': 'jan 1, 2015', 'time_field': '3:20 pm', 'datetime_field': 'jan 1, 2015 3:20 pm'}
+    assert not validator.validate(data)
+    assert validator.errors['date_field'] == DEFAULT_MESSAGES['coerce_date']
+    assert validator.errors['time_field'] == DEFAULT_MESSAGES['coerce_time']
+    assert validator.errors['datetime_field'] == DEFAULT_MESSAGES['coerce_datetime']
+
+    assert not validator.validate({'date_field': 5, 'time_field': 5, 'datetime_field': 5})
+    assert set(validator.errors) == {'date_field', 'time_field', 'datetime_field'}
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('2015-01-01', datetime(2015, 1, 1)),
+        ('2015-01-01T15', datetime(2015, 1, 1, 15)),
+        ('2015-01-01 15:20', datetime(2015, 1, 1, 15, 20)),
+        ('2015-01-01t15:20:30.123', datetime(2015, 1, 1, 15, 20, 30, 123000)),
+        ('2015-01-01T15:20:30.123456-05:30', datetime(2015, 1, 1, 15, 20, 30, 123456, tzinfo=timezone(timedelta(minutes=-330)))),
+        ('2015-01-01T15:20z', datetime(2015, 1, 1, 15, 20, tzinfo=timezone.utc)),
+        # The forms only accepted by `fromisoformat` since Python 3.11
+        ('20150101', None),
+        ('2015-W01-1', None),
+        ('2015-01-01T1520', None),
+        ('2015-01-01T15:20:30.1', None),
+        ('2015-01-01T15:20+0100', None),
+        ('2015-01-01T15:20,5', None),
+        # Another separator than `T` or a space
+        ('2015-01-01_15:20', None),
+        ('2015-02-30', None),
+        (' 2015-01-01', None),
+    ],
+)
+def test_dates_iso_only_grammar(value: str, expected: Any):
+    class TestValidator(Validator):
+        date_field = DateField[None](iso_only=True)
+        datetime_field = DateTimeField[None](iso_only=True)
+
+    validator = TestValidator()
+    assert validator.validate({'date_field': value, 'datetime_field': value}) is (expected is not None)
+    if expected is not None:
+        assert validator.data == {'date_field': expected.date(), 'datetime_field': expected}
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('15', time(15)),
+        ('15:20:30.123456', time(15, 20, 30, 123456)),
+        ('15:20Z', time(15, 20)),
+        ('15:20+01:00', time(15, 20)),
+        ('2015-01-01T15:20', time(15, 20)),
+        ('1520', None),
+        ('15:20:30.1', None),
+        ('25:00', None),
+        ('T15:20', None),
+    ],
+)
+def test_times_iso_only_grammar(value: str, expected: Any):
+    class TestValidator(Validator):
+        time_field = TimeField[None](iso_only=True)
+
+    validator = TestValidator()
+    assert validator.validate({'time_field': value}) is (expected is not None)
+    if expected is not None:
+        assert validator.data['time_field'] == expected
@@ -0,0 +1,126 @@
+from datetime import date
+from test.models import ComplexPerson, Organization
+from typing import Dict, List, Type
+
+from outcome.peewee_validates.codegen import compile_fields
+from outcome.peewee_validates.peewee_validates import M as ModelType  # noqa: N811
+from outcome.peewee_validates.peewee_validates import (  # noqa: WPS235
+    BooleanField,
+    DateField,
+    DecimalField,
+    Field,
+    FloatField,
+    IntegerField,
+    ModelValidator,
+    StringField,
+    ValidationError,
+    Validator,
+    validate_email,
+    validate_equal,
+    validate_function,
+    validate_length,
+    validate_matches,
+    validate_none_of,
+    validate_not_empty,
+    validate_one_of,
+    validate_regexp,
+)
+
+
+def is_even(value: object, offset: int = 0):
+    return isinstance(value, int) and (value + offset) % 2 == 0
+
+
+class UpperField(StringField[None]):
+    def coerce(self, value: object) -> str:  # type: ignore
+        if value == 'boom':
+            raise ValidationError('coerce_upper')
+        return str(value).upper()
+
+
+class WideValidator(Validator):
+    text = StringField[None](required=True, max_length=5, validators=[validate_not_empty()])
+    short = StringField[None](min_length=2, validators=[validate_length(equal=3)])
+    between = StringField[None](min_length=2, max_length=4, default='abc')
+    number = IntegerField[None](low=1, high=10, validators=[validate_function(is_even, offset=1)])
+    ratio = FloatField[None](low=0.5)
+    amount = DecimalField[None](high=100)
+    flag = BooleanField[None]()
+    day = DateField[None](low=date(2000, 1, 1))
+    choice = StringField[None](validators=[validate_one_of(('a', 'b')), validate_none_of(lambda: ('b',))])
+    excluded = IntegerField[None](validators=[validate_none_of((1, 2))])
+    equal = StringField[None](validators=[validate_equal('same'), validate_matches('text')])
+    pattern = StringField[None](validators=[validate_regexp('^[a-z]+$')])
+    email = StringField[None](validators=[validate_email()])
+    upper = UpperField(default=lambda: 'dflt')
+    unbounded = StringField[None](validators=[validate_length()])
+    dynamic = StringField[None](validators=[validate_one_of(lambda: ('a', 'b')), validate_none_of(lambda: ('b',))])
+    sized = Field[None](validators=[validate_length(low=1)])
+    raw = Field[None]()
+
+
+class CompiledWideValidator(WideValidator):
+    class Meta(Validator.Meta):
+        compile_fields = True
+
+
+rows: List[Dict[str, object]] = [
+    {},
+    {'text': 'same', 'equal': 'same', 'short': 'abc', 'number': 3, 'ratio': '1.5', 'amount': '10', 'flag': 'false'},
+    {'text': '', 'short': 'a', 'between': 'abcdef', 'number': 'x', 'ratio': '0.1', 'amount': '101', 'flag': 1},
+    {'text': 'toolong', 'short': 'abcd', 'number': 12, 'ratio': 'x', 'amount': 'x', 'day': '1999-01-01'},
+    {'text': '  ', 'number': 0, 'ratio': 0, 'amount': 0, 'day': 'nope', 'choice': 'c', 'excluded': 2},
+    {'text': 'ok', 'choice': 'b', 'equal': 'other', 'pattern': 'ABC', 'email': 'bad', 'upper': 'boom', 'unbounded': 'x'},
+    {'text': 'ok', 'choice': 'a', 'equal': 'same', 'pattern': 'abc', 'email': 'a@b.co', 'upper': 'x', 'raw': [1]},
+    {'text': None, 'short': None, 'number': None, 'flag': None, 'day': date(2020, 1, 1), 'excluded': 'a'},
+    {'text': 'ok', 'dynamic': 'c', 'sized': 5},
+    {'text': 'ok', 'dynamic': 'b', 'sized': []},
+    {'text': 'ok', 'dynamic': 'a', 'sized': [1]},
+]
+
+
+def assert_same_results(interpreted: Validator, compiled: Validator):
+    for row in rows:
+        assert interpreted.validate(row) == compiled.validate(row)
+        assert interpreted.errors == compiled.errors
+        assert list(interpreted.data.items()) == list(compiled.data.items())
+
+
+def test_compiled_matches_interpreted():
+    assert_same_results(WideValidator(), CompiledWideValidator())
+
+
+def test_compiled_only_exclude():
+    interpreted, compiled = WideValidator(), CompiledWideValidator()
+    for row in rows:
+        assert interpreted.validate(row, only=['text', 'number']) == compiled.validate(row, only=['text', 'number'])
+        assert interpreted.errors == compiled.errors
+        assert interpreted.validate(row, exclude=['text']) == compiled.validate(row, exclude=['text'])
+        assert interpreted.errors == compiled.errors
+
+
+def test_compiled_source():
+    fn = compile_fields(list(WideValidator.get_options().fields.items()))
+    assert 'def validate_fields' in fn.__source__  # type: ignore
+    assert 'raise ValidationError' in fn.__source__  # type: ignore
+
+
+def test_compiled_model_validator():
+    class CompiledModelValidator(ModelValidator[ModelType]):
+        class Meta(ModelValidator.Meta):
+            compile_fields = True
+
+    org = Organization.create(name='compiled')
+    model_rows = [
+        {'name': 'cmp', 'gender': 'M', 'organization': org.id},
+        {'name': 'toolong', 'gender': 'X', 'organization': 999},
+        {'gender': None},
+    ]
+
+    validator_class: Type[ModelValidator[ModelType]]
+    results = []
+    for validator_class in (ModelValidator, CompiledModelValidator):
+        validator = validator_class(ComplexPerson())
+        results.append([(validator.validate(row), validator.data, validator.errors) for row in model_rows])
+
+    assert results[0] == results[1]
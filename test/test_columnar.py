@@ -0,0 +1,153 @@
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from outcome.peewee_validates.columnar import validate_columns  # noqa: E402
+from outcome.peewee_validates.peewee_validates import (  # noqa: E402,WPS235
+    DecimalField,
+    Field,
+    FloatField,
+    IntegerField,
+    StringField,
+    Validator,
+    validate_email,
+    validate_length,
+    validate_none_of,
+    validate_not_empty,
+    validate_one_of,
+)
+
+
+class ColumnValidator(Validator):
+    name = StringField[None](required=True, max_length=5, validators=[validate_not_empty()])
+    code = StringField[None](validators=[validate_length(equal=2), validate_one_of(('ab', 'cd'))])
+    count = IntegerField[None](low=0, high=10)
+    ratio = FloatField[None](required=True, low=0.5, high=1.5)
+    price = DecimalField[None](high=100)
+    tag = Field[None](validators=[validate_none_of(('x', None))], default='t')
+    email = StringField[None](validators=[validate_email()])
+
+    class Meta:
+        messages = {'name.required': 'Name is required'}
+
+
+columns: Dict[str, Sequence[Any]] = {
+    'name': ['bob', None, '  ', 'toolong', 'amy', 12],
+    'code': ['ab', 'cd', 'abc', 'ef', None, 'ab'],
+    'count': np.array([1, -1, 5, 11, 10, 0]),
+    'ratio': np.array([1, 0, 0.2, 1.6, np.nan, 0.5]),
+    'price': [1.5, 0, 150, None, 100, 3],
+    'tag': ['a', 'x', None, 'b', 'c', 'd'],
+    'email': ['a@b.co', 'nope', None, 'c@d.org', 'x', 'e@f.io'],
+}
+
+
+class CheckedField(StringField[None]):
+    def validate(self, name: str, data: Dict[str, Any], ctx: Any = None) -> Any:
+        return super().validate(name, data, ctx)
+
+
+class FallbackValidator(Validator):
+    text = Field[None](validators=[validate_not_empty()])
+    sized = Field[None](validators=[validate_length(high=3)])
+    short = StringField[None](min_length=2)
+    number = IntegerField[None](low=1)
+    exact = DecimalField[None](low=Decimal('0.5'))
+    dynamic = StringField[None](validators=[validate_one_of(lambda: ('a', 'b'))])
+    excluded = StringField[None](validators=[validate_none_of(lambda: ('b',))])
+    stamp = StringField[None](required=True, default=lambda: None)
+    checked = CheckedField(max_length=2)
+
+
+def interpreted_errors(
+    data: Dict[str, Sequence[Any]],
+    only: Optional[List[str]] = None,
+    validator_class: Type[Validator] = ColumnValidator,
+) -> List[Dict[str, str]]:
+    row_count = len(next(iter(data.values())))
+    errors = []
+    for row in range(row_count):
+        validator = validator_class()
+        validator.validate({name: np.asarray(column, dtype=object)[row] for name, column in data.items()}, only=only)
+        errors.append(validator.errors)
+    return errors
+
+
+def test_columns_match_interpreted():
+    result = validate_columns(ColumnValidator(), columns)
+    assert result.errors() == interpreted_errors(columns)
+    assert result.valid.tolist() == [not errors for errors in interpreted_errors(columns)]
+
+
+def test_columns_vectorized():
+    result = validate_columns(ColumnValidator(), columns)
+    # Only the email field is validated row by row
+    assert set(result.row_errors) == {'email'}
+    assert result.field_mask('count').tolist() == [False, True, False, True, False, False]
+
+
+def test_columns_integer_nan():
+    data = {'count': np.array([1.7, np.nan, 12.2])}
+    result = validate_columns(ColumnValidator(), data, only=['count'])
+    assert result.errors() == interpreted_errors(data, only=['count'])
+    assert not result.row_errors
+
+
+def test_columns_missing_column():
+    result = validate_columns(ColumnValidator(), {'name': ['a', 'b']}, only=['name', 'ratio', 'tag'])
+    assert result.errors() == [{'ratio': 'This field is required.'}] * 2
+
+
+def test_columns_length_mismatch():
+    with pytest.raises(ValueError):
+        validate_columns(ColumnValidator(), {'name': ['a'], 'code': ['ab', 'cd']})
+
+
+def test_columns_row_fallback():
+    data: Dict[str, Sequence[Any]] = {
+        'text': ['', 'a', None],
+        'sized': ['abcd', [1], None],
+        'short': ['a', 'abc', None],
+        'number': np.array([-1, 0, 5]),
+        'exact': [0.1, 1.0, None],
+        'dynamic': ['a', 'c', None],
+        'excluded': ['a', 'b', None],
+        'checked': ['abc', 'a', None],
+    }
+    result = validate_columns(FallbackValidator(), data)
+    assert result.errors() == interpreted_errors(data, validator_class=FallbackValidator)
+    assert set(result.row_errors) == {'text', 'sized', 'exact', 'dynamic', 'excluded', 'stamp', 'checked'}
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'count': np.array(['1', '12'])},
+        {'count': ['1', 12]},
+        {'count': [10**30, 1]},
+        {'ratio': ['x', 1.0]},
+        {'name': np.array(['bob', 'toolong'])},
+        {'tag': np.array(['a', 'x'])},
+        {'tag': ['a', 1, 'x']},
+        {'code': [None, None]},
+    ],
+)
+def test_columns_coercion(data: Dict[str, Sequence[Any]]):
+    result = validate_columns(ColumnValidator(), data, only=list(data))
+    assert result.errors() == interpreted_errors(data, only=list(data))
+
+
+@pytest.mark.parametrize(
+    ('data', 'exception'),
+    [
+        ({'count': np.array([np.inf, 1.0])}, OverflowError),
+        ({'price': np.array([np.nan, 150.0])}, InvalidOperation),
+    ],
+)
+def test_columns_row_exceptions(data: Dict[str, Sequence[Any]], exception: Type[Exception]):
+    # The values the row validation raises for are left to it.
+    with pytest.raises(exception):
+        validate_columns(ColumnValidator(), data, only=list(data))
@@ -1,12 +1,26 @@
-from test.models import BasicFields, ComplexPerson, Course, Organization, Person, Student
-from typing import Dict, cast
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from test.models import BasicFields, ComplexPerson, Course, Organization, Person, Student, database
+from typing import Any, Callable, Dict, List, cast
 
 import peewee
+import pytest
 from playhouse.postgres_ext import ArrayField, BinaryJSONField, HStoreField
 
+from outcome.peewee_validates import peewee_validates
 from outcome.peewee_validates.peewee_validates import DEFAULT_MESSAGES
 from outcome.peewee_validates.peewee_validates import M as ModelType  # noqa: N811
-from outcome.peewee_validates.peewee_validates import ManyModelChoiceField, ModelValidator, QueryLike, ValidationError
+from outcome.peewee_validates.peewee_validates import (
+    LookupCache,
+    ManyModelChoiceField,
+    ModelChoiceField,
+    ModelValidator,
+    QueryLike,
+    ValidationError,
+    Validator,
+)
 
 student_tim = Student(name='tim')
 
@@ -311,3 +325,824 @@ def test_invalid_mapping_type():
     m = MappingModel(mapping=True)
     validator = ModelValidator(m)
     assert not validator.validate()
+
+
+def test_model_options_cached():
+    first = ModelValidator(Person())
+    second = ModelValidator(Person(name='bob'))
+    assert first._meta is second._meta  # type: ignore
+    assert ModelValidator(Student())._meta is not first._meta  # type: ignore
+
+
+def test_model_options_compiled_meanwhile(monkeypatch: pytest.MonkeyPatch):
+    class TestValidator(ModelValidator[ModelType]):
+        pass
+
+    options = TestValidator(Person())._meta  # type: ignore
+    cache: Dict[type, Any] = TestValidator.__dict__['_model_options']
+    lock = threading.Lock()
+    waiting = threading.Event()
+
+    class WaitingLock:
+        def __enter__(self):
+            waiting.set()
+            lock.acquire()
+
+        def __exit__(self, *exc_info: object):
+            lock.release()
+
+    monkeypatch.setattr(peewee_validates, 'model_options_lock', WaitingLock())
+    validators: List[Any] = []
+    thread = threading.Thread(target=lambda: validators.append(TestValidator(Person())))
+
+    # The options are compiled by another validator while this one waits for the lock.
+    del cache[Person]
+    with lock:
+        thread.start()
+        waiting.wait()
+        cache[Person] = options
+    thread.join()
+
+    assert validators[0]._meta is options
+
+
+def test_unique_reads_pk_when_validating():
+    person = Person(name='zed')
+    validator = ModelValidator(person)
+    person.save()
+
+    assert validator.validate()
+    assert not ModelValidator(Person(name='zed')).validate()
+
+
+def test_validate_many():
+    Person.create(name='dup')
+    validator = ModelValidator(Person())
+
+    results = list(validator.validate_many([{'name': 'ann'}, {'name': 'dup'}, {}, {'name': 'toolong'}]))
+    assert [ok for ok, _, _ in results] == [True, False, False, False]
+    assert results[1][2]['name'] == DEFAULT_MESSAGES['unique']
+    assert results[2][2]['name'] == DEFAULT_MESSAGES['required']
+    assert results[3][2]['name'] == DEFAULT_MESSAGES['length_high'].format(high=5)
+
+
+def test_validate_many_ctx():
+    obj = BasicFields.create(field1='many', field2='ctx', field3='x')
+    validator = ModelValidator(BasicFields())
+
+    results = list(validator.validate_many([{'field1': 'many', 'field2': 'ctx', 'field3': 'x'}]))
+    assert results[0][2]['field1'] == DEFAULT_MESSAGES['index']
+
+    results = list(validator.validate_many([{'field1': 'many', 'field2': 'ctx', 'field3': 'x'}], ctx=obj))
+    assert results[0][0]
+
+
+@pytest.fixture
+def queries(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    executed: List[str] = []
+    execute_sql = database.execute_sql
+
+    def counting_execute_sql(sql: str, *args: object, **kwargs: object):
+        executed.append(sql)
+        return execute_sql(sql, *args, **kwargs)
+
+    monkeypatch.setattr(database, 'execute_sql', counting_execute_sql)
+    return executed
+
+
+def test_validate_many_batches_unique(queries: List[str]):
+    Person.create(name='bat1')
+    queries.clear()
+
+    rows = [{'name': 'bat1'}, {'name': 'bat2'}, {'name': 'bat3'}, {'name': 'bat1'}]
+    results = list(ModelValidator(Person()).validate_many(rows, chunk_size=3))
+
+    assert [ok for ok, _, _ in results] == [False, True, True, False]
+    assert results[0][2]['name'] == DEFAULT_MESSAGES['unique']
+    assert results[3][2]['name'] == DEFAULT_MESSAGES['unique']
+    assert len(queries) == 2
+
+
+def test_validate_many_batches_unique_excludes_pk():
+    person = Person.create(name='bat4')
+
+    results = list(ModelValidator(Person()).validate_many([{'name': 'bat4'}], ctx=person))
+    assert results[0][0]
+
+
+class CaseInsensitiveTag(peewee.Model):
+    name = peewee.CharField(unique=True, collation='NOCASE')
+
+    class Meta:
+        database = database  # noqa: WPS434
+
+
+CaseInsensitiveTag.create_table(safe=True)
+
+
+def test_validate_many_batches_unique_collation():
+    CaseInsensitiveTag.create(name='Tim')
+    validator = ModelValidator(CaseInsensitiveTag())
+
+    assert not validator.validate({'name': 'tim'})
+    results = list(validator.validate_many([{'name': 'tim'}, {'name': 'Tim'}, {'name': 'tom'}]))
+    assert [ok for ok, _, _ in results] == [False, False, True]
+    assert results[0][2]['name'] == DEFAULT_MESSAGES['unique']
+
+    results = list(validator.validate_many([{'name': 'TIM'}, {'name': 'tom'}]))
+    assert [ok for ok, _, _ in results] == [False, True]
+
+
+def test_model_unique_validator():
+    person = Person.create(name='uniq')
+    validator = peewee_validates.ModelUniqueValidator(Person.name, Person.select(), Person.id, person.id)
+
+    # An explicit primary key takes precedence over the one of the instance.
+    assert validator.get_pk(Person(id=person.id + 1)) == person.id
+    field = peewee_validates.StringField[None]()
+    field.value = 'uniq'
+    validator(field, {}, Person(id=person.id + 1))
+
+    assert validator.prefetch([]) == {}
+    assert validator.prefetch(['uniq', 'free']) == {'uniq': [person.id], 'free': []}
+    assert validator.get_prefetched({'uniq': [person.id]}, ['unhashable']) is None
+    assert peewee_validates.collation_key(1) == 1
+
+
+def test_validate_many_batches_related(queries: List[str]):
+    class TestValidator(Validator):
+        organization = ModelChoiceField[ModelType](cast(QueryLike, Organization), Organization.id, required=True)
+
+    org = Organization.create(name='batch')
+    queries.clear()
+
+    rows = [{'organization': org.id}, {'organization': str(org.id)}, {'organization': 999}, {'organization': {'id': org.id}}]
+    results = list(TestValidator().validate_many(rows))
+
+    assert [ok for ok, _, _ in results] == [True, True, False, True]
+    assert results[0][1]['organization'] == org
+    assert results[1][1]['organization'] == org
+    assert results[2][2]['organization'] == DEFAULT_MESSAGES['related'].format(field='id', values=999)  # noqa: WPS432
+    assert len(queries) == 1
+
+
+def test_validate_many_batches_invalid_lookups(queries: List[str]):
+    org = Organization.create(name='invalid')
+    queries.clear()
+
+    rows = [{'organization': {'id': [org.id]}, 'courses': [{'id': [1]}]}, {'organization': org.id}]
+    results = list(RelatedValidator().validate_many(rows))
+
+    # The values that can't be batched are looked up by the validation of their row.
+    assert len(queries) == 2
+    assert ' IN ' in queries[0] and ' = ' in queries[1]
+    assert [ok for ok, _, _ in results] == [False, True]
+    validator = RelatedValidator()
+    assert not validator.validate(rows[0])
+    assert results[0][1] == validator.data
+    assert dict(results[0][2]) == validator.errors
+    assert results[1][1]['organization'] == org
+
+
+def test_m2m_single_query(queries: List[str]):
+    c1 = Course.create(name='single1')
+    c2 = Course.create(name='single2')
+    validator = ModelValidator(student_tim)
+    queries.clear()
+
+    assert validator.validate({'courses': [c2.id, str(c1.id), {'id': c2.id}]}, only=['courses'])
+    assert validator.data['courses'] == [c2, c1, c2]
+    assert len(queries) == 1
+
+
+def test_m2m_reports_missing():
+    c1 = Course.create(name='missing1')
+    validator = ModelValidator(student_tim)
+
+    assert not validator.validate({'courses': [c1.id, 9998, 9999]})
+    assert validator.errors['courses'] == DEFAULT_MESSAGES['related'].format(field='id', values=[9998, 9999])
+
+
+def test_m2m_chunked_query(queries: List[str], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(peewee_validates, 'MAX_IN_VALUES', 2)
+    courses = [Course.create(name=f'chunk{i}') for i in range(3)]
+    validator = ModelValidator(student_tim)
+    queries.clear()
+
+    assert validator.validate({'courses': [c.id for c in courses]}, only=['courses'])
+    assert validator.data['courses'] == courses
+    assert len(queries) == 2
+
+
+class CombinedValidator(ModelValidator[ModelType]):
+    class Meta(ModelValidator.Meta):
+        combine_unique_checks = True
+
+
+def test_combined_unique_checks(queries: List[str]):
+    org = Organization.create(name='combined')
+    ComplexPerson.create(name='comb', gender='M', organization=org)
+    queries.clear()
+
+    validator = CombinedValidator(ComplexPerson())
+    assert validator.validate({'name': 'comb2', 'gender': 'M', 'organization': org.id})
+    # One query for the organization, one for the unique checks
+    assert len(queries) == 2
+
+    assert not validator.validate({'name': 'comb', 'gender': 'M', 'organization': org.id})
+    assert validator.errors == {'name': DEFAULT_MESSAGES['unique']}
+    assert 'name' not in validator.data
+
+    # The unique check of a field with an error is skipped, no query is left to run.
+    queries.clear()
+    assert not CombinedValidator(Person()).validate({'name': 'toolong'})
+    assert not queries
+
+
+def test_combined_index_checks():
+    obj = BasicFields.create(field1='comb', field2='ined', field3='x')
+
+    validator = CombinedValidator(BasicFields())
+    assert not validator.validate({'field1': 'comb', 'field2': 'ined', 'field3': 'x'})
+    assert validator.errors['field1'] == DEFAULT_MESSAGES['index']
+    assert validator.errors['field2'] == DEFAULT_MESSAGES['index']
+
+    assert CombinedValidator(obj).validate()
+
+
+class ConcurrencyRunner:
+    """Runs the queries inline, after letting the other pending queries start."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+
+    async def __call__(self, fn: Callable[[], Any]) -> Any:
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        return fn()
+
+
+def test_avalidate_concurrent_lookups():
+    org = Organization.create(name='async')
+    ComplexPerson.create(name='asyn1', gender='M', organization=org)
+
+    runner = ConcurrencyRunner()
+    validator = ModelValidator(ComplexPerson())
+    assert asyncio.run(validator.avalidate({'name': 'asyn2', 'gender': 'M', 'organization': org.id}, runner=runner))
+    assert validator.data['organization'] == org
+    # The organization, pay grade and unique name lookups run together, then the two index checks.
+    assert runner.max_running == 3
+
+    assert not asyncio.run(validator.avalidate({'name': 'asyn1', 'gender': 'M', 'organization': 0}, runner=runner))
+    assert validator.errors == {
+        'name': DEFAULT_MESSAGES['unique'],
+        'organization': DEFAULT_MESSAGES['related'].format(field='id', values=0),
+    }
+
+
+def test_avalidate_index():
+    BasicFields.create(field1='asy', field2='nc', field3='x')
+
+    validator = ModelValidator(BasicFields())
+    assert not asyncio.run(validator.avalidate({'field1': 'asy', 'field2': 'nc', 'field3': 'x'}, runner=ConcurrencyRunner()))
+    assert validator.errors['field1'] == DEFAULT_MESSAGES['index']
+
+
+def test_avalidate_m2m(queries: List[str]):
+    courses = [Course.create(name=f'async{i}') for i in range(2)]
+    queries.clear()
+
+    validator = ModelValidator(student_tim)
+    assert asyncio.run(validator.avalidate({'courses': [c.id for c in courses]}, only=['courses'], runner=ConcurrencyRunner()))
+    assert validator.data['courses'] == courses
+    assert len(queries) == 1
+
+
+def test_avalidate_thread():
+    class PlainValidator(Validator):
+        name = peewee_validates.StringField[None](required=True)
+
+    validator = PlainValidator()
+    assert not asyncio.run(validator.avalidate({}))
+    assert validator.errors == {'name': DEFAULT_MESSAGES['required']}
+
+
+class CountingDatabase(peewee.SqliteDatabase):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.opened = 0
+        self.closed = 0
+
+    def _connect(self) -> Any:
+        self.opened += 1
+        return super()._connect()
+
+    def _close(self, conn: Any):
+        self.closed += 1
+        super()._close(conn)
+
+
+threaded_database = CountingDatabase(None)
+
+
+class ThreadedTag(peewee.Model):
+    name = peewee.CharField(unique=True)
+
+    class Meta:
+        database = threaded_database  # noqa: WPS434
+
+
+def test_avalidate_default_runner(tmp_path: Path):
+    threaded_database.init(str(tmp_path / 'threaded.db'))
+    with threaded_database.connection_context():
+        threaded_database.create_tables([ThreadedTag])
+        ThreadedTag.create(name='taken')
+
+    assert not asyncio.run(ModelValidator(ThreadedTag()).avalidate({'name': 'taken'}))
+    assert asyncio.run(ModelValidator(ThreadedTag()).avalidate({'name': 'free'}))
+    # Each lookup ran in an executor thread with its own connection, closed afterwards.
+    assert threaded_database.opened > 1
+    assert threaded_database.opened == threaded_database.closed
+
+
+class RelatedValidator(Validator):
+    organization = ModelChoiceField[None](Organization, Organization.id)
+    courses = ManyModelChoiceField[None](Course, Course.id)
+
+
+def test_lookup_cache(queries: List[str]):
+    org = Organization.create(name='cached')
+    courses = [Course.create(name=f'cache{i}') for i in range(2)]
+    queries.clear()
+
+    with LookupCache() as cache:
+        for _ in range(3):
+            validator = RelatedValidator()
+            assert validator.validate({'organization': org.id, 'courses': [c.id for c in courses]})
+            assert validator.data == {'organization': org, 'courses': courses}
+
+        assert len(queries) == 2
+        assert (cache.hits, cache.misses) == (6, 3)
+
+        # Missing objects aren't cached
+        assert not RelatedValidator().validate({'organization': 0})
+        assert not RelatedValidator().validate({'organization': 0})
+        assert len(queries) == 4
+
+    assert RelatedValidator().validate({'organization': org.id})
+    assert len(queries) == 5
+
+
+def test_lookup_cache_threads():
+    cache = LookupCache()
+    entered = threading.Barrier(2)
+    exited = threading.Event()
+    errors: List[BaseException] = []
+
+    def run(first: bool):
+        try:
+            with cache:
+                entered.wait()
+                if not first:
+                    exited.wait()
+                assert peewee_validates.lookup_cache.get() is cache
+            assert peewee_validates.lookup_cache.get() is None
+        except BaseException as exc:  # noqa: WPS424
+            errors.append(exc)
+        finally:
+            exited.set()
+
+    threads = [threading.Thread(target=run, args=(first,)) for first in (True, False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+
+def test_lookup_cache_eviction(queries: List[str]):
+    orgs = [Organization.create(name=f'evict{i}') for i in range(3)]
+    now = [0.0]
+    cache = LookupCache(max_size=2, ttl=10, clock=lambda: now[0])
+
+    def validate_org(org: Organization):
+        assert RelatedValidator().validate({'organization': org.id})
+
+    with cache:
+        for org in orgs:
+            validate_org(org)
+        assert len(cache) == 2
+
+        queries.clear()
+        validate_org(orgs[2])
+        validate_org(orgs[0])
+        assert len(queries) == 1
+
+        now[0] = 11
+        validate_org(orgs[2])
+        assert len(queries) == 2
+
+        cache.invalidate(Organization, orgs[2].id)
+        validate_org(orgs[2])
+        assert len(queries) == 3
+
+        cache.invalidate(Course)
+        assert len(cache) == 2
+        cache.invalidate()
+        assert not len(cache)
+
+
+all_organizations = Organization.select()
+
+
+class AnyOrganizationValidator(Validator):
+    organization = ModelChoiceField[None](all_organizations, Organization.id)
+
+
+class ActiveOrganizationValidator(Validator):
+    organization = ModelChoiceField[None](all_organizations.where(Organization.name != 'inactive'), Organization.id)
+
+
+def test_lookup_cache_querysets():
+    inactive = Organization.create(name='inactive')
+
+    with LookupCache() as cache:
+        assert AnyOrganizationValidator().validate({'organization': inactive.id})
+        assert not ActiveOrganizationValidator().validate({'organization': inactive.id})
+        assert AnyOrganizationValidator().validate({'organization': inactive.id})
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_lookup_cache_query_keys():
+    cache = LookupCache(max_size=1)
+    restricted = Organization.select().where(Organization.name == 'key')
+
+    assert cache.get_query_key(Organization) == cache.get_query_key(Organization.select())
+    assert cache.get_query_key(restricted) != cache.get_query_key(Organization)
+    assert len(cache.query_keys) == 1
+
+    unhashable = Organization.select().where(peewee.SQL('name = ?', [['key']]))
+    assert cache.get_query_key(unhashable)[2] == repr([['key']])
+
+
+class FailFastValidator(ModelValidator[ModelType]):
+    class Meta(ModelValidator.Meta):
+        fail_fast = True
+
+
+def test_fail_fast_skips_queries(queries: List[str]):
+    org = Organization.create(name='fast')
+    queries.clear()
+
+    validator = FailFastValidator(ComplexPerson())
+    assert not validator.validate({'name': 'toolongname', 'gender': 'M', 'organization': org.id})
+    assert validator.errors == {'name': DEFAULT_MESSAGES['length_high'].format(high=5)}
+    assert not queries
+
+    assert validator.validate({'name': 'fast', 'gender': 'M', 'organization': org.id})
+    assert queries
+
+
+def test_fail_fast_combined(queries: List[str]):
+    class FailFastCombinedValidator(ModelValidator[ModelType]):
+        class Meta(ModelValidator.Meta):
+            fail_fast = True
+            combine_unique_checks = True
+
+    org = Organization.create(name='fast combined')
+    queries.clear()
+
+    validator = FailFastCombinedValidator(ComplexPerson())
+    assert not validator.validate({'name': 'toolongname', 'gender': 'M', 'organization': org.id})
+    assert list(validator.errors) == ['name']
+    assert not queries
+
+
+class CountingValidator(ModelValidator[ModelType]):
+    class Meta(ModelValidator.Meta):
+        count_queries = True
+
+
+class BudgetValidator(ModelValidator[ModelType]):
+    class Meta(ModelValidator.Meta):
+        max_queries = 1
+
+
+def test_count_queries(queries: List[str]):
+    org = Organization.create(name='count')
+    queries.clear()
+
+    validator = CountingValidator(ComplexPerson(name='cnt', gender='M', organization=org))
+    assert validator.validate()
+    assert [sql for sql, _ in validator.queries] == queries
+    assert all(sql.startswith('SELECT') for sql in queries)
+
+    validator.save()
+    assert [sql for sql, _ in validator.queries] == queries[-1:]
+    assert queries[-1].startswith('INSERT')
+
+
+def test_query_log_nested():
+    org = Organization.create(name='nested')
+
+    with peewee_validates.QueryLog() as log:
+        validator = CountingValidator(ComplexPerson())
+        assert validator.validate({'name': 'nest', 'gender': 'M', 'organization': org.id})
+
+    assert log.queries == validator.queries
+    assert len(log)
+
+
+def test_query_log_threads():
+    log = peewee_validates.QueryLog()
+    entered = threading.Barrier(2)
+    exited = threading.Event()
+    errors: List[BaseException] = []
+
+    def run(first: bool):
+        try:
+            with log:
+                entered.wait()
+                if not first:
+                    exited.wait()
+                peewee.logger.debug(('SELECT 1', None))
+            assert peewee_validates.query_log.get() == ()
+        except BaseException as exc:  # noqa: WPS424
+            errors.append(exc)
+        finally:
+            exited.set()
+
+    threads = [threading.Thread(target=run, args=(first,)) for first in (True, False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert log.queries == [('SELECT 1', None)] * 2
+
+    # A log entered again inside itself records each statement once.
+    with log:
+        with log:
+            peewee.logger.debug(('SELECT 2', None))
+    assert len(log) == 3
+
+
+class LoggingDatabase(peewee.SqliteDatabase):
+    # Runs the statements itself, `peewee.Database.execute_sql` is never called.
+    def execute_sql(self, sql: str, params: Any = None, commit: Any = None) -> Any:
+        peewee.logger.debug((sql, params))
+        cursor = self.cursor()
+        cursor.execute(sql, params or ())
+        return cursor
+
+
+def test_query_log_database_subclass():
+    logging_database = LoggingDatabase(':memory:')
+
+    with peewee_validates.QueryLog() as log:
+        logging_database.execute_sql('SELECT 1')
+
+    assert log.queries == [('SELECT 1', None)]
+
+
+def test_query_log_logger(caplog: pytest.LogCaptureFixture):
+    peewee_logger = logging.getLogger('peewee')
+    level = peewee_logger.level
+
+    with peewee_validates.QueryLog() as log:
+        with peewee_validates.QueryLog():
+            Organization.select().count()
+        Organization.select().count()
+        peewee_logger.debug('not a statement')
+
+    assert len(log) == 2
+    # The statements were recorded without reaching the handlers.
+    assert not [record for record in caplog.records if record.name == 'peewee']
+    assert peewee_logger.level == level
+    assert not peewee_logger.filters
+
+    with caplog.at_level(logging.DEBUG, logger='peewee'):
+        with peewee_validates.QueryLog() as log:
+            Organization.select().count()
+
+    assert len([record for record in caplog.records if record.name == 'peewee']) == len(log) == 1
+
+
+def test_query_budget():
+    org = Organization.create(name='budget')
+
+    validator = BudgetValidator(ComplexPerson())
+    with pytest.raises(peewee_validates.QueryBudgetExceeded) as exc_info:
+        validator.validate({'name': 'bdg', 'gender': 'M', 'organization': org.id})
+
+    assert exc_info.value.max_queries == 1
+    assert exc_info.value.queries == validator.queries
+    assert len(validator.queries) > 1
+
+
+def test_query_budget_log(caplog: pytest.LogCaptureFixture):
+    class LoggingBudgetValidator(ModelValidator[ModelType]):
+        class Meta(ModelValidator.Meta):
+            max_queries = 1
+            query_budget_action = 'log'
+
+    org = Organization.create(name='budget log')
+
+    validator = LoggingBudgetValidator(ComplexPerson())
+    assert validator.validate({'name': 'bdgl', 'gender': 'M', 'organization': org.id})
+    assert 'LoggingBudgetValidator ran' in caplog.text
+
+
+def test_save_many():
+    c1 = Course.create(name='bulk1')
+    c2 = Course.create(name='bulk2')
+    existing = Student.create(name='old')
+    existing.courses.add([c1])
+
+    validators = [ModelValidator(Student()) for _ in range(3)] + [ModelValidator(existing)]
+    assert validators[0].validate({'name': 'new0', 'courses': [c1, c2]})
+    assert validators[1].validate({'name': 'new1', 'courses': [c2.id]})
+    assert validators[2].validate({'name': 'new2'})
+    assert validators[3].validate({'name': 'renamed', 'courses': [c2]})
+
+    with peewee_validates.QueryLog() as log:
+        assert peewee_validates.save_many(validators, batch_size=2) == 4
+
+    # Two batches of students, an update, then a delete of the through rows and two batches of them.
+    statements = [sql.split()[0] for sql, _ in log.queries]
+    assert statements.count('INSERT') == 4
+    assert statements.count('UPDATE') == 1
+    assert statements.count('DELETE') == 1
+
+    students = [validator.ctx for validator in validators]
+    assert all(student.id for student in students)
+    assert [Student.get_by_id(student.id).name for student in students] == ['new0', 'new1', 'new2', 'renamed']
+    assert {c.name for c in students[0].courses} == {'bulk1', 'bulk2'}
+    assert [c.name for c in students[1].courses] == ['bulk2']
+    assert not list(students[2].courses)
+    assert [c.name for c in existing.courses] == ['bulk2']
+
+
+def test_save_many_rollback():
+    validators = [ModelValidator(Person()), ModelValidator(Person())]
+    assert validators[0].validate({'name': 'twin'})
+    assert validators[1].validate({'name': 'twin'})
+
+    with pytest.raises(peewee.IntegrityError):
+        peewee_validates.save_many(validators)
+
+    assert not Person.select().where(Person.name == 'twin').exists()
+
+
+def test_save_many_without_returning(monkeypatch: pytest.MonkeyPatch, queries: List[str]):
+    monkeypatch.setattr(peewee_validates, 'sqlite_version_info', (3, 34, 0))
+    assert not peewee_validates.supports_returning(database)
+
+    validators = [ModelValidator(Person()) for _ in range(3)]
+    for i, validator in enumerate(validators):
+        assert validator.validate({'name': f'nr{i}'})
+
+    queries.clear()
+    assert peewee_validates.save_many(validators) == 3
+    # One insert per instance, to read their primary key back.
+    assert len([sql for sql in queries if sql.startswith('INSERT')]) == 3
+    assert all(validator.ctx.id for validator in validators)
+
+    # Only updates are left, nothing is inserted.
+    for validator in validators:
+        assert validator.validate({'name': validator.ctx.name.upper()})
+    assert peewee_validates.save_many(validators) == 3
+    assert [Person.get_by_id(validator.ctx.id).name for validator in validators] == ['NR0', 'NR1', 'NR2']
+
+
+def test_supports_returning(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(database, 'returning_clause', True)
+    assert peewee_validates.supports_returning(database)
+
+
+class Enrollment(peewee.Model):
+    student = peewee.CharField()
+    course = peewee.CharField()
+    grade = peewee.IntegerField(default=0)
+
+    class Meta:
+        database = database  # noqa: WPS434
+        primary_key = peewee.CompositeKey('student', 'course')
+
+
+Enrollment.create_table(safe=True)
+
+
+def test_save_many_composite_key():
+    validators = [ModelValidator(Enrollment()) for _ in range(2)]
+    assert validators[0].validate({'student': 'tim', 'course': 'math', 'grade': 1})
+    assert validators[1].validate({'student': 'tim', 'course': 'art', 'grade': 2})
+
+    # The instances are saved one by one, a composite key is never generated by the database.
+    assert peewee_validates.save_many(validators, force_insert=True) == 2
+    assert validators[0].validate({'student': 'tim', 'course': 'math', 'grade': 3})
+    assert peewee_validates.save_many(validators[:1]) == 1
+    assert {(e.course, e.grade) for e in Enrollment.select()} == {('math', 3), ('art', 2)}
+
+
+def test_save_many_many_to_many_query():
+    course = Course.create(name='query')
+    validator = ModelValidator(Student())
+    assert validator.validate({'name': 'query'})
+    validator.data['courses'] = Course.select().where(Course.name == 'query')
+
+    assert peewee_validates.save_many([validator]) == 1
+    assert list(validator.ctx.courses) == [course]
+
+
+class IncrementalValidator(ModelValidator[ModelType]):
+    confirm = peewee_validates.StringField[ModelType](validators=[peewee_validates.validate_matches('name')])
+
+    class Meta(ModelValidator.Meta):
+        incremental = True
+
+
+def test_incremental(queries: List[str]):
+    org = Organization.create(name='incremental')
+    validator = IncrementalValidator(ComplexPerson())
+    data = {'name': 'inc', 'confirm': 'inc', 'gender': 'M', 'organization': org.id}
+
+    queries.clear()
+    assert validator.validate(data)
+    # The related organization, the unique name and the two unique indexes.
+    assert len(queries) == 4
+
+    queries.clear()
+    assert validator.validate(dict(data))
+    assert not queries
+
+    # Only the index on the gender and the name is checked again.
+    queries.clear()
+    assert validator.validate({**data, 'gender': 'F'})
+    assert len(queries) == 1
+    assert validator.data['gender'] == 'F'
+
+    queries.clear()
+    assert not validator.validate({**data, 'gender': 'X'})
+    assert not validator.validate({**data, 'gender': 'X'})
+    assert not queries
+    assert set(validator.errors) == {'gender'}
+
+    # The confirmation depends on the name.
+    assert not validator.validate({**data, 'name': 'inc2'})
+    assert set(validator.errors) == {'confirm'}
+
+
+def test_incremental_index_errors():
+    org = Organization.create(name='incremental idx')
+    ComplexPerson.create(name='idx', gender='M', organization=org)
+
+    validator = IncrementalValidator(ComplexPerson(name='idx2', gender='M', organization=org))
+    assert validator.validate()
+
+    # The unique field and the indexes report the collisions again when the values are reused.
+    for _ in range(2):
+        assert not validator.validate({'name': 'idx', 'confirm': 'idx'})
+        assert validator.errors['name'] == DEFAULT_MESSAGES['unique']
+
+    assert validator.validate({'name': 'idx3', 'confirm': 'idx3'})
+    assert validator.data['name'] == 'idx3'
+
+
+class Unequal:
+    def __init__(self, text: str):
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __eq__(self, other: object) -> bool:
+        raise TypeError('not comparable')
+
+
+def test_incremental_index_collision(queries: List[str]):
+    class IncrementalIndexValidator(ModelValidator[ModelType]):
+        class Meta(ModelValidator.Meta):
+            incremental = True
+
+    BasicFields.create(field1='incr', field2='idx', field3='x')
+    validator = IncrementalIndexValidator(BasicFields())
+
+    # The collision of the unique index is reused, with the mutable inputs copied.
+    queries.clear()
+    for _ in range(2):
+        assert not validator.validate({'field1': 'incr', 'field2': 'idx', 'field3': ['x']})
+        assert validator.errors['field1'] == DEFAULT_MESSAGES['index']
+    assert len(queries) == 1
+
+    # The inputs that can't be compared are validated again.
+    assert validator.validate({'field1': Unequal('incr2'), 'field2': 'idx', 'field3': 'x'})
+    assert validator.validate({'field1': Unequal('incr3'), 'field2': 'idx', 'field3': 'x'})
+    assert validator.data['field1'] == 'incr3'
@@ -0,0 +1,122 @@
+from pathlib import Path
+from test.models import ComplexPerson, Organization, Person, database
+from typing import Dict, List
+
+import peewee
+import pytest
+from playhouse.pool import PooledSqliteDatabase
+
+from outcome.peewee_validates import parallel
+from outcome.peewee_validates.peewee_validates import (
+    DecimalField,
+    IntegerField,
+    ModelChoiceField,
+    ModelValidator,
+    StringField,
+    ValidationError,
+    Validator,
+    validate_email,
+)
+
+
+class ImportValidator(Validator):
+    name = StringField[None](required=True, max_length=5)
+    email = StringField[None](validators=[validate_email()])
+    count = IntegerField[None](low=0)
+    price = DecimalField[None]()
+    organization = ModelChoiceField[None](Organization.select(), Organization.name)
+
+    def clean_name(self, value: str) -> str:
+        return value.upper()
+
+    def clean(self, data: Dict[str, object]) -> Dict[str, object]:
+        if data.get('count') == 13:
+            raise ValidationError('function', function='clean')
+        return data
+
+
+def make_rows(count: int) -> List[Dict[str, object]]:
+    return [
+        {
+            'name': f'n{i}' if i % 7 else 'toolong',
+            'email': 'a@b.co' if i % 5 else 'nope',
+            'count': i if i % 11 else -1,
+            'price': f'{i}.5' if i % 9 else 'x',
+            'organization': 'par-org' if i % 3 else 'missing',
+        }
+        for i in range(count)
+    ]
+
+
+class LocalValidator(Validator):
+    name = StringField[None](required=True, max_length=5)
+    count = IntegerField[None](low=0)
+
+
+def test_validator_spec():
+    validator = parallel.build_validator(parallel.get_validator_spec(ImportValidator()))
+    assert isinstance(validator, ImportValidator)
+
+    person = Person(name='spec')
+    model_validator = parallel.build_validator(parallel.get_validator_spec(ModelValidator(person)))
+    assert isinstance(model_validator, ModelValidator)
+    assert model_validator.ctx is person
+    assert model_validator.validate()
+
+
+def test_get_databases():
+    assert ImportValidator().get_databases() == [database]
+    assert LocalValidator().get_databases() == []
+    assert ModelValidator(ComplexPerson()).get_databases() == [database]
+    assert ModelValidator(Organization()).get_databases() == [database]
+
+
+def test_drop_inherited_connections(tmp_path: Path):
+    plain = peewee.SqliteDatabase(str(tmp_path / 'plain.db'))
+    pooled = PooledSqliteDatabase(str(tmp_path / 'pooled.db'))
+
+    pooled.connect()
+    pooled_connection = pooled.connection()
+    pooled.close()
+    pooled.connect()
+    plain_connection = plain.connection()
+
+    parallel.drop_inherited_connections([plain, pooled])
+
+    assert plain.is_closed()
+    assert pooled.is_closed()
+    assert plain.connection() is not plain_connection
+    assert pooled.connection() is not pooled_connection
+
+
+def test_worker(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(parallel, '_worker', None)
+    parallel.initialize_worker(parallel.get_validator_spec(LocalValidator()), None, ['name'])
+
+    results = parallel.check_chunk([{'name': 'ok', 'count': -1}, {'name': 'toolong'}])
+    assert results[0] == ({'name': 'ok'}, {})
+    assert list(results[1][1]) == ['name']
+
+
+def test_validate_parallel():
+    Organization.create(name='par-org')
+    rows = make_rows(200)
+
+    expected = list(ImportValidator().validate_many(rows, chunk_size=16))
+    results = list(ImportValidator().validate_parallel(rows, workers=2, chunk_size=16))
+
+    assert results == expected
+    assert any(ok for ok, _, _ in results)
+    assert any('organization' in errors for _, _, errors in results)
+    assert any(errors.get('__base__') for _, _, errors in results)
+
+
+def test_validate_parallel_model():
+    Person.create(name='ptaken')
+    rows: List[Dict[str, object]] = [{'name': name} for name in ('pfree', 'ptaken', 'toolongname', None)]
+
+    expected = list(ModelValidator(Person()).validate_many(rows))
+    results = list(ModelValidator(Person()).validate_parallel(rows, workers=2, chunk_size=2))
+
+    assert results == expected
+    assert [ok for ok, _, _ in results] == [True, False, False, False]
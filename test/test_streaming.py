@@ -0,0 +1,88 @@
+import io
+from test.models import Organization, database
+from typing import Iterator, List
+
+import pytest
+
+from outcome.peewee_validates.peewee_validates import IntegerField, ModelChoiceField, QueryLog, StringField, Validator
+from outcome.peewee_validates.streaming import read_csv, validate_csv, validate_jsonl, validate_records
+
+
+class FeedValidator(Validator):
+    name = StringField[None](required=True, max_length=5)
+    count = IntegerField[None](default=1)
+
+
+def test_csv():
+    file = io.StringIO('name,count\nbob,2\n"multi\nline",3\n,4\namy,\n')
+    results = list(validate_csv(FeedValidator(), file))
+    assert results == [
+        (2, True, {'name': 'bob', 'count': 2}),
+        (3, False, {'name': 'Must be at most 5 characters.'}),
+        (5, False, {'name': 'This field is required.'}),
+        (6, True, {'name': 'amy', 'count': 1}),
+    ]
+
+
+def test_csv_keep_empty():
+    records = list(read_csv(io.StringIO('name,count\nbob,\n'), empty_as_missing=False))
+    assert records == [(2, {'name': 'bob', 'count': ''})]
+
+
+def test_jsonl():
+    file = io.BytesIO(b'{"name": "bob"}\n\n{"name": \n[1, 2]\n{"name": "toolong", "count": "x"}\n')
+    results = list(validate_jsonl(FeedValidator(), file, chunk_size=2))
+    assert results[0] == (1, True, {'name': 'bob', 'count': 1})
+    assert results[1][:2] == (3, False)
+    assert results[1][2]['__base__'].startswith('Unable to read the row: ')
+    assert results[2] == (4, False, {'__base__': 'Unable to read the row: not an object.'})
+    assert results[3] == (5, False, {'count': 'Must be a valid integer.', 'name': 'Must be at most 5 characters.'})
+
+
+def test_lazy():
+    read: List[int] = []
+
+    def lines() -> Iterator[str]:
+        for number in range(10000):
+            read.append(number)
+            yield f'{{"name": "n{number % 100}"}}\n'
+
+    results = validate_jsonl(FeedValidator(), lines(), chunk_size=10)
+    assert next(results) == (1, True, {'name': 'n0', 'count': 1})
+    assert len(read) == 10
+
+
+def test_batched_lookups(monkeypatch: pytest.MonkeyPatch):
+    class OrganizationValidator(Validator):
+        organization = ModelChoiceField[None](Organization.select(), Organization.name, required=True)
+
+    Organization.create(name='stream-org')
+    executed: List[str] = []
+    execute_sql = database.execute_sql
+
+    def counting_execute_sql(sql: str, *args: object, **kwargs: object):
+        executed.append(sql)
+        return execute_sql(sql, *args, **kwargs)
+
+    monkeypatch.setattr(database, 'execute_sql', counting_execute_sql)
+
+    records = [(number, {'organization': 'stream-org' if number % 2 else 'nope'}) for number in range(1, 11)]
+    results = list(validate_records(OrganizationValidator(), records, chunk_size=5))
+
+    assert [ok for _, ok, _ in results] == [True, False] * 5
+    assert len(executed) == 2
+
+
+def test_query_log():
+    class OrganizationValidator(Validator):
+        organization = ModelChoiceField[None](Organization.select(), Organization.name, required=True)
+
+    Organization.create(name='logged-org')
+
+    records = [(number, {'organization': 'logged-org'}) for number in range(1, 11)]
+    with QueryLog() as log:
+        results = list(validate_records(OrganizationValidator(), records, chunk_size=5))
+
+    assert all(ok for _, ok, _ in results)
+    assert len(log) == 2
+    assert all(sql.startswith('SELECT') for sql, _ in log.queries)
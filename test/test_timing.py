@@ -0,0 +1,221 @@
+import asyncio
+import threading
+from test.models import BasicFields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+from outcome.peewee_validates.peewee_validates import (
+    IntegerField,
+    ModelValidator,
+    StringField,
+    ValidationError,
+    ValidationObserver,
+    Validator,
+    validate_function,
+    validation_observer,
+)
+from outcome.peewee_validates.timing import TimingObserver, percentile
+
+
+def is_even(value: object) -> bool:
+    return int(str(value)) % 2 == 0
+
+
+class TimedValidator(Validator):
+    class Meta:
+        compile_fields = True
+
+    name = StringField[None](required=True, max_length=5)
+    count = IntegerField[None](validators=[validate_function(is_even)])
+
+    def clean_name(self, value: str) -> str:
+        return value.upper()
+
+    def clean(self, data: Dict[str, object]) -> Dict[str, object]:
+        if data['name'] == 'BAD':
+            raise ValidationError('function', function='clean')
+        return data
+
+
+class RecordingObserver(ValidationObserver):
+    def __init__(self):
+        super().__init__()
+        self.steps: List[Tuple[str, str, Optional[str]]] = []
+
+    def record(self, name: str, step: str, duration: float, error: Optional[str]):
+        assert duration >= 0
+        self.steps.append((name, step, error))
+
+
+def test_observer_steps():
+    validator = TimedValidator()
+
+    with RecordingObserver() as observer:
+        assert validator.validate({'name': 'tim', 'count': '2'})
+
+    assert observer.steps == [
+        ('count', 'coerce', None),
+        ('count', 'function_validator(is_even)', None),
+        ('name', 'coerce', None),
+        ('name', 'required_validator', None),
+        ('name', 'length_validator', None),
+        ('name', 'clean_name', None),
+        ('__base__', 'clean', None),
+    ]
+    assert validation_observer.get() is None
+
+
+def test_observer_threads():
+    observer = RecordingObserver()
+    entered = threading.Barrier(2)
+    exited = threading.Event()
+    errors: List[BaseException] = []
+
+    def run(first: bool):
+        try:
+            with observer:
+                entered.wait()
+                if not first:
+                    exited.wait()
+                assert TimedValidator().validate({'name': 'tim', 'count': '2'})
+            assert validation_observer.get() is None
+        except BaseException as exc:  # noqa: WPS424
+            errors.append(exc)
+        finally:
+            exited.set()
+
+    threads = [threading.Thread(target=run, args=(first,)) for first in (True, False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert observer.steps.count(('__base__', 'clean', None)) == 2
+
+
+def test_observer_errors():
+    validator = TimedValidator()
+
+    with RecordingObserver() as observer:
+        assert not validator.validate({'name': 'toolong', 'count': 'x'})
+        assert ('count', 'coerce', 'coerce_int') in observer.steps
+        assert ('name', 'length_validator', 'length_high') in observer.steps
+
+        observer.steps.clear()
+        assert not validator.validate({'name': 'bad', 'count': 3})
+        assert ('count', 'function_validator(is_even)', 'function') in observer.steps
+        assert validator.errors['count'] == 'Failed validation for is_even.'
+
+    # The errors are the same as without an observer.
+    assert not validator.validate({'name': 'toolong', 'count': 'x'})
+    observed = dict(validator.errors)
+    with RecordingObserver():
+        validator.validate({'name': 'toolong', 'count': 'x'})
+    assert validator.errors == observed
+
+
+def test_observer_index_validation():
+    BasicFields.create(field1='tim1', field2='two', field3='three')
+
+    with RecordingObserver() as observer:
+        assert not ModelValidator(BasicFields(field1='tim1', field2='two', field3='three')).validate()
+
+    assert observer.steps[-1] == ('__base__', 'index_validation', 'index')
+
+
+async def run_inline(fn: Callable[[], Any]) -> Any:
+    return fn()
+
+
+def test_observer_async_index_validation():
+    BasicFields.create(field1='tim2', field2='two', field3='three')
+
+    with RecordingObserver() as observer:
+        validator = ModelValidator(BasicFields(field1='tim2', field2='two', field3='three'))
+        assert not asyncio.run(validator.avalidate(runner=run_inline))
+
+    assert observer.steps[-1] == ('__base__', 'index_validation', 'index')
+
+
+class CustomField(StringField[None]):
+    def validate(self, name: str, data: Dict[str, Any], ctx: Any = None) -> Any:
+        return super().validate(name, data, ctx)
+
+
+def explode(field: Any, data: Any, ctx: Any = None):
+    if field.value is not None:
+        raise ValueError('boom')
+
+
+def test_observer_custom_steps():
+    class CustomValidator(Validator):
+        name = CustomField(required=True)
+        count = IntegerField[None]()
+        label = StringField[None](validators=[explode])
+
+    # A field overriding `validate` is reported as a single step, a missing value isn't coerced.
+    with RecordingObserver() as observer:
+        assert CustomValidator().validate({'name': 'tim'})
+    assert observer.steps == [('label', 'explode', None), ('name', 'validate', None), ('__base__', 'clean', None)]
+
+    with RecordingObserver() as observer:
+        with pytest.raises(ValueError):
+            CustomValidator().validate({'name': 'tim', 'label': 'x'})
+    assert observer.steps[-1] == ('label', 'explode', 'ValueError')
+
+
+def test_observer_fail_fast():
+    class FailFastValidator(TimedValidator):
+        class Meta:
+            fail_fast = True
+
+    with RecordingObserver() as observer:
+        assert not FailFastValidator().validate({'name': 'toolong', 'count': 'x'})
+    assert observer.steps == [('count', 'coerce', 'coerce_int')]
+
+
+def test_timing_observer():
+    validator = TimedValidator()
+    observer = TimingObserver(percentiles=(50, 100))
+
+    with observer:
+        for i in range(10):
+            validator.validate({'name': 'tim', 'count': i})
+
+    timings = {(timing.name, timing.step): timing for timing in observer.summary()}
+    even = timings[('count', 'function_validator(is_even)')]
+    assert even.calls == 10
+    assert even.errors == 5
+    assert even.percentiles[0] <= even.percentiles[1] == even.maximum
+    assert timings[('name', 'clean_name')].calls == 5
+    assert timings[('__base__', 'clean')].calls == 5
+
+    table = observer.table().splitlines()
+    assert table[0].split() == ['field', 'step', 'calls', 'errors', 'p50', 'p100', 'max', 'total']
+    assert len(table) == len(timings) + 1
+
+    observer.reset()
+    assert observer.summary() == []
+
+
+def test_timing_observer_samples():
+    observer = TimingObserver(percentiles=(0, 100), max_samples=10, seed=1)
+
+    for i in range(1000):
+        observer.record('count', 'coerce', float(i), 'coerce_int' if i % 4 else None)
+
+    assert len(observer.durations[('count', 'coerce')].samples) == 10
+    [timing] = observer.summary()
+    # The counts are exact, the percentiles come from the sample.
+    assert (timing.calls, timing.errors, timing.total, timing.maximum) == (1000, 750, sum(range(1000)), 999.0)
+    assert timing.percentiles[0] <= timing.percentiles[1] <= timing.maximum
+    assert timing.percentiles[1] > 100
+
+
+def test_percentile():
+    durations = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(durations, 0) == 1.0
+    assert percentile(durations, 50) == 2.0
+    assert percentile(durations, 99) == 4.0
@@ -3,8 +3,10 @@ import datetime
 import pytest
 
 from outcome.peewee_validates.peewee_validates import (  # noqa: WPS235
+    Choices,
     StringField,
     ValidationError,
+    is_valid_email_domain,
     validate_email,
     validate_equal,
     validate_function,
@@ -120,6 +122,78 @@ def test_validate_none_of():
         validator(field, {})
 
 
+def test_validate_one_of_unhashable():
+    validator = validate_one_of([[1], 'a'])
+
+    for value in ([1], 'a'):
+        field.value = value
+        validator(field, {})
+
+    field.value = [2]
+    with pytest.raises(ValidationError) as err:
+        validator(field, {})
+    assert err.value.kwargs['choices'] == '[1], a'
+
+
+def test_validate_one_of_string():
+    # Like with the `in` operator, a string of options matches its substrings.
+    validator = validate_one_of('abc')
+
+    for value in ('a', 'bc'):
+        field.value = value
+        validator(field, {})
+
+    field.value = 'ac'
+    with pytest.raises(ValidationError):
+        validator(field, {})
+
+
+def test_choices_memoized():
+    calls = []
+    now = [0.0]
+
+    def provider():
+        calls.append(now[0])
+        return ('a', 'b')
+
+    choices = Choices(provider, ttl=10, clock=lambda: now[0])
+    validator = validate_one_of(choices)
+
+    field.value = 'a'
+    validator(field, {})
+    validator(field, {})
+    assert len(calls) == 1
+
+    now[0] = 11
+    validator(field, {})
+    assert len(calls) == 2
+
+    choices.refresh()
+    validator(field, {})
+    assert len(calls) == 3
+
+
+def test_choices_static_refresh():
+    choices = Choices(('a', 'b'))
+    options = choices.get()
+    choices.refresh()
+    assert choices.get() is options
+
+
+def test_choices_provider_called_each_time():
+    calls = []
+
+    def provider():
+        calls.append(None)
+        return ('a', 'b')
+
+    validator = validate_none_of(provider)
+    field.value = 'c'
+    validator(field, {})
+    validator(field, {})
+    assert len(calls) == 2
+
+
 def test_validate_numeric_range():
     validator = validate_numeric_range(low=10, high=100)
 
@@ -215,3 +289,18 @@ def test_validate_email():
     for value in (None, 'tim@example.com', 'tim@localhost'):
         field.value = value
         validator(field, {'other': 'yes'})
+
+
+def test_validate_email_domain_cache():
+    validator = validate_email()
+    is_valid_email_domain.cache_clear()
+
+    for value in ('a@cached.example.com', 'b@cached.example.com', 'c@().com', 'd@().com'):
+        field.value = value
+        try:
+            validator(field, {})
+        except ValidationError:
+            assert '()' in value
+
+    info = is_valid_email_domain.cache_info()
+    assert (info.hits, info.misses) == (2, 2)